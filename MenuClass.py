@@ -2,6 +2,8 @@ import pygame
 import main
 import pickle
 from models.TaxAllocator import TaskAllocator
+from models.AssetCache import AssetCache
+from models.TextCache import TextCache
 
 
 class MenuClass:
@@ -68,9 +70,9 @@ class MenuClass:
         pygame.display.set_caption("My Game")
 
         # Set up fonts
-        self.instruction_font = pygame.font.Font(None, 20)
-        self.menu_font = pygame.font.Font(None, 40)
-        self.selected_font = pygame.font.Font(None, 60)
+        self.instruction_font = TextCache.get_font(20)
+        self.menu_font = TextCache.get_font(40)
+        self.selected_font = TextCache.get_font(60)
 
         # Set up colors
         self.black = (0, 0, 0)
@@ -126,7 +128,7 @@ class MenuClass:
         self.options_option_spacing = 75
 
         # Set up map
-        self.map_image = pygame.image.load("./Map/Assets/simCity.jpg")
+        self.map_image = AssetCache.get_image("./Map/Assets/simCity.jpg")
         self.map_rect = self.map_image.get_rect(
             center=(self.screen_width // 2, self.screen_height // 2))
 
@@ -163,7 +165,7 @@ class MenuClass:
         vertical_offset = - (self.screen_width // 3)
         line_spacing = 30
         for i, text in enumerate(self.instruction_text):
-            text_surface = self.instruction_font.render(text, True, self.white)
+            text_surface = TextCache.render(self.instruction_font, text, True, self.white)
             text_rect = text_surface.get_rect(center=(
                 self.screen_width // 2, self.screen_height // 2 + i * line_spacing + vertical_offset))
             self.screen.blit(text_surface, text_rect)
@@ -314,7 +316,7 @@ class MenuClass:
             None
         """
         for i, option in enumerate(self.menu_options):
-            option_text = self.menu_font.render(option[0], True, self.white)
+            option_text = TextCache.render(self.menu_font, option[0], True, self.white)
             option_rect = option_text.get_rect(center=(
                 self.menu_option_start_pos[0],
                 self.menu_option_start_pos[1] + i * self.menu_option_spacing,
@@ -348,7 +350,7 @@ class MenuClass:
         """
         self.show_instructions = False
         for i, option in enumerate(self.options_options):
-            option_text = self.menu_font.render(option[0], True, self.white)
+            option_text = TextCache.render(self.menu_font, option[0], True, self.white)
             option_rect = option_text.get_rect(center=(
                 self.options_option_start_pos[0],
                 self.options_option_start_pos[1] +
@@ -402,18 +404,18 @@ class MenuClass:
         Returns:
             None
         """
-        menu_title_text = self.selected_font.render(
+        menu_title_text = TextCache.render(self.selected_font,
             "Main Menu", True, self.selected_color)
         menu_title_rect = menu_title_text.get_rect(center=self.menu_title_pos)
         self.screen.blit(menu_title_text, menu_title_rect)
         for i, option in enumerate(self.menu_options):
-            option_text = self.menu_font.render(option[0], True, self.white)
+            option_text = TextCache.render(self.menu_font, option[0], True, self.white)
             option_rect = option_text.get_rect(center=(
                 self.menu_option_start_pos[0],
                 self.menu_option_start_pos[1] + i * self.menu_option_spacing,
             ))
             if i == self.current_option:
-                selected_text = self.selected_font.render(
+                selected_text = TextCache.render(self.selected_font,
                     option[0], True, self.selected_color)
                 selected_rect = selected_text.get_rect(center=(
                     self.menu_option_start_pos[0],
@@ -444,13 +446,13 @@ class MenuClass:
             None
         """
             
-        options_title_text = self.selected_font.render(
+        options_title_text = TextCache.render(self.selected_font,
             "Options", True, self.selected_color)
         options_title_rect = options_title_text.get_rect(
             center=self.options_title_pos)
         self.screen.blit(options_title_text, options_title_rect)
         for i, option in enumerate(self.options_options):
-            option_text = self.menu_font.render(
+            option_text = TextCache.render(self.menu_font,
                 option[0], True, self.white)
             option_rect = option_text.get_rect(center=(
                 self.options_option_start_pos[0],
@@ -458,7 +460,7 @@ class MenuClass:
                 i * self.options_option_spacing,
             ))
             if i == self.current_option:
-                selected_text = self.selected_font.render(
+                selected_text = TextCache.render(self.selected_font,
                     option[0], True, self.selected_color)
                 selected_rect = selected_text.get_rect(center=(
                     self.options_option_start_pos[0],
@@ -19,6 +19,9 @@ from models.Timer import Timer
 from models.Utils import *
 from models.Road import Road
 from models.Citizen import Citizen
+from models.DirtyRectRenderer import DirtyRectRenderer
+from models.AssetCache import AssetCache
+from models.SimulationEngine import SimulationEngine
 import random
 
 pygame.init()
@@ -27,7 +30,6 @@ pygame.init()
 SCREEN_WIDTH, SCREEN_HEIGHT = 1024, 768
 SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 SCROLL_SPEED = 5
-MONEY_PER_DAY = 20
 allocated_tax = 0.05
 
 # Map & Panels
@@ -39,6 +41,7 @@ icons_dir = "./Map/Assets/Builder_assets/"
 icons = [get_icon_and_type(f, icons_dir)
          for f in get_files_from_dir(icons_dir)]
 map = Map(SCREEN, builder_panel.get_width(), description_panel.get_height())
+renderer = DirtyRectRenderer(SCREEN)
 global class_tobuild
 game_loop = True
 
@@ -49,6 +52,7 @@ game_speed_multiplier = [100, 200, 300]
 chosen_speed = 1
 timer = Timer(game_speed, game_speed_multiplier[chosen_speed])
 paused = False
+engine = SimulationEngine(map, player, timer, allocated_tax)
 
 
 def run(running, loaded_game, new_game_flag, tax):
@@ -58,7 +62,6 @@ def run(running, loaded_game, new_game_flag, tax):
     game_speed = 1
     
     # Handle saved tiled objects
-    initial_citizens = []
     if loaded_game:
         
         player.reinitialize("HUMAN",100000)
@@ -104,40 +107,23 @@ def run(running, loaded_game, new_game_flag, tax):
             if loaded_obj['type'][-4:] == 'Zone':
                 for building in loaded_obj['properties']['Buildings']:
                     b = create_building(building, map)
-                    obj_layer = map.return_map().get_layer_by_name("ObjectsTop")
-                    obj_layer.append(b)
+                    map.add_building(b)
                     obj.instance.properties['Buildings'].append(b.__dict__)
 
         # Handle citizens restore
         for loaded_citizen in loaded_citizens:
-            c = Citizen()
-            # Handle RZone
-            if loaded_citizen[1] != -1:
-                home_zone = map.get_zone_by_id(loaded_citizen[1])
-                if home_zone:
-                    home_zone.properties['Citizens'].append(c)
-                    c.home = home_zone
-            # Handle WZone
-            if loaded_citizen[2] != -1:
-                work_zone = map.get_zone_by_id(loaded_citizen[2])
-                if work_zone:
-                    work_zone.properties['Citizens'].append(c)
-                    c.work = work_zone
-            c.satisfaction = loaded_citizen[3]
+            restore_citizen(loaded_citizen, map)
             
         timer.game_speed = loaded_timer[0]
         timer.game_speed_multiplier = loaded_timer[1]
         timer.current_time = timer.get_timer_from_str(loaded_timer[2])
         allocated_tax = loaded_tax
+        engine.start([])
     
         
-    cursorImg = pygame.image.load(get_icon_loc_by_name("bulldozer", icons))
+    cursorImg = AssetCache.get_image(get_icon_loc_by_name("bulldozer", icons))
     cursorImgRect = cursorImg.get_rect()
     normal_cursor = True
-    
-    day = timer.get_current_time().day
-    month = timer.get_current_time().month
-    game_start_time = timer.get_current_date_str()
 
     if not loaded_game and new_game_flag:
         
@@ -145,13 +131,9 @@ def run(running, loaded_game, new_game_flag, tax):
         timer.reinitialize(game_speed, game_speed_multiplier[chosen_speed])
         map.reinitialize(SCREEN, builder_panel.get_width(), description_panel.get_height())
         Citizen.reinitialize()
-   
-        initial_citizens = []
-        for i in range(1, 11):
-            c = Citizen()
-            initial_citizens.append(c)
-        randomize_initial_forests(map, player, timer)
-        
+        engine.new_game()
+
+    engine.allocated_tax = allocated_tax
     loaded_game = False
     new_game_flag = True
     game_loop = True
@@ -166,91 +148,55 @@ def run(running, loaded_game, new_game_flag, tax):
     
     held_price = 0
     class_tobuild = "Nothing"
-    randomizer_for_disaster = False
     
+    # The screen was covered by the menu (or nothing was drawn yet), so everything is redrawn once
+    renderer.mark_all_dirty()
+    drawn_cursor = None
+
     while game_loop:
 
         cursorImgRect.center = pygame.mouse.get_pos()
-        map.display()
 
-        description_panel.display(SCREEN, 24, (10, 10), (128, 128, 128),
-                                  f"Funds: ${player.money}        Citizens: {get_total_citizens()}      Tax: {allocated_tax * 100}%", (0, 0, 0))
-        description_panel.display_time(
-            SCREEN, f"Time: {timer.get_current_date_str()}", (400, 10))
-        description_panel.display_game_speed(
-            SCREEN, timer, game_speed_multiplier)
-        price_panel.display(SCREEN, 24, (102, SCREEN.get_height(
-        ) - 20), (128, 128, 128), f'${(held_price)} for {class_tobuild}', (0, 0, 0))
-        builder_panel.display(SCREEN, 0, (0, 0), (90, 90, 90), "", (0, 0, 0))
-        builder_panel.display_assets(SCREEN, icons)
-
-        # Citizen adding Logic
-        if (len(initial_citizens) != 0):  # Initial edge case
-            if len(map.get_residential_zones()) != 0:
-                first_R_Zone = map.get_residential_zones()[0]
-                for c in initial_citizens:
-                    assign_to_residential_zone(c, first_R_Zone, map)
-                    handle_citizen_addition_satisfaction(c, map)
-                    initial_citizens.remove(c)
-
-        if (timer.get_current_time().month != month):
-            add_citizens_to_game(map)
-            for zone in map.get_residential_zones():
-                assign_zone_citizens_to_work(zone, map)
-            if (player.money <= 0):
-                humans = Citizen.get_all_citizens()
-                for key in humans:
-                    res = humans[key].satisfaction - \
-                        (humans[key].satisfaction * 0.35)
-                    if (res <= 0):
-                        humans[key].satisfaction = 0.0
-                    else:
-                        humans[key].satisfaction = res
-            month = timer.get_current_time().month
-
-
-        # Zones and (Buildings,Roads,Forest) Expense Logic
-        if (timer.get_current_time().day != day):
-            for obj in map.get_all_objects():
-                did_a_quarter_pass = has_quarter_passed_from_creation(
-                    obj, timer)
-                did_a_year_pass = has_year_passed_from_creation(obj, timer)
-
-                # Handle ServiceBuildings,Roads Expense
-                if obj.type == "Road" or obj.type == "PoliceDepartment" or obj.type == "Stadium":
-                    if (did_a_year_pass):
-                        player.money -= obj.properties['MaintenanceFee']
-
-                # Handle Forest Expense and Grow
-                elif obj.type == "Forest":
-                    if (did_a_year_pass):
-                        randomizer_for_disaster = has_random_years_passed_from_start(
-                            game_start_time, timer)
-                        if obj.properties['Mature']:
-                            player.money -= obj.properties['MaintenanceFee']
-                        else:
-                            obj.properties['Year'] += 1
-                            obj.properties['Satisfaction'] += 0.03
-                            handle_tree_growth(map,obj)
-                            if obj.properties['Year'] == 10:
-                                obj.properties['Mature'] = True
-                # Handle Zones Expense
-                else:
-                    # Deduct MaintenanceFees for any Zone from Player
-                    if (did_a_quarter_pass):
-                        player.money -= obj.properties['MaintenanceFee']
-                    # IncreaseRevenue of each WorkZone per day
-                    total_citizens = len(obj.properties['Citizens'])
-                    if (obj.type != "ResidentialZone" and total_citizens != 0):
-                        obj.properties['Revenue'] += (
-                            MONEY_PER_DAY * total_citizens)
-                    # Get revenue (TAX) from WorkZone to Player
-                    elif (obj.type != "ResidentialZone" and did_a_year_pass):
-                        revenue = obj.properties['Revenue'] * allocated_tax
-                        player.money += revenue
-                        obj.properties['Revenue'] = 0
-            day = timer.get_current_time().day
+        # Collect the regions of the screen which changed since the last frame
+        description_text = f"Funds: ${player.money}        Citizens: {get_total_citizens()}      Tax: {allocated_tax * 100}%"
+        time_text = f"Time: {timer.get_current_date_str()}"
+        price_text = f'${(held_price)} for {class_tobuild}'
+        renderer.mark_dirty_rects(map.get_dirty_rects())
+        renderer.mark_dirty_rects(description_panel.get_dirty_rects(
+            (description_text, time_text, timer.game_speed_multiplier)))
+        renderer.mark_dirty_rects(price_panel.get_dirty_rects(price_text))
+        renderer.mark_dirty_rects(builder_panel.get_dirty_rects(len(icons)))
+        cursor = None if normal_cursor else (cursorImg, cursorImgRect.copy())
+        if cursor != drawn_cursor:
+            if drawn_cursor:
+                renderer.mark_dirty(drawn_cursor[1])
+            drawn_cursor = cursor
+        if drawn_cursor:
+            # The cursor is blended on top of the screen, so what is under it is redrawn with it
+            renderer.mark_dirty(drawn_cursor[1])
 
+        # Recomposite only the dirty region of the screen, nothing is drawn while fast forwarding
+        if timer.fast_forward:
+            renderer.mark_all_dirty()
+            clip = None
+        else:
+            clip = renderer.begin_frame()
+        if clip:
+            map.display()
+            if clip.colliderect(description_panel.get_rect()):
+                description_panel.display(SCREEN, 24, (10, 10), (128, 128, 128), description_text, (0, 0, 0))
+                description_panel.display_time(SCREEN, time_text, (400, 10))
+                description_panel.display_game_speed(
+                    SCREEN, timer, game_speed_multiplier)
+            if clip.colliderect(price_panel.get_rect()):
+                price_panel.display(SCREEN, 24, (102, SCREEN.get_height(
+                ) - 20), (128, 128, 128), price_text, (0, 0, 0))
+            if renderer.is_dirty(builder_panel.get_rect()):
+                builder_panel.display(SCREEN, 0, (0, 0), (90, 90, 90), "", (0, 0, 0))
+                builder_panel.display_assets(SCREEN, icons)
+            if drawn_cursor:
+                SCREEN.blit(cursorImg, cursorImgRect)
+            renderer.end_frame()
 
         for event in pygame.event.get():  # mouse button click, keyboard, or the x button.
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -291,7 +237,7 @@ def run(running, loaded_game, new_game_flag, tax):
                         clicked_cords = clicked_zone = upgrade = reclassify = demolish = demolish_confirm = None
                 if demolish_confirm:
                     if demolish_confirm.collidepoint(mouse_pos):
-                        demolish_zone(clicked_zone,map,player)
+                        demolish_zone(clicked_zone,map,player,engine.rng)
                         clicked_cords = clicked_zone = upgrade = reclassify = demolish = demolish_confirm = None
                         
             if event.type == pygame.QUIT:
@@ -323,10 +269,9 @@ def run(running, loaded_game, new_game_flag, tax):
                                 disaster_make = Disaster(
                                     x-1, y-1, timer.get_current_date_str(), map)
                                 obj = disaster_make.instance
-                                zones = map.get_all_objects()
                                 to_destory = []
                                 for p in get_area(obj):
-                                    tmp = tile_in_which_zone(p, zones)
+                                    tmp = map.get_object_at_tile(p)
                                     if (tmp):
                                         if (tmp not in to_destory):
                                             to_destory.append(tmp)
@@ -351,8 +296,8 @@ def run(running, loaded_game, new_game_flag, tax):
                 if selected_icon != None:
                     # Handle cursor at selection
                     image_size = get_image_size(icons[selected_icon][1])
-                    cursorImg = pygame.transform.scale(pygame.image.load(
-                        icons[selected_icon][0]), (image_size, image_size))
+                    cursorImg = AssetCache.get_image(
+                        icons[selected_icon][0], (image_size, image_size))
                     cursorImgRect = cursorImg.get_rect()
                     cursorImgRect.center = pygame.mouse.get_pos()
                     normal_cursor = False
@@ -363,6 +308,10 @@ def run(running, loaded_game, new_game_flag, tax):
                     else:
                         held_price = 0
             
+            # Fast forward toggle
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                timer.fast_forward = not timer.fast_forward
+
             # Scroll handling    
             elif event.type == pygame.KEYDOWN: 
                 clicked_cords = clicked_zone = upgrade = reclassify = demolish = demolish_confirm = None
@@ -370,19 +319,18 @@ def run(running, loaded_game, new_game_flag, tax):
 
         if not normal_cursor:
             clicked_cords = clicked_zone = upgrade = reclassify = demolish = demolish_confirm = None
-            SCREEN.blit(cursorImg, cursorImgRect)
         
         clicked_cords,clicked_zone,upgrade,reclassify,demolish,demolish_confirm = handle_prompt(map,clicked_cords,clicked_zone,upgrade,reclassify,demolish,demolish_confirm)
-        handle_disaster_logic(map,timer)
-        handle_disaster_random_logic(map,timer.get_current_date_str(),randomizer_for_disaster)
+        renderer.mark_dirty_rects(map.get_prompt_rects())
 
+        # Limit the frame rate to 60 FPS, or run as fast as possible while fast forwarding
+        elapsed_ms = timer.tick(0 if timer.fast_forward else 60)
 
-        # Limit the frame rate to 60 FPS
-        timer.update_time(paused)
-        timer.tick(60)
+        # Initial citizens and disasters every frame, expenses and revenue once for every game day elapsed
+        engine.update(timer.accumulate(elapsed_ms, paused))
 
-        pygame.display.update()
-        SCREEN.fill((0, 0, 0))
+        if not timer.fast_forward:
+            renderer.present()
         saved_game_speed = timer.game_speed
         saved_speed_multiplier = timer.game_speed_multiplier
         saved_current_time_str = timer.get_current_date_str()
@@ -0,0 +1,77 @@
+import pygame
+
+
+class AssetCache:
+    """
+    A process-wide cache of the images loaded from disk.
+
+    Every image is loaded, converted to the display's pixel format and (optionally) scaled only once,
+    afterwards the same surface is served from memory.
+
+    Attributes:
+        images (dict): A dictionary of (path, size) to the loaded pygame.Surface.
+        hits (int): The amount of requests served from the cache.
+        misses (int): The amount of requests which had to load the image from disk.
+    """
+    images = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get_image(cls, path, size=None):
+        """
+        Returns the image located at the given path, loads it if it is not cached yet.
+
+        Args:
+            path (str): The path of the image file.
+            size (tuple): Optional (width, height) the image is scaled to. Default: None (original size)
+
+        Returns:
+            pygame.Surface: The loaded image.
+        """
+        key = (path, tuple(size) if size else None)
+        image = cls.images.get(key)
+        if image is not None:
+            cls.hits += 1
+            return image
+        cls.misses += 1
+        original = cls.images.get((path, None))
+        if original is None:
+            original = convert_image(pygame.image.load(path))
+            cls.images[(path, None)] = original
+        image = pygame.transform.scale(original, key[1]) if size else original
+        cls.images[key] = image
+        return image
+
+    @classmethod
+    def clear(cls):
+        """
+        Removes all the cached images and resets the counters.
+        """
+        cls.images.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: The amount of hits, misses and cached images.
+        """
+        return {"hits": cls.hits, "misses": cls.misses, "size": len(cls.images)}
+
+
+def convert_image(image):
+    """
+    Converts the image to the pixel format of the display for fast blitting,
+    images with transparency keep their alpha channel.
+
+    The image is returned as it is if no display mode was set yet (eg: headless tests)
+    """
+    if pygame.display.get_surface() is None:
+        return image
+    if image.get_flags() & pygame.SRCALPHA:
+        return image.convert_alpha()
+    return image.convert()
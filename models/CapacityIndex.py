@@ -0,0 +1,149 @@
+import random
+
+# The types of the zones citizens live or work in
+ZONE_TYPES = ("ResidentialZone", "IndustrialZone", "ServiceZone")
+
+
+class CapacityIndex:
+    """
+    An index of the zones of a map which have free seats, grouped by zone type, each Map owns one
+    (Map.get_capacity_index).
+
+    The zones of each type are kept in a list (with the position of every zone), so a zone is added, removed
+    or picked at random in constant time, and finding a home or a job never goes through the full zones.
+    A zone is added when it is placed on the map, updated whenever its citizens or its capacity change,
+    and removed when it is removed from the map.
+
+    The zones are not grouped by road network: which zones are connected is already answered by the components
+    of the RoadNetwork and the bordering objects of the map (see JobMatcher), and keeping groups per network
+    would mean moving zones between groups on every road added or removed.
+
+    Attributes:
+        placed (set): The zones placed on the map.
+        zones (dict): A dictionary of zone type to the list of the zones of that type with free seats.
+        positions (dict): A dictionary of zone to its position in the list of its type.
+
+    Methods:
+        add(zone): Adds a zone placed on the map.
+        update(zone): Lists or unlists the zone depending on its free seats.
+        remove(zone): Removes the zone, eg: after it was removed from the map.
+        get_zones(*zone_types): Returns the zones of the given types with free seats.
+        has_free_seats(zone): Checks if the zone has free seats.
+        choice(zone_type, rng=random): Returns a random zone of the given type with free seats.
+        clear(): Removes all the zones.
+        get_stats(): Returns the amount of zones with free seats of each zone type.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty CapacityIndex object.
+        """
+        self.placed = set()
+        self.zones = {}
+        self.positions = {}
+
+    def add(self, zone):
+        """
+        Adds a zone placed on the map to the index, objects which are not zones are ignored.
+
+        Args:
+            zone (TiledObject): The placed zone.
+        """
+        if zone.type in ZONE_TYPES:
+            self.placed.add(zone)
+            self.update(zone)
+
+    def update(self, zone):
+        """
+        Lists the zone if it has free seats, unlists it otherwise. Zones which are not placed on the map are ignored.
+
+        Args:
+            zone (TiledObject): The zone whose citizens or capacity changed.
+        """
+        if zone not in self.placed:
+            return
+        has_free_seats = zone.properties['Capacity'] - len(zone.properties['Citizens']) > 0
+        if has_free_seats and zone not in self.positions:
+            zones = self.zones.setdefault(zone.type, [])
+            self.positions[zone] = len(zones)
+            zones.append(zone)
+        elif not has_free_seats and zone in self.positions:
+            self.__unlist(zone)
+
+    def remove(self, zone):
+        """
+        Removes the zone from the index, eg: after it was removed from the map.
+
+        Args:
+            zone (TiledObject): The removed zone.
+        """
+        self.placed.discard(zone)
+        self.__unlist(zone)
+
+    def __unlist(self, zone):
+        """
+        Removes the zone from the list of its type, the last zone of the list takes its position
+        """
+        position = self.positions.pop(zone, None)
+        if position is None:
+            return
+        zones = self.zones[zone.type]
+        last = zones.pop()
+        if last is not zone:
+            zones[position] = last
+            self.positions[last] = position
+
+    def get_zones(self, *zone_types) -> list:
+        """
+        Returns the zones of the given types which have free seats.
+
+        Args:
+            zone_types (str): The zone types, eg: "IndustrialZone", "ServiceZone".
+
+        Returns:
+            list: The zones with free seats, in no particular order.
+        """
+        zones = []
+        for zone_type in zone_types:
+            zones.extend(self.zones.get(zone_type, ()))
+        return zones
+
+    def has_free_seats(self, zone) -> bool:
+        """
+        Checks if the zone has free seats.
+        """
+        return zone in self.positions
+
+    def choice(self, zone_type, rng=random):
+        """
+        Returns a random zone of the given type which has free seats.
+
+        Args:
+            zone_type (str): The zone type, eg: "ResidentialZone".
+            rng (random.Random): Optional random number generator picking the zone, eg: the one of the
+                SimulationEngine. Default: the random module
+
+        Returns:
+            The zone (TiledObject), or None if no zone of that type has free seats.
+        """
+        zones = self.zones.get(zone_type)
+        if not zones:
+            return None
+        return rng.choice(zones)
+
+    def clear(self):
+        """
+        Removes all the zones from the index.
+        """
+        self.placed.clear()
+        self.zones.clear()
+        self.positions.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Returns the index statistics.
+
+        Returns:
+            dict: The amount of zones with free seats of each zone type.
+        """
+        return {zone_type: len(zones) for zone_type, zones in self.zones.items()}
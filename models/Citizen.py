@@ -1,31 +1,141 @@
 import random
+from array import array
+
+# The satisfaction a bonus can not take a citizen above
+MAX_SATISFACTION = 100
 
 class Citizen:
     """
     A class representing a citizen in a city simulation game.
-    
+
+    The data of the citizens is stored column by column (homes, works, satisfactions), one row per citizen,
+    and a Citizen object is only a lightweight handle to its row. Removing a citizen moves the last row
+    into its place, so the columns stay dense. The population, employment and satisfaction totals
+    are kept up to date as the rows change, so they never have to be summed again. The same is done
+    for every zone: the citizens living or working in it, their satisfaction and its unemployed residents.
+    The zone counters follow the home and work of the citizens, so the citizens of a zone (properties['Citizens'])
+    are only changed together with them (eg: add_citizen then home, remove_citizen_from_zone then work = None).
+    Bonuses and penalties are applied to a group of rows at once (all the citizens, or the rows of the citizens
+    of some zones, see get_rows), with the same results as updating the citizens one by one. For a group of rows
+    the changes are summed per zone first, so every zone and the city total are updated once. For all the
+    citizens the column is rebuilt in one pass and the zone sums are only summed again when one is read.
+
     Attributes:
         citizens (dict): A dictionary containing all the citizens.
         next_id (int): The ID to assign to the next created citizen.
+        handles (list): The citizen of each row.
+        homes (list): The home zone of each row (None if homeless).
+        works (list): The work zone of each row (None if unemployed).
+        satisfactions (array): The satisfaction of each row.
+        employed (int): The amount of citizens with a work zone.
+        total_satisfaction (float): The sum of the satisfactions of all the citizens.
+        zone_stats (dict): A dictionary of zone to [the amount of citizens living or working in it,
+            the sum of their satisfactions, the amount of its residents without work].
+        zone_sums_stale (bool): True if the satisfaction sums of zone_stats have to be summed again.
         home (Zone): The home zone of the citizen.
         work (Zone): The work zone of the citizen.
-        satisfaction (int): The satisfaction level of the citizen.
+        satisfaction (float): The satisfaction level of the citizen.
         id (int): The ID of the citizen.
+        row (int): The row of the citizen in the columns, None once the citizen was removed.
+        removed (tuple): The (home, work, satisfaction) the citizen had when it was removed, None until then.
     """
+    __slots__ = ('id', 'row', 'removed')
     citizens = {}
     next_id = 1
-    
-    def __init__(self):
+    handles = []
+    homes = []
+    works = []
+    satisfactions = array('d')
+    employed = 0
+    total_satisfaction = 0.0
+    zone_stats = {}
+    zone_sums_stale = False
+
+    def __init__(self, rng=random):
         """
         Initializes a Citizen object.
+
+        Args:
+            rng (random.Random): Optional random number generator drawing the initial satisfaction.
+                Default: the random module
         """
-        self.home = None
-        self.work = None
-        self.satisfaction = random.randint(50, 100)
+        satisfaction = rng.randint(50, 100)
         self.id = Citizen.next_id
+        self.row = len(Citizen.handles)
+        self.removed = None
+        Citizen.handles.append(self)
+        Citizen.homes.append(None)
+        Citizen.works.append(None)
+        Citizen.satisfactions.append(satisfaction)
+        Citizen.total_satisfaction += satisfaction
         Citizen.next_id += 1
         Citizen.citizens[self.id] = self
-        
+
+    @property
+    def home(self):
+        if self.row is None:
+            return self.removed[0]
+        return Citizen.homes[self.row]
+
+    @home.setter
+    def home(self, zone):
+        if self.row is None:
+            self.removed = (zone, self.removed[1], self.removed[2])
+            return
+        satisfaction = Citizen.satisfactions[self.row]
+        unemployed = 1 if Citizen.works[self.row] is None else 0
+        if Citizen.homes[self.row] is not None:
+            self.__count(Citizen.homes[self.row], -1, -satisfaction, -unemployed)
+        if zone is not None:
+            self.__count(zone, 1, satisfaction, unemployed)
+        Citizen.homes[self.row] = zone
+
+    @property
+    def work(self):
+        if self.row is None:
+            return self.removed[1]
+        return Citizen.works[self.row]
+
+    @work.setter
+    def work(self, zone):
+        if self.row is None:
+            self.removed = (self.removed[0], zone, self.removed[2])
+            return
+        satisfaction = Citizen.satisfactions[self.row]
+        previous = Citizen.works[self.row]
+        if previous is not None:
+            self.__count(previous, -1, -satisfaction, 0)
+        if zone is not None:
+            self.__count(zone, 1, satisfaction, 0)
+        if (previous is None) != (zone is None):
+            Citizen.employed += 1 if zone is not None else -1
+            if Citizen.homes[self.row] is not None:
+                self.__count(Citizen.homes[self.row], 0, 0.0, 1 if zone is None else -1)
+        Citizen.works[self.row] = zone
+
+    @property
+    def satisfaction(self):
+        if self.row is None:
+            return self.removed[2]
+        return Citizen.satisfactions[self.row]
+
+    @satisfaction.setter
+    def satisfaction(self, value):
+        if self.row is None:
+            self.removed = (self.removed[0], self.removed[1], value)
+            return
+        self.__add_satisfaction(self.row, value - Citizen.satisfactions[self.row])
+        Citizen.satisfactions[self.row] = value
+
+    def get_data(self) -> dict:
+        """
+        Returns the data of the citizen, the handle itself has no __dict__.
+
+        Returns:
+            dict: The home, work, satisfaction and id of the citizen.
+        """
+        return {"home": self.home, "work": self.work, "satisfaction": self.satisfaction, "id": self.id}
+
     @classmethod
     def reinitialize(self):
         """
@@ -33,22 +143,245 @@ class Citizen:
         """
         Citizen.next_id = 1
         Citizen.citizens.clear()
+        for handle in Citizen.handles:
+            handle.removed = (handle.home, handle.work, handle.satisfaction)
+            handle.row = None
+        Citizen.handles.clear()
+        Citizen.homes.clear()
+        Citizen.works.clear()
+        Citizen.satisfactions = array('d')
+        Citizen.employed = 0
+        Citizen.total_satisfaction = 0.0
+        Citizen.zone_stats.clear()
+        Citizen.zone_sums_stale = False
+
+    @classmethod
+    def remove(cls, citizen):
+        """
+        Removes the citizen from the game, the last row takes its place in the columns.
+        The citizen keeps its home, work and satisfaction, but is not counted anymore.
+
+        Args:
+            citizen (Citizen): The citizen to remove.
+
+        Raises:
+            KeyError: If the citizen is not in the game.
+        """
+        del Citizen.citizens[citizen.id]
+        row = citizen.row
+        if row is None:
+            return
+        home, work, satisfaction = citizen.home, citizen.work, citizen.satisfaction
+        citizen.removed = (home, work, satisfaction)
+        if home is not None:
+            cls.__count(home, -1, -satisfaction, -1 if work is None else 0)
+        if work is not None:
+            cls.__count(work, -1, -satisfaction, 0)
+            Citizen.employed -= 1
+        Citizen.total_satisfaction -= satisfaction
+        last = len(Citizen.handles) - 1
+        if row != last:
+            moved = Citizen.handles[last]
+            Citizen.handles[row] = moved
+            Citizen.homes[row] = Citizen.homes[last]
+            Citizen.works[row] = Citizen.works[last]
+            Citizen.satisfactions[row] = Citizen.satisfactions[last]
+            moved.row = row
+        Citizen.handles.pop()
+        Citizen.homes.pop()
+        Citizen.works.pop()
+        Citizen.satisfactions.pop()
+        citizen.row = None
+
+    @classmethod
+    def get_rows(cls, zones) -> list:
+        """
+        Returns the rows of the citizens of the given zones, eg: to apply a bonus to the citizens living in them.
+
+        Args:
+            zones (list): The zones (TiledObject) whose citizens are selected.
+
+        Returns:
+            list: The rows of the citizens.
+        """
+        return [c.row for zone in zones for c in zone.properties['Citizens'] if c.row is not None]
+
+    @classmethod
+    def increase_satisfaction(cls, ratio, rows=None):
+        """
+        Increases the satisfaction of the citizens by the given ratio of it,
+        a citizen whose satisfaction would go above MAX_SATISFACTION keeps it as it is.
+
+        Args:
+            ratio (float): The ratio of the satisfaction gained, eg: the Satisfaction of a Stadium.
+            rows (list): Optional rows of the citizens to update. Default: None (all the citizens)
+        """
+        cls.__apply(lambda s: s + (ratio * s) if s + (ratio * s) <= MAX_SATISFACTION else s, rows)
+
+    @classmethod
+    def decrease_satisfaction(cls, ratio, rows=None):
+        """
+        Takes back a bonus given by increase_satisfaction, decreasing the satisfaction of the citizens
+        by the given ratio of it.
+
+        Args:
+            ratio (float): The ratio of the satisfaction lost, eg: the Satisfaction of a removed Stadium.
+            rows (list): Optional rows of the citizens to update. Default: None (all the citizens)
+        """
+        cls.__apply(lambda s: s - (ratio * s) if s + (ratio * s) >= 0 else s, rows)
+
+    @classmethod
+    def reduce_satisfaction(cls, ratio, rows=None):
+        """
+        Reduces the satisfaction of the citizens by the given ratio of it, at least down to 0.
+
+        Args:
+            ratio (float): The ratio of the satisfaction lost, eg: 0.35 when the player is bankrupt.
+            rows (list): Optional rows of the citizens to update. Default: None (all the citizens)
+        """
+        cls.__apply(lambda s: s - (s * ratio) if s - (s * ratio) > 0 else 0.0, rows)
+
+    @classmethod
+    def __apply(cls, function, rows):
+        """
+        Replaces the satisfaction of the given rows (all of them if None) by the result of the function
+        """
+        if rows is None:
+            Citizen.satisfactions = array('d', map(function, Citizen.satisfactions))
+            Citizen.total_satisfaction = sum(Citizen.satisfactions)
+            Citizen.zone_sums_stale = True
+            return
+        satisfactions = Citizen.satisfactions
+        homes = Citizen.homes
+        works = Citizen.works
+        deltas = {}
+        total = 0.0
+        for row in rows:
+            old = satisfactions[row]
+            new = function(old)
+            if new == old:
+                continue
+            satisfactions[row] = new
+            delta = new - old
+            total += delta
+            home = homes[row]
+            if home is not None:
+                deltas[home] = deltas.get(home, 0.0) + delta
+            work = works[row]
+            if work is not None:
+                deltas[work] = deltas.get(work, 0.0) + delta
+        Citizen.total_satisfaction += total
+        zone_stats = Citizen.zone_stats
+        for zone, delta in deltas.items():
+            zone_stats[zone][1] += delta
+
+    @classmethod
+    def __sum_zones(cls):
+        """
+        Sums the satisfactions of the citizens of every zone again, after the column was rebuilt
+        """
+        zone_stats = Citizen.zone_stats
+        for stats in zone_stats.values():
+            stats[1] = 0.0
+        for home, work, satisfaction in zip(Citizen.homes, Citizen.works, Citizen.satisfactions):
+            if home is not None:
+                zone_stats[home][1] += satisfaction
+            if work is not None:
+                zone_stats[work][1] += satisfaction
+        Citizen.zone_sums_stale = False
+
+    @classmethod
+    def __add_satisfaction(cls, row, delta):
+        """
+        Adds the change of the satisfaction of the given row to the totals of the city and of its zones
+        """
+        Citizen.total_satisfaction += delta
+        home = Citizen.homes[row]
+        if home is not None:
+            Citizen.zone_stats[home][1] += delta
+        work = Citizen.works[row]
+        if work is not None:
+            Citizen.zone_stats[work][1] += delta
+
+    @classmethod
+    def __count(cls, zone, members, satisfaction, unemployed):
+        """
+        Adds the given changes to the counters of the zone, the counters of a zone without citizens are dropped
+        """
+        stats = Citizen.zone_stats.get(zone)
+        if stats is None:
+            stats = Citizen.zone_stats[zone] = [0, 0.0, 0]
+        stats[0] += members
+        stats[1] += satisfaction
+        stats[2] += unemployed
+        if stats[0] == 0:
+            del Citizen.zone_stats[zone]
+
+    @classmethod
+    def get_zone_satisfaction(cls, zone):
+        """
+        Returns the sum of the satisfactions of the citizens living or working in the zone.
+
+        Args:
+            zone (TiledObject): The zone.
+
+        Returns:
+            float: The satisfaction sum, 0.0 if nobody lives or works in the zone.
+        """
+        if Citizen.zone_sums_stale:
+            cls.__sum_zones()
+        stats = Citizen.zone_stats.get(zone)
+        return stats[1] if stats is not None else 0.0
+
+    @classmethod
+    def get_zone_unemployed(cls, zone):
+        """
+        Returns the amount of residents of the zone without work.
+
+        Args:
+            zone (TiledObject): The ResidentialZone.
+
+        Returns:
+            int: The amount of unemployed residents.
+        """
+        stats = Citizen.zone_stats.get(zone)
+        return stats[2] if stats is not None else 0
 
     @classmethod
     def get_citizens_len(cls):
         """
         Returns the number of citizens.
-        
+
         Returns:
             int: The number of citizens.
         """
         return len(Citizen.citizens)
 
+    @classmethod
+    def get_employed_len(cls):
+        """
+        Returns the number of citizens with a work zone.
+
+        Returns:
+            int: The number of employed citizens.
+        """
+        return Citizen.employed
+
+    @classmethod
+    def get_total_satisfaction(cls):
+        """
+        Returns the sum of the satisfactions of all the citizens.
+
+        Returns:
+            float: The total satisfaction.
+        """
+        return Citizen.total_satisfaction
+
     @classmethod
     def get_all_citizens(cls):
         """
         Returns a copy of the citizens dictionary.
-        
+
         Returns:
             dict: A copy of the citizens dictionary.
         """
@@ -58,7 +391,7 @@ class Citizen:
     def get_home(cls):
         """
         Returns the ID of the citizen's home zone.
-        
+
         Returns:
             int or str: The ID of the citizen's home zone, or an empty string if the citizen has no home.
         """
@@ -70,7 +403,7 @@ class Citizen:
     def get_work(cls):
         """
         Returns the ID of the citizen's work zone.
-        
+
         Returns:
             int or str: The ID of the citizen's work zone, or an empty string if the citizen has no work.
         """
@@ -82,7 +415,7 @@ class Citizen:
     def get_satisfaction(cls):
         """
         Returns the satisfaction level of the citizen.
-        
+
         Returns:
             int: The satisfaction level of the citizen.
         """
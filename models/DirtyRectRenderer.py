@@ -0,0 +1,127 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Keeps track of the regions of the screen which changed since the last frame,
+    so only those regions are recomposited and pushed to the display.
+
+    Attributes:
+        screen (pygame.Surface): The display surface everything is drawn on.
+        background (tuple): The color used to clear a dirty region before it gets redrawn.
+        dirty_rects (list): The rects (pygame.Rect) marked as dirty for the current frame.
+
+    Methods:
+        mark_dirty(rect): Marks the given rect as dirty.
+        mark_dirty_rects(rects): Marks all the given rects as dirty.
+        mark_all_dirty(): Marks the whole screen as dirty.
+        has_dirty_rects(): Checks if anything has to be redrawn.
+        is_dirty(rect): Checks if the given region of the screen has to be redrawn.
+        begin_frame(): Clips the screen to the dirty region and clears the dirty rects.
+        end_frame(): Removes the clipping set by begin_frame.
+        present(): Pushes the dirty rects to the display and resets them.
+    """
+
+    def __init__(self, screen, background=(0, 0, 0)):
+        """
+        Initializes a DirtyRectRenderer object.
+
+        Args:
+            screen (pygame.Surface): The display surface.
+            background (tuple): The color used to clear dirty regions (R, G, B).
+        """
+        self.screen = screen
+        self.background = background
+        self.dirty_rects = []
+
+    def mark_dirty(self, rect):
+        """
+        Marks the given rect as dirty, the part of the rect outside the screen is ignored.
+
+        Args:
+            rect (pygame.Rect): The region that changed.
+        """
+        if rect is None:
+            return
+        rect = pygame.Rect(rect).clip(self.screen.get_rect())
+        if rect.width > 0 and rect.height > 0:
+            self.dirty_rects.append(rect)
+
+    def mark_dirty_rects(self, rects):
+        """
+        Marks all the given rects as dirty.
+
+        Args:
+            rects (list): A list of pygame.Rect objects.
+        """
+        for rect in rects:
+            self.mark_dirty(rect)
+
+    def mark_all_dirty(self):
+        """Marks the whole screen as dirty, eg: after a menu was drawn on top of the game"""
+        self.dirty_rects = [self.screen.get_rect()]
+
+    def has_dirty_rects(self) -> bool:
+        """Returns True if any region of the screen has to be redrawn"""
+        return len(self.dirty_rects) != 0
+
+    def is_dirty(self, rect) -> bool:
+        """
+        Checks if the given region of the screen overlaps a dirty rect, eg: to skip redrawing a panel which did not change.
+        A region inside the clipping area which is not dirty keeps what was drawn on it before.
+
+        Args:
+            rect (pygame.Rect): The region of the screen.
+
+        Returns:
+            bool: True if the region has to be redrawn.
+        """
+        return pygame.Rect(rect).collidelist(self.dirty_rects) != -1
+
+    def begin_frame(self):
+        """
+        Merges the overlapping dirty rects, clips the screen to the region covering them
+        and clears the dirty rects, everything drawn afterwards only touches the dirty region.
+
+        Returns:
+            The clipping rect (pygame.Rect), or None if nothing is dirty.
+        """
+        if not self.dirty_rects:
+            return None
+        self.dirty_rects = merge_rects(self.dirty_rects)
+        clip = self.dirty_rects[0].unionall(self.dirty_rects[1:])
+        self.screen.set_clip(clip)
+        for rect in self.dirty_rects:
+            self.screen.fill(self.background, rect)
+        return clip
+
+    def end_frame(self):
+        """Removes the clipping set by begin_frame"""
+        self.screen.set_clip(None)
+
+    def present(self):
+        """Updates only the dirty regions of the display, then resets them for the next frame"""
+        if self.dirty_rects:
+            pygame.display.update(merge_rects(self.dirty_rects))
+            self.dirty_rects = []
+
+
+def merge_rects(rects) -> list:
+    """
+    Merges the overlapping rects into their union until no two rects overlap
+
+    Args:
+        rects (list): A list of pygame.Rect objects.
+
+    Returns:
+        A list of non overlapping pygame.Rect objects covering all the given rects
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
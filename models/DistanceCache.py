@@ -0,0 +1,109 @@
+class DistanceCache:
+    """
+    A cache of the distances between the objects of a map, each Map owns one (Map.get_distance_cache).
+
+    Objects never move once they are placed, so the distance of a pair is only calculated once.
+    The distances are keyed by the ids of both objects (smaller id first, the distance is symmetric)
+    and are evicted when an object is removed from the map.
+
+    Attributes:
+        distances (dict): A dictionary of (id, id) to the distance of the two objects.
+        partners (dict): A dictionary of id to the ids it has a cached distance with.
+        hits (int): The amount of requests served from the cache.
+        misses (int): The amount of requests which were not cached yet.
+
+    Methods:
+        get(obj1, obj2): Returns the cached distance between the two objects.
+        put(obj1, obj2, distance): Caches the distance between the two objects.
+        evict(obj): Removes all the cached distances of an object.
+        clear(): Removes all the cached distances and resets the counters.
+        get_stats(): Returns the cache statistics.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty DistanceCache object.
+        """
+        self.distances = {}
+        self.partners = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, obj1, obj2):
+        """
+        Returns the cached distance between the two objects.
+
+        Args:
+            obj1 (TiledObject): The first object.
+            obj2 (TiledObject): The second object.
+
+        Returns:
+            The distance, or None if it is not cached yet.
+        """
+        distance = self.distances.get(get_key(obj1, obj2))
+        if distance is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return distance
+
+    def put(self, obj1, obj2, distance):
+        """
+        Caches the distance between the two objects.
+
+        Args:
+            obj1 (TiledObject): The first object.
+            obj2 (TiledObject): The second object.
+            distance: The distance of the two objects.
+        """
+        key = get_key(obj1, obj2)
+        self.distances[key] = distance
+        self.partners.setdefault(key[0], set()).add(key[1])
+        self.partners.setdefault(key[1], set()).add(key[0])
+
+    def evict(self, obj):
+        """
+        Removes all the cached distances of the given object, eg: after it was removed from the map.
+
+        Args:
+            obj (TiledObject): The removed object.
+        """
+        for partner in self.partners.pop(obj.id, ()):
+            self.distances.pop(get_key_of_ids(obj.id, partner), None)
+            partner_ids = self.partners.get(partner)
+            if partner_ids is not None:
+                partner_ids.discard(obj.id)
+
+    def clear(self):
+        """
+        Removes all the cached distances and resets the counters.
+        """
+        self.distances.clear()
+        self.partners.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: The amount of hits, misses, the hit rate and the amount of cached distances.
+        """
+        requests = self.hits + self.misses
+        hit_rate = self.hits / requests if requests else 0.0
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": hit_rate, "size": len(self.distances)}
+
+
+def get_key(obj1, obj2) -> tuple:
+    """
+    Returns the cache key of the two objects
+    """
+    return get_key_of_ids(obj1.id, obj2.id)
+
+
+def get_key_of_ids(id1, id2) -> tuple:
+    """
+    Returns the cache key of the two object ids, the smaller id first
+    """
+    return (id1, id2) if id1 <= id2 else (id2, id1)
@@ -0,0 +1,95 @@
+# Periods (in days) of the anniversaries of the objects
+YEAR = 365
+QUARTER = 90
+
+# Periods of the anniversaries each type of object has events on:
+# maintenance fees and forest growth every year, zone fees every quarter and the taxes of the WorkZones every year
+ANNIVERSARIES = {
+    "Road": (YEAR,),
+    "PoliceDepartment": (YEAR,),
+    "Stadium": (YEAR,),
+    "Forest": (YEAR,),
+    "ResidentialZone": (QUARTER,),
+    "IndustrialZone": (QUARTER, YEAR),
+    "ServiceZone": (QUARTER, YEAR),
+}
+
+
+class EventScheduler:
+    """
+    A calendar queue of the anniversaries of the objects of the map, keyed by day ordinal.
+
+    An object has an event every period days after its creation day, so the day ordinals of its events
+    all share the same remainder modulo the period. Each period has one bucket per remainder, so the events
+    due on a day are found with one lookup per period, without going through the objects which are not due.
+
+    Attributes:
+        buckets (dict): A dictionary of (period, day % period) to the dictionary of the objects due on those days,
+            mapped to their (sequence, creation day).
+        entries (dict): A dictionary of object to the (period, day % period) buckets it is in.
+        periods (set): The periods any object was scheduled with.
+        sequence (int): Counter used to return the due events in the order the objects were added.
+
+    Methods:
+        add(obj, creation_day, periods): Schedules the anniversaries of an object.
+        remove(obj): Removes all the anniversaries of an object.
+        get_due(day): Returns the (object, period) events due on the given day.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty EventScheduler object.
+        """
+        self.buckets = {}
+        self.entries = {}
+        self.periods = set()
+        self.sequence = 0
+
+    def add(self, obj, creation_day, periods):
+        """
+        Schedules the anniversaries of an object, an object already scheduled is kept as it is.
+
+        Args:
+            obj (TiledObject): The object.
+            creation_day (int): The day ordinal of the creation date of the object.
+            periods (tuple): The periods (in days) of the anniversaries, eg: (YEAR,).
+        """
+        if obj in self.entries or not periods:
+            return
+        self.sequence += 1
+        keys = [(period, creation_day % period) for period in periods]
+        for key in keys:
+            self.buckets.setdefault(key, {})[obj] = (self.sequence, creation_day)
+        self.entries[obj] = keys
+        self.periods.update(periods)
+
+    def remove(self, obj):
+        """
+        Removes all the anniversaries of an object, eg: after it was removed from the map.
+
+        Args:
+            obj (TiledObject): The object.
+        """
+        for key in self.entries.pop(obj, ()):
+            bucket = self.buckets[key]
+            del bucket[obj]
+            if not bucket:
+                del self.buckets[key]
+
+    def get_due(self, day) -> list:
+        """
+        Returns the events due on the given day, the objects are not due on their creation day.
+
+        Args:
+            day (int): The day ordinal.
+
+        Returns:
+            list: (object, period) tuples, in the order the objects were added.
+        """
+        due = []
+        for period in self.periods:
+            for obj, (sequence, creation_day) in self.buckets.get((period, day % period), {}).items():
+                if creation_day != day:
+                    due.append((sequence, period, obj))
+        due.sort(key=lambda event: event[:2])
+        return [(obj, period) for sequence, period, obj in due]
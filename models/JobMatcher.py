@@ -0,0 +1,96 @@
+import random
+from models.Citizen import Citizen
+from models.Utils import get_outer_circumference, get_neighboring_objects, assign_to_work_zone
+
+
+class JobMatcher:
+    """
+    Gives a job to the unemployed citizens of the city in one pass, eg: once a month.
+
+    The ResidentialZones are grouped by the road networks (components) around them, since their citizens can
+    work in the same zones: the IndustrialZones and ServiceZones with free seats a road of these networks leads to.
+    As in get_connected_by_road_objects, a road only leads to the first work zone bordering its tile
+    (get_neighboring_object), so a work zone only reached through roads shared with an earlier zone is not offered.
+    The unemployed citizens of a group are then distributed over those zones, each one in the type which needs
+    more workers (IndustrialZone if it needs strictly more, ServiceZone otherwise) and a random zone of that type.
+
+    Attributes:
+        rng (random.Random): The random number generator picking the zones, seed it for reproducible runs.
+
+    Methods:
+        match(map): Gives a job to the unemployed citizens of the map, returns the amount of citizens employed.
+    """
+
+    def __init__(self, rng=None):
+        """
+        Initializes a JobMatcher object.
+
+        Args:
+            rng (random.Random): Optional random number generator. Default: a new random.Random()
+        """
+        self.rng = rng if rng is not None else random.Random()
+
+    def match(self, map) -> int:
+        """
+        Gives a job to the unemployed citizens of the map.
+
+        Args:
+            map (Map): The map of the city.
+
+        Returns:
+            int: The amount of citizens who got a job.
+        """
+        road_network = map.get_road_network()
+        capacity_index = map.get_capacity_index()
+        groups = {}
+        for zone in map.get_residential_zones():
+            if Citizen.get_zone_unemployed(zone) == 0:
+                continue
+            component_ids = frozenset(road_network.get_component_ids_at(get_outer_circumference(zone)))
+            if component_ids:
+                groups.setdefault(component_ids, []).append(zone)
+        if not groups:
+            return 0
+
+        reached_zones = {}
+        employed = 0
+        for component_ids, homes in groups.items():
+            reached = set()
+            for component_id in component_ids:
+                if component_id not in reached_zones:
+                    roads = road_network.components[component_id]
+                    reached_zones[component_id] = set(get_neighboring_objects(roads, map))
+                reached.update(reached_zones[component_id])
+            work_zones = [zone for zone in capacity_index.get_zones("IndustrialZone", "ServiceZone") if zone in reached]
+            unemployed = [c for home in homes for c in home.properties['Citizens'] if c.work is None]
+            employed += self.__distribute(unemployed, work_zones, map)
+        return employed
+
+    def __distribute(self, citizens, work_zones, map) -> int:
+        """
+        Distributes the citizens over the work zones, returns the amount of citizens who got a job
+        """
+        zones = {"IndustrialZone": [], "ServiceZone": []}
+        needed = {"IndustrialZone": 0, "ServiceZone": 0}
+        for zone in work_zones:
+            zones[zone.type].append(zone)
+            needed[zone.type] += zone.properties['Capacity'] - len(zone.properties['Citizens'])
+
+        employed = 0
+        for citizen in citizens:
+            if needed["IndustrialZone"] > needed["ServiceZone"]:
+                zone_type = "IndustrialZone"
+            elif needed["ServiceZone"] > 0:
+                zone_type = "ServiceZone"
+            else:
+                break
+            candidates = zones[zone_type]
+            position = self.rng.randrange(len(candidates))
+            zone = candidates[position]
+            if assign_to_work_zone(citizen, zone, map):
+                employed += 1
+                needed[zone_type] -= 1
+            if not map.get_capacity_index().has_free_seats(zone):
+                candidates[position] = candidates[-1]
+                candidates.pop()
+        return employed
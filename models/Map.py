@@ -1,6 +1,25 @@
 import pygame
+from array import array
+from pytmx import TiledMap
 from pytmx.util_pygame import load_pygame
 from models.Utils import *
+from models.TextCache import TextCache
+from models.RoadNetwork import RoadNetwork
+from models.DistanceCache import DistanceCache
+from models.CapacityIndex import CapacityIndex
+from models.EventScheduler import EventScheduler, ANNIVERSARIES
+
+# Size in pixels of the square chunks used to look up the objects drawn in an area of the map
+CHUNK_SIZE = 128
+
+
+def headless_image_loader(filename, flags, **kwargs):
+    """
+    Image loader of pytmx for headless maps, every tile and object of the map gets None as image
+    """
+    def load(rect=None, flags=None):
+        return None
+    return load
 
 
 class Map:
@@ -8,6 +27,7 @@ class Map:
     Represents a game map.
 
     Attributes:
+        __headless: Whether the map was loaded without images (no display needed).
         __screen: The screen object where the map will be displayed.
         __map: The loaded TMX map.
         __panel_width: The width of the builder panel.
@@ -15,12 +35,52 @@ class Map:
         __scroll_x: The horizontal scroll position of the map.
         __scroll_y: The vertical scroll position of the map.
         __objcount: The count of objects present in the map.
+        __terrain_surface: Pre-rendered surface of the static tile layers, built once per map load (None if headless).
+        __water_table: Summed-area table of the water and water edges tiles, built once per map load.
+        __object_chunks: Dictionary of (chunk_x, chunk_y) to the list of dynamic objects drawn inside that chunk.
+        __draw_order: Dictionary of dynamic object to its (layer index, sequence) drawing order.
+        __draw_sequence: Counter used to keep the objects of a layer in the order they were added.
+        __changed_rects: Map rects of the objects added or removed since the dirty rects were last reported.
+        __occupancy: Dictionary of (tile_x, tile_y) to the dynamic object (Objects layer) occupying that tile.
+        __registry: Dictionary of (layer name, type) to the dynamic objects of that type on that layer, in the
+            order they were added. The key (layer name, None) holds every dynamic object of the layer.
+        __objects_by_id: Dictionary of id to the dynamic object (Objects layer) with that id.
+        __road_network: RoadNetwork of all the roads placed on the map.
+        __bordering_objects: Dictionary of (tile_x, tile_y) to the dynamic objects (Objects layer) whose outer
+            circumference contains that tile, in the order they were added.
+        __influenced_zones: Dictionary of satisfaction increaser (Stadium, PoliceDepartment, Forest) to the
+            ResidentialZones within its Radius, in the order they were added.
+        __influencing_sources: Dictionary of ResidentialZone to the satisfaction increasers it is within the
+            Radius of, in the order they were added.
+        __views: Dictionary of (Forest, ResidentialZone) to [the tiles of the view corridor between them,
+            whether the view is blocked or None if it has to be checked again].
+        __views_by_tile: Dictionary of (tile_x, tile_y) to the (Forest, ResidentialZone) views passing that tile.
+        __views_by_object: Dictionary of object to the (Forest, ResidentialZone) views it is part of.
+        __scheduler: EventScheduler of the anniversaries (fees, taxes, forest growth) of the objects on the map.
+        __distance_cache: DistanceCache of the distances between the objects placed on the map.
+        __capacity_index: CapacityIndex of the zones placed on the map which have free seats.
+        __drawn_scroll: The scroll position when the dirty rects were last reported.
+        __prompt_rects: The rects of the prompts drawn since the dirty rects were last reported.
 
     Methods:
         __init__(self, screen, leftPanelWidth, topOrBottomPanelHeight): Initializes the Map object.
         display(self): Displays the map.
+        render_terrain(self): Renders the static tile layers onto a single surface.
+        build_water_table(self): Builds the summed-area table of the water tiles.
+        get_viewport_rect(self): Returns the area of the screen the map is drawn on.
+        get_objects_in_area(self, area): Returns the dynamic objects drawn inside the given map area.
+        get_dirty_rects(self): Returns the screen rects which changed since the last call.
+        get_prompt_rects(self): Returns the rects of the prompts drawn in the current frame.
         handle_scroll(self, eventKey): Handles map scrolling based on player input.
         add_object(self, obj, player): Adds an object to the map.
+        get_road_network(self): Returns the network of the roads placed on the map.
+        get_scheduler(self): Returns the scheduler of the anniversaries of the objects on the map.
+        get_distance_cache(self): Returns the cache of the distances between the objects on the map.
+        get_capacity_index(self): Returns the index of the zones on the map which have free seats.
+        get_objects_bordering_tile(self, coords): Returns the objects whose outer circumference contains the given tile.
+        get_zones_influenced_by(self, source): Returns the ResidentialZones within the Radius of a satisfaction increaser.
+        get_sources_influencing(self, zone): Returns the satisfaction increasers which have the zone within their Radius.
+        is_view_blocked(self, forest, zone): Checks if an object stands between the Forest and the ResidentialZone.
         get_clicked_tile(self, mousePos): Returns the coordinates of the clicked tile.
         get_tileset_from_gid(self, tile_gid): Returns the tileset associated with the given GID.
         get_actual_map_width(self): Returns the actual width of the map.
@@ -33,11 +93,13 @@ class Map:
         get_tile_width(self): Returns the tile width.
         collide_with_zone(self, zone1, zone2): Checks if two zones overlap.
         collide_with_water(self, obj_x_coord, obj_y_coord, obj_width, obj_height): Checks if an object collides with water.
+        get_object_at_tile(self, coords): Returns the dynamic object occupying the given tile.
+        is_area_occupied(self, obj): Checks if any tile of the object's area is occupied by another object.
         get_scroll_coordinates(self): Returns scroll_x and scroll_y in a list 
 
     """
 
-    def __init__(self, screen, leftPanelWidth, topOrBottomPanelHeight):
+    def __init__(self, screen, leftPanelWidth, topOrBottomPanelHeight, headless=False):
         """
         Initializes the Map object.
 
@@ -45,14 +107,38 @@ class Map:
             screen: The screen object where the map will be displayed.
             leftPanelWidth: The width of the builder panel.
             topOrBottomPanelHeight: The height of the top or bottom panel.
+            headless: Optional boolean to load the map without any image, so no display is needed
+                (eg: SimulationEngine). A headless map can not be displayed. Default: False
         """
+        self.__headless = headless
         self.__screen = screen
-        self.__map = load_pygame('./Map/TMX/befk_map.tmx')
+        self.__map = self.__load_map()
         self.__panel_width = leftPanelWidth
         self.__panel_height = topOrBottomPanelHeight
         self.__scroll_x = 0
         self.__scroll_y = 0
         self.__objcount = 0
+        self.__terrain_surface = None if self.__headless else self.render_terrain()
+        self.__water_table = self.build_water_table()
+        self.__object_chunks = {}
+        self.__draw_order = {}
+        self.__draw_sequence = 0
+        self.__changed_rects = []
+        self.__occupancy = {}
+        self.__registry = {}
+        self.__objects_by_id = {}
+        self.__road_network = RoadNetwork()
+        self.__bordering_objects = {}
+        self.__influenced_zones = {}
+        self.__influencing_sources = {}
+        self.__views = {}
+        self.__views_by_tile = {}
+        self.__views_by_object = {}
+        self.__scheduler = EventScheduler()
+        self.__distance_cache = DistanceCache()
+        self.__capacity_index = CapacityIndex()
+        self.__drawn_scroll = None
+        self.__prompt_rects = []
         
     
     def reinitialize(self, screen, leftPanelWidth, topOrBottomPanelHeight):
@@ -65,17 +151,53 @@ class Map:
             topOrBottomPanelHeight: The height of the top or bottom panel.
         """
         self.__screen = screen
-        self.__map = load_pygame('./Map/TMX/befk_map.tmx')
+        self.__map = self.__load_map()
         self.__panel_width = leftPanelWidth
         self.__panel_height = topOrBottomPanelHeight
         self.__scroll_x = 0
         self.__scroll_y = 0
         self.__objcount = 0
+        self.__terrain_surface = None if self.__headless else self.render_terrain()
+        self.__water_table = self.build_water_table()
+        self.__object_chunks = {}
+        self.__draw_order = {}
+        self.__draw_sequence = 0
+        self.__changed_rects = []
+        self.__occupancy = {}
+        self.__registry = {}
+        self.__objects_by_id = {}
+        self.__road_network = RoadNetwork()
+        self.__bordering_objects = {}
+        self.__influenced_zones = {}
+        self.__influencing_sources = {}
+        self.__views = {}
+        self.__views_by_tile = {}
+        self.__views_by_object = {}
+        self.__scheduler = EventScheduler()
+        self.__distance_cache = DistanceCache()
+        self.__capacity_index = CapacityIndex()
+        self.__drawn_scroll = None
+        self.__prompt_rects = []
         
 
-    def display(self):
-        """Displays the map after initialization"""
-        map_surface = pygame.Surface(
+    def __load_map(self):
+        """
+        Loads the TMX map, with its images unless the map is headless
+        """
+        if self.__headless:
+            return TiledMap('./Map/TMX/befk_map.tmx', image_loader=headless_image_loader)
+        return load_pygame('./Map/TMX/befk_map.tmx')
+
+    def render_terrain(self):
+        """
+        Renders every visible tile layer (everything except the Objects and ObjectsTop layers)
+        onto a single surface. The terrain never changes after the map is loaded,
+        so this is only done once in __init__/reinitialize and reused by display.
+
+        Returns:
+            A pygame.Surface the size of the whole map containing the static terrain.
+        """
+        terrain_surface = pygame.Surface(
             (self.__map.width * self.__map.tilewidth, self.__map.height * self.__map.tileheight))
         for layer in self.__map.visible_layers:
             if layer.name == "Objects" or layer.name == "ObjectsTop":
@@ -83,23 +205,227 @@ class Map:
             for x, y, gid in layer:
                 tile = self.__map.get_tile_image_by_gid(gid)
                 if tile:
-                    map_surface.blit(
+                    terrain_surface.blit(
                         tile, (x * self.__map.tilewidth, y * self.__map.tileheight))
                     #tile_rect = pygame.Rect(x * self.__map.tilewidth, y * self.__map.tileheight, self.__map.tilewidth, self.__map.tileheight)
-                    #pygame.draw.rect(map_surface, (255, 255, 255), tile_rect, 1) #uncomment this to see the grid
+                    #pygame.draw.rect(terrain_surface, (255, 255, 255), tile_rect, 1) #uncomment this to see the grid
+        return terrain_surface
 
-        for obj in self.__map.objects:
-            map_surface.blit(obj.image, (obj.x, obj.y))
+    def build_water_table(self):
+        """
+        Builds a summed-area table of the tiles covered by the Water or WaterEdges layers,
+        so collide_with_water can count the water tiles of any rectangle with four lookups.
+        The terrain never changes after the map is loaded, so this is only done once in __init__/reinitialize.
 
-        visible_surface = pygame.Surface((self.__screen.get_width(
-        ) - self.__panel_width, self.__screen.get_height() - self.__panel_height))
-        top_left = (self.__scroll_x, self.__scroll_y)
+        Returns:
+            An array of (map width + 1) * (map height + 1) ints, where the entry of (x, y)
+            is the amount of water tiles above and left of tile (x, y).
+        """
+        width, height = self.__map.width, self.__map.height
+        water = bytearray(width * height)
+        for layer in self.__map.visible_layers:
+            if layer.name == "Water" or layer.name == "WaterEdges":
+                for y, tiles in enumerate(layer.data):
+                    for x, gid in enumerate(tiles):
+                        if gid != 0:
+                            water[y * width + x] = 1
+
+        row = width + 1
+        table = array('i', [0]) * (row * (height + 1))
+        for y in range(height):
+            line_sum = 0
+            for x in range(width):
+                line_sum += water[y * width + x]
+                table[(y + 1) * row + x + 1] = table[y * row + x + 1] + line_sum
+        return table
+
+    def display(self):
+        """
+        Displays the map after initialization
+
+        Only the part of the viewport inside the screen's current clipping area is redrawn,
+        this allows redrawing just the dirty regions of the screen.
+        """
+        viewport = self.get_viewport_rect()
+        previous_clip = self.__screen.get_clip()
+        clip = previous_clip.clip(viewport)
+        if clip.width == 0 or clip.height == 0:
+            return
+        self.__screen.set_clip(clip)
+        offset_x = viewport.x - self.__scroll_x
+        offset_y = viewport.y - self.__scroll_y
 
-        # Copy the portion of the map that is visible into the visible surface, then draw the visible surface onto the screen
-        visible_surface.blit(map_surface, (0, 0), pygame.Rect(
-            top_left[0], top_left[1], visible_surface.get_width(), visible_surface.get_height()))
-        self.__screen.blit(
-            visible_surface, (self.__panel_width+1, self.__panel_height+1))
+        # Copy the portion of the pre-rendered terrain that is inside the clipping area
+        self.__screen.blit(self.__terrain_surface, clip.topleft, clip.move(-offset_x, -offset_y))
+
+        # Only the dynamic objects inside the clipping area are drawn, shifted by the scroll position
+        for obj in self.get_objects_in_area(clip.move(-offset_x, -offset_y)):
+            self.__screen.blit(obj.image, (obj.x + offset_x, obj.y + offset_y))
+
+        self.__screen.set_clip(previous_clip)
+
+    def get_viewport_rect(self):
+        """
+        Returns the area of the screen which the map is drawn on.
+
+        Returns:
+            pygame.Rect representing the map's viewport on the screen.
+        """
+        return pygame.Rect(self.__panel_width+1, self.__panel_height+1,
+                           self.__screen.get_width() - self.__panel_width,
+                           self.__screen.get_height() - self.__panel_height)
+
+    def get_objects_in_area(self, area) -> list:
+        """
+        Returns the dynamic objects which are drawn inside the given area of the map
+
+        Only the chunks overlapping the area are looked at, so the cost depends on
+        what is inside the area and not on the amount of objects on the map.
+
+        Args:
+            area: pygame.Rect in map (pixel) coordinates
+
+        Returns:
+            A list of TiledObjects in the order they must be drawn (Objects layer first, then ObjectsTop)
+        """
+        found = set()
+        for chunk in self.__get_chunks(area):
+            for obj in self.__object_chunks.get(chunk, []):
+                if obj not in found and area.colliderect(self.__get_object_rect(obj)):
+                    found.add(obj)
+        return sorted(found, key=self.__draw_order.get)
+
+    def get_dirty_rects(self) -> list:
+        """
+        Returns the screen rects which have to be redrawn since the last call
+
+        The whole viewport is dirty after scrolling or loading the map, otherwise only
+        the rects of the objects which were added or removed and the rects of
+        the prompts drawn in the previous frame are returned.
+
+        Returns:
+            A list of pygame.Rect
+        """
+        viewport = self.get_viewport_rect()
+        scroll = (self.__scroll_x, self.__scroll_y)
+        rects = list(self.__prompt_rects)
+        self.__prompt_rects = []
+        if self.__drawn_scroll != scroll:
+            rects.append(viewport)
+        else:
+            for rect in self.__changed_rects:
+                rects.append(rect.move(viewport.x - self.__scroll_x, viewport.y - self.__scroll_y).clip(viewport))
+        self.__changed_rects = []
+        self.__drawn_scroll = scroll
+        return [rect for rect in rects if rect.width > 0 and rect.height > 0]
+
+    def __get_object_rect(self, obj):
+        """
+        Returns the area of the map (pixel coordinates) covered by the image of the given object
+        """
+        image = obj.image
+        width, height = image.get_size() if image else (obj.width, obj.height)
+        return pygame.Rect(obj.x, obj.y, width, height)
+
+    def __get_chunks(self, rect):
+        """
+        Returns the (chunk_x, chunk_y) coordinates of all the chunks overlapping the given map rect
+        """
+        return [(cx, cy)
+                for cx in range(rect.left // CHUNK_SIZE, (rect.right - 1) // CHUNK_SIZE + 1)
+                for cy in range(rect.top // CHUNK_SIZE, (rect.bottom - 1) // CHUNK_SIZE + 1)]
+
+    def __track_object(self, obj, layer_name):
+        """
+        Registers an object appended to the given layer so it can be drawn and looked up by type,
+        and marks its area as changed
+        """
+        layer_index = [layer.name for layer in self.__map.layers].index(layer_name)
+        self.__draw_sequence += 1
+        self.__draw_order[obj] = (layer_index, self.__draw_sequence)
+        rect = self.__get_object_rect(obj)
+        for chunk in self.__get_chunks(rect):
+            self.__object_chunks.setdefault(chunk, []).append(obj)
+        self.__changed_rects.append(rect)
+        self.__registry.setdefault((layer_name, None), {})[obj] = None
+        self.__registry.setdefault((layer_name, obj.type), {})[obj] = None
+        if layer_name == "Objects":
+            self.__objects_by_id.setdefault(obj.id, obj)
+            if obj.type == "Road":
+                self.__road_network.add_road(obj)
+            self.__capacity_index.add(obj)
+            if obj.type in ANNIVERSARIES and "CreationDate" in obj.properties:
+                self.__scheduler.add(obj, get_creation_day(obj), ANNIVERSARIES[obj.type])
+            for tile in get_outer_circumference(obj):
+                self.__bordering_objects.setdefault(tile, []).append(obj)
+            if obj.type == "ResidentialZone":
+                self.__influencing_sources[obj] = {}
+                for source in self.get_satisfaction_increasers():
+                    if get_distance(obj, source, self) <= source.properties['Radius']:
+                        self.__influenced_zones[source][obj] = None
+                        self.__influencing_sources[obj][source] = None
+            elif is_satisfaction_zone(obj):
+                self.__influenced_zones[obj] = {}
+                for zone in self.get_residential_zones():
+                    if get_distance(zone, obj, self) <= obj.properties['Radius']:
+                        self.__influenced_zones[obj][zone] = None
+                        self.__influencing_sources[zone][obj] = None
+
+    def __untrack_object(self, obj):
+        """
+        Unregisters an object removed from its layer, and marks its area as changed
+        """
+        draw_order = self.__draw_order.pop(obj, None)
+        if draw_order is None:
+            return
+        layer_name = self.__map.layers[draw_order[0]].name
+        for key in ((layer_name, None), (layer_name, obj.type)):
+            registered = self.__registry.get(key)
+            if registered is not None:
+                registered.pop(obj, None)
+        if self.__objects_by_id.get(obj.id) is obj:
+            del self.__objects_by_id[obj.id]
+        if layer_name == "Objects":
+            if obj.type == "Road":
+                self.__road_network.remove_road(obj)
+            self.__scheduler.remove(obj)
+            self.__capacity_index.remove(obj)
+            for tile in get_outer_circumference(obj):
+                bordering = self.__bordering_objects.get(tile)
+                if bordering and obj in bordering:
+                    bordering.remove(obj)
+                    if not bordering:
+                        del self.__bordering_objects[tile]
+            for zone in self.__influenced_zones.pop(obj, ()):
+                self.__influencing_sources[zone].pop(obj, None)
+            for source in self.__influencing_sources.pop(obj, ()):
+                self.__influenced_zones[source].pop(obj, None)
+        rect = self.__get_object_rect(obj)
+        for chunk in self.__get_chunks(rect):
+            chunk_objects = self.__object_chunks.get(chunk)
+            if chunk_objects and obj in chunk_objects:
+                chunk_objects.remove(obj)
+                if not chunk_objects:
+                    del self.__object_chunks[chunk]
+        self.__changed_rects.append(rect)
+
+    def __get_registered(self, layer_name, *types) -> list:
+        """
+        Returns the dynamic objects of the given layer and types from the registry, in the order they were added.
+        Without any type, all the dynamic objects of the layer are returned.
+        """
+        if len(types) <= 1:
+            return list(self.__registry.get((layer_name, types[0] if types else None), ()))
+        objects = []
+        for obj_type in types:
+            objects.extend(self.__registry.get((layer_name, obj_type), ()))
+        return sorted(objects, key=self.__draw_order.__getitem__)
+
+    def get_prompt_rects(self) -> list:
+        """
+        Returns the rects of the prompts which were drawn since the dirty rects were last reported
+        """
+        return list(self.__prompt_rects)
 
     def handle_scroll(self, eventKey):
         """
@@ -147,13 +473,8 @@ class Map:
         can_be_added = True
         objLayer = self.__map.get_layer_by_name("Objects")
 
-        if self.__objcount > 0:
-            objects = self.get_all_objects()
-        else:
-            objects = []
-        for ob in objects:
-            if (self.collide_with_objects(ob, obj)):
-                can_be_added = False
+        if self.is_area_occupied(obj):
+            can_be_added = False
         if (obj.type != "Road" and self.collide_with_water(obj.x, obj.y, obj.width, obj.height)):
             can_be_added = False
 
@@ -161,6 +482,10 @@ class Map:
             if (not init_tree):
                 player.money = player.money - int(obj.properties['Price'])
             objLayer.append(obj)
+            self.__track_object(obj, "Objects")
+            for tile in get_area(obj):
+                self.__occupancy[tile] = obj
+            self.__invalidate_views(get_area(obj))
             if (not loaded_game):
                 self.__objcount += 1
                 self.__map.nextobjectid += 1
@@ -175,33 +500,99 @@ class Map:
         y: yTile coords
         obj_type: Road Type
         """
-        obj_layer = self.__map.get_layer_by_name("Objects")
-        roads = self.get_all_roads()
-        for obj in obj_layer:
-            if (obj.x // (self.get_tile_width())) == x and (obj.y // (self.get_tile_height())) == y and obj.type == obj_type:
-                connected_roads = get_all_connected_roads(obj, roads)
-                connected_objects_temp = list(
-                    set([ob for ob in get_all_neighboring_objects(connected_roads, map)]))
-                connected_objects = []
-                for ob in connected_objects_temp:
-                    if ob.type == "ResidentialZone" or ob.type == "IndustrialZone" or "ServiceZone" == ob.type:
-                        connected_objects.append(ob)
-                R_zone = None
-                for zone in connected_objects:
-                    if zone.type == "ResidentialZone":
-                        R_zone = zone
-                if R_zone and len(connected_objects) <= 1 or not R_zone:
-                    obj_layer.remove(obj)
-                    self.__objcount-=1
-                    del (obj)
-                break
+        obj = self.get_object_at_tile((x, y))
+        if obj and obj.type == obj_type:
+            connected_roads = self.__road_network.get_connected_roads(obj)
+            connected_objects_temp = list(
+                set([ob for ob in get_all_neighboring_objects(connected_roads, map)]))
+            connected_objects = []
+            for ob in connected_objects_temp:
+                if ob.type == "ResidentialZone" or ob.type == "IndustrialZone" or "ServiceZone" == ob.type:
+                    connected_objects.append(ob)
+            R_zone = None
+            for zone in connected_objects:
+                if zone.type == "ResidentialZone":
+                    R_zone = zone
+            if R_zone and len(connected_objects) <= 1 or not R_zone:
+                self.__remove_object(obj)
+                del (obj)
 
     def get_all_roads(self) -> list:
         """
         Returns a list consisting of all the roads created
         """
-        objects = self.get_all_objects()
-        return [obj for obj in objects if obj.type == "Road"]
+        return self.__get_registered("Objects", "Road")
+
+    def get_road_network(self):
+        """
+        Returns the RoadNetwork of all the roads placed on the map
+        """
+        return self.__road_network
+
+    def get_scheduler(self):
+        """
+        Returns the EventScheduler of the anniversaries of the objects placed on the map
+        """
+        return self.__scheduler
+
+    def get_distance_cache(self):
+        """
+        Returns the DistanceCache of the distances between the objects placed on the map
+        """
+        return self.__distance_cache
+
+    def get_capacity_index(self):
+        """
+        Returns the CapacityIndex of the zones placed on the map which have free seats
+        """
+        return self.__capacity_index
+
+    def get_objects_bordering_tile(self, coords) -> list:
+        """
+        Returns the dynamic objects (Objects layer) whose outer circumference contains the given tile,
+        eg: the zones a road placed on that tile leads to.
+
+        Args:
+            coords: (x, y) tile coordinates.
+
+        Returns:
+            A list of TiledObjects in the order they were added to the map.
+        """
+        return list(self.__bordering_objects.get(coords, ()))
+
+    def get_zones_influenced_by(self, source) -> list:
+        """
+        Returns the ResidentialZones within the Radius of the given satisfaction increaser.
+        Sources which are not placed on the map are measured against all the ResidentialZones.
+
+        Args:
+            source: TiledObject representing a Stadium, PoliceDepartment or Forest.
+
+        Returns:
+            A list of ResidentialZones in the order they were added to the map.
+        """
+        zones = self.__influenced_zones.get(source)
+        if zones is None:
+            return [zone for zone in self.get_residential_zones()
+                    if distance_between_two(zone, source) <= source.properties['Radius']]
+        return list(zones)
+
+    def get_sources_influencing(self, zone) -> list:
+        """
+        Returns the satisfaction increasers which have the given ResidentialZone within their Radius.
+        Zones which are not placed on the map are measured against all the satisfaction increasers.
+
+        Args:
+            zone: TiledObject representing a ResidentialZone.
+
+        Returns:
+            A list of Stadiums, PoliceDepartments and Forests in the order they were added to the map.
+        """
+        sources = self.__influencing_sources.get(zone)
+        if sources is None:
+            return [source for source in self.get_satisfaction_increasers()
+                    if distance_between_two(zone, source) <= source.properties['Radius']]
+        return list(sources)
 
     def get_clicked_tile(self, mousePos) -> tuple:
         """
@@ -392,26 +783,131 @@ class Map:
         Returns:
             True if collision detected with water or water edges, False otherwise.
         """
-        for layer in self.__map.visible_layers:
-            if layer.name == "Water" or layer.name == "WaterEdges":
-                # Calculate the tile coordinates for the object's boundaries
-                tile_x_start = int(obj_x_coord / self.__map.tilewidth)
-                tile_x_end = int((obj_x_coord + obj_width) /
-                                 self.__map.tilewidth)
-                tile_y_start = int(obj_y_coord / self.__map.tileheight)
-                tile_y_end = int((obj_y_coord + obj_height) /
-                                 self.__map.tileheight)
-
-                # Check if any tile within the object's boundaries is a water tile or water edges tile
-                for y in range(tile_y_start, tile_y_end):
-                    for x in range(tile_x_start, tile_x_end):
-                        if layer.data[y][x] != 0:
-                            # Collision detected with water or water edges
-                            return True
-
-        # No collision with water or water edges
+        # Calculate the tile coordinates for the object's boundaries, clamped to the map
+        tile_x_start = max(int(obj_x_coord / self.__map.tilewidth), 0)
+        tile_x_end = min(int((obj_x_coord + obj_width) / self.__map.tilewidth), self.__map.width)
+        tile_y_start = max(int(obj_y_coord / self.__map.tileheight), 0)
+        tile_y_end = min(int((obj_y_coord + obj_height) / self.__map.tileheight), self.__map.height)
+        if tile_x_start >= tile_x_end or tile_y_start >= tile_y_end:
+            return False
+
+        # Amount of water or water edges tiles within the object's boundaries
+        row = self.__map.width + 1
+        table = self.__water_table
+        water_tiles = (table[tile_y_end * row + tile_x_end] - table[tile_y_start * row + tile_x_end]
+                       - table[tile_y_end * row + tile_x_start] + table[tile_y_start * row + tile_x_start])
+        return water_tiles != 0
+
+    def get_object_at_tile(self, coords):
+        """
+        Returns the dynamic object (Objects layer) which occupies the given tile.
+
+        Args:
+            coords: (x, y) tile coordinates.
+
+        Returns:
+            The TiledObject occupying the tile, or None if the tile is free.
+        """
+        return self.__occupancy.get(coords)
+
+    def is_area_occupied(self, obj) -> bool:
+        """
+        Checks if any tile of the given object's area is already occupied by a dynamic object.
+
+        Args:
+            obj: The TiledObject to check.
+
+        Returns:
+            True if the object would overlap another object, False otherwise.
+        """
+        for tile in get_area(obj):
+            if tile in self.__occupancy:
+                return True
         return False
 
+    def is_view_blocked(self, forest, zone) -> bool:
+        """
+        Checks if an object (except roads) stands between the Forest and the ResidentialZone,
+        same as is_there_a_blocker_between with all the dynamic objects of the map.
+
+        The view corridor of a pair is only calculated once, and the result is kept
+        until an object is added to or removed from one of the tiles of the corridor.
+
+        Args:
+            forest: Forest TiledObject
+            zone: ResidentialZone TiledObject
+
+        Returns:
+            True if the view is blocked, False otherwise.
+        """
+        if forest not in self.__draw_order or zone not in self.__draw_order:
+            # Not placed on the map (anymore), nothing to keep
+            return is_there_a_blocker_between(forest, zone, self.get_all_objects())
+        key = (forest, zone)
+        view = self.__views.get(key)
+        if view is None:
+            view = [get_view_corridor(forest, zone), None]
+            self.__views[key] = view
+            for tile in view[0]:
+                self.__views_by_tile.setdefault(tile, set()).add(key)
+            self.__views_by_object.setdefault(forest, set()).add(key)
+            self.__views_by_object.setdefault(zone, set()).add(key)
+        if view[1] is None:
+            view[1] = False
+            for tile in view[0]:
+                occupant = self.__occupancy.get(tile)
+                if occupant is not None and occupant.type != 'Road':
+                    view[1] = True
+                    break
+        return view[1]
+
+    def __invalidate_views(self, tiles):
+        """
+        Marks the views passing any of the given tiles to be checked again
+        """
+        for tile in tiles:
+            for key in self.__views_by_tile.get(tile, ()):
+                self.__views[key][1] = None
+
+    def __forget_views(self, obj):
+        """
+        Removes the views the given (removed) object was part of
+        """
+        for key in self.__views_by_object.pop(obj, ()):
+            view = self.__views.pop(key, None)
+            if view is None:
+                continue
+            for tile in view[0]:
+                keys = self.__views_by_tile.get(tile)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self.__views_by_tile[tile]
+            for other in key:
+                if other is not obj and other in self.__views_by_object:
+                    self.__views_by_object[other].discard(key)
+
+    def __remove_object(self, obj) -> bool:
+        """
+        Removes a dynamic object from the Objects layer and from the map's indexes.
+
+        Returns:
+            True if the object was on the layer and got removed, False otherwise.
+        """
+        obj_layer = self.__map.get_layer_by_name("Objects")
+        if obj not in obj_layer:
+            return False
+        obj_layer.remove(obj)
+        self.__untrack_object(obj)
+        self.__distance_cache.evict(obj)
+        for tile in get_area(obj):
+            if self.__occupancy.get(tile) is obj:
+                del self.__occupancy[tile]
+        self.__invalidate_views(get_area(obj))
+        self.__forget_views(obj)
+        self.__objcount -= 1
+        return True
+
     def get_all_objects(self):
         """
         Gets the list of all Dynamic objects located on the Objects layer of the map.
@@ -419,10 +915,7 @@ class Map:
         Returns:
             A list of all Dynamic Tiled objects in the map. If no objects are present, an empty list is returned.
         """
-        if self.__objcount == 0:
-            return []
-        else:
-            return [obj for obj in self.__map.get_layer_by_name("Objects") if obj.properties['Placeholder'] == 'dynamic']
+        return self.__get_registered("Objects")
 
     def get_buildings(self):
         """
@@ -433,7 +926,7 @@ class Map:
             A list of all Tiled Objects located on the ObjectsTop layer of the map, if no objects are present,
             an empty list is returned.
         """
-        return [obj for obj in self.__map.get_layer_by_name("ObjectsTop") if obj.properties['Placeholder'] == 'dynamic']
+        return self.__get_registered("ObjectsTop")
 
     # def set_all_objects(self, objs):
 
@@ -444,10 +937,7 @@ class Map:
         Returns:
             A list of all Tiled objects representing ResidentialZones
         """
-        if self.__objcount == 0:
-            return []
-        else:
-            return [obj for obj in self.get_all_objects() if obj.type == "ResidentialZone"]
+        return self.__get_registered("Objects", "ResidentialZone")
 
     def get_work_zones(self):
         """
@@ -456,11 +946,7 @@ class Map:
         Returns:
             A list of all Tiled objects representing the IndustrialZones and ServiceZones
         """
-        if self.__objcount == 0:
-            return []
-        else:
-            return [obj for obj in self.get_all_objects()
-                    if obj.type == "IndustrialZone" or obj.type == "ServiceZone"]
+        return self.__get_registered("Objects", "IndustrialZone", "ServiceZone")
 
     def get_satisfaction_increasers(self) -> list:
         """
@@ -472,19 +958,13 @@ class Map:
         Returns:
         a List full of Dynamic TiledObjects 
         """
-        if self.__objcount == 0:
-            return []
-        else:
-            return [obj for obj in self.get_all_objects() if obj.type == "Stadium" or obj.type == "PoliceDepartment" or obj.type == "Forest"]
+        return self.__get_registered("Objects", "Stadium", "PoliceDepartment", "Forest")
 
     def get_zone_by_id(self, id):
         """
         Returns a Zone based on the given id
         """
-        for obj in self.get_all_objects():
-            if obj.id == id:
-                return obj
-        return None
+        return self.__objects_by_id.get(id)
 
     def add_building(self, building):
         """
@@ -496,6 +976,7 @@ class Map:
         """
         objLayer = self.__map.get_layer_by_name("ObjectsTop")
         objLayer.append(building)
+        self.__track_object(building, "ObjectsTop")
         
     def create_button(self, font, text, text_padding, prompt_x, prompt_y, prompt_width, prompt_height,
     button_width, button_height, p_m=1, b_m=2):
@@ -519,7 +1000,7 @@ class Map:
         button_x = prompt_x + (prompt_width - button_width) // 2
         button_y = prompt_y + prompt_height + text_padding * p_m - button_height * b_m
         button = pygame.draw.rect(self.__screen, (100, 100, 100), (button_x, button_y, button_width, button_height))
-        button_text = font.render(text, True, (255, 255, 255))
+        button_text = TextCache.render(font, text, True, (255, 255, 255))
         button_text_rect = button_text.get_rect(center=(button_x + button_width // 2, button_y + button_height // 2))
         self.__screen.blit(button_text, button_text_rect)
         return button
@@ -539,11 +1020,12 @@ class Map:
         prompt_width, prompt_height = 180, 180
         prompt_x = mouse_x - prompt_width // 2
         prompt_y = mouse_y - prompt_height // 2
+        self.__prompt_rects.append(pygame.Rect(prompt_x, prompt_y, prompt_width, prompt_height))
         pygame.draw.rect(self.__screen, (220, 220, 220),
                          (prompt_x, prompt_y, prompt_width, prompt_height))
         pygame.draw.rect(self.__screen, (150, 150, 150),
                          (prompt_x, prompt_y, prompt_width, prompt_height), 2)
-        font = pygame.font.Font(None, 24)
+        font = TextCache.get_font(24)
         line_height = font.get_linesize()
         text_padding = 10
         
@@ -558,7 +1040,7 @@ class Map:
                 sat = 0.0
                 can_classify = True
             else:
-                sat = (sum(c.satisfaction for c in zone.properties['Citizens']) / amount_citizens) if amount_citizens != 0 else 0.0
+                sat = get_zone_satisfaction(zone) if amount_citizens != 0 else 0.0
                 sat = '{:.2f}'.format(round(sat, 2))
                 can_upgrade = True
 
@@ -578,7 +1060,7 @@ class Map:
             ]
             
         for i, line in enumerate(lines):
-            text = font.render(line, True, (0, 0, 0))
+            text = TextCache.render(font, line, True, (0, 0, 0))
             text_rect = text.get_rect(center=(
                 prompt_x + prompt_width // 2, prompt_y + line_height * (i + 1) + text_padding))
             self.__screen.blit(text, text_rect)
@@ -609,9 +1091,7 @@ class Map:
         """
         Checks if the given object on the object layer exists
         """
-        if (object in self.get_all_objects()):
-            return True
-        return False
+        return object in self.__registry.get(("Objects", None), ())
     
     def draw_confirm_prompt_to_demolish(self,pos,zone):
         """
@@ -625,11 +1105,12 @@ class Map:
         prompt_width, prompt_height = 150, 150
         prompt_x = mouse_x - prompt_width // 2
         prompt_y = mouse_y - prompt_height // 2
+        self.__prompt_rects.append(pygame.Rect(prompt_x, prompt_y, prompt_width, prompt_height))
         pygame.draw.rect(self.__screen, (220, 220, 220),
                          (prompt_x, prompt_y, prompt_width, prompt_height))
         pygame.draw.rect(self.__screen, (150, 150, 150),
                          (prompt_x, prompt_y, prompt_width, prompt_height), 2)
-        font = pygame.font.Font(None, 24)
+        font = TextCache.get_font(24)
         line_height = font.get_linesize()
         text_padding = 10
         lines = [
@@ -639,7 +1120,7 @@ class Map:
             f"Are you sure?",
         ]
         for i, line in enumerate(lines):
-            text = font.render(line, True, (0, 0, 0))
+            text = TextCache.render(font, line, True, (0, 0, 0))
             text_rect = text.get_rect(center=(prompt_x + prompt_width // 2, prompt_y + line_height * (i + 1) + text_padding))
             self.__screen.blit(text, text_rect) 
         
@@ -657,22 +1138,14 @@ class Map:
         """
         try:
             if (obj.type == 'PoliceDepartment' or obj.type == 'Stadium' or obj.type == 'Forest'):
-                obj_layer = self.__map.get_layer_by_name("Objects")
-                if (obj in obj_layer):
-                    obj_layer.remove(obj)
-                    self.__objcount -= 1
+                influenced_zones = self.get_zones_influenced_by(obj)
+                if (self.__remove_object(obj)):
                     handle_satisfaction_zone_removal(
-                        obj, self.get_residential_zones())
+                        obj, influenced_zones)
             elif obj.type == 'Road':
-                obj_layer = self.__map.get_layer_by_name("Objects")
-                if (obj in obj_layer):
-                    obj_layer.remove(obj)
-                    self.__objcount -= 1
+                self.__remove_object(obj)
             elif (len(obj.properties['Citizens']) == 0):
-                obj_layer = self.__map.get_layer_by_name("Objects")
-                if (obj in obj_layer):
-                    obj_layer.remove(obj)
-                    self.__objcount-=1
+                self.__remove_object(obj)
             del (obj)
         except Exception as e:
             print(f"Fatal error to reclassify {obj}. Error: {e}")
@@ -688,6 +1161,7 @@ class Map:
         """
         obj_layer = self.__map.get_layer_by_name("ObjectsTop")
         obj_layer.remove(db)
+        self.__untrack_object(db)
         del (db)
     
     def get_yet_to_occupy_homes(self) -> list:
@@ -697,8 +1171,7 @@ class Map:
         Returns:
         list of ResidentialZones with citizens less than its capacity
         """
-        return [RZone for RZone in self.get_residential_zones() if
-                  len(RZone.properties['Citizens']) < RZone.properties['Capacity']]
+        return sorted(self.__capacity_index.get_zones("ResidentialZone"), key=self.__draw_order.__getitem__)
         
     def get_service_zones(self):
         """
@@ -707,11 +1180,7 @@ class Map:
         Returns:
             service zones
         """
-        if self.__objcount == 0:
-            return []
-        else:
-            return [obj for obj in self.get_all_objects()
-                    if obj.type == "ServiceZone"]
+        return self.__get_registered("Objects", "ServiceZone")
 
     def get_industrial_zones(self):
         """
@@ -720,18 +1189,10 @@ class Map:
         Returns:
             service zones
         """
-        if self.__objcount == 0:
-            return []
-        else:
-            return [obj for obj in self.get_all_objects()
-                    if obj.type == "IndustrialZone"]
+        return self.__get_registered("Objects", "IndustrialZone")
 
     def get_roads(self):
-        if self.__objcount == 0:
-            return []
-        else:
-            return [obj for obj in self.get_all_objects()
-                    if obj.type == "Road"]
+        return self.__get_registered("Objects", "Road")
 
     def add_disaster_to_map(self, disaster):
         """
@@ -742,12 +1203,13 @@ class Map:
         """
         objLayer = self.__map.get_layer_by_name("ObjectsTop")
         objLayer.append(disaster)
+        self.__track_object(disaster, "ObjectsTop")
 
     def get_all_disasters(self) -> list:
         """
         Returns all active disasters currently happening
         """
-        return [obj for obj in self.__map.get_layer_by_name("ObjectsTop") if obj.type == 'Disaster' and obj.properties['Placeholder'] == 'dynamic']
+        return self.__get_registered("ObjectsTop", "Disaster")
     
     def get_scroll_coordinates(self) -> list:
         """
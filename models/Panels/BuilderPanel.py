@@ -1,5 +1,6 @@
 import pygame
 from models.Panels.Panel import Panel
+from models.AssetCache import AssetCache
 
 
 class BuilderPanel(Panel):
@@ -12,6 +13,7 @@ class BuilderPanel(Panel):
         width (int): The width of the panel.
         height (int): The height of the panel.
         icons (list): A list to store the loaded icon images.
+        icon_filenames (list): The filenames the icons were loaded from, None until they are loaded.
         icon_size (int): The size of each icon image.
         icon_spacing (int): The spacing between each icon.
         num_icons_per_row (int): The number of icons to display per row.
@@ -29,6 +31,7 @@ class BuilderPanel(Panel):
         """
         super().__init__(x, y, width, height)
         self.icons = []
+        self.icon_filenames = None
         self.icon_size = 70
         self.icon_spacing = 10
         self.num_icons_per_row = 1
@@ -36,24 +39,29 @@ class BuilderPanel(Panel):
     def load_icons(self, icon_filenames):
         """
         Load the icon images and store them in self.icons.
+        The images are served by the AssetCache, so they are only read from disk once.
         
         Args:
             icon_filenames (list): A list of filenames of the icon images to load.
         """
         for filename in icon_filenames:
-            icon_image = pygame.image.load(filename)
+            icon_image = AssetCache.get_image(filename)
             self.icons.append(icon_image)
 
     def display_assets(self, screen, icon_filenames):
         """
         Display the loaded icon images on the BuilderPanel.
+        The icons are only loaded on the first call (or when the filenames change).
         
         Args:
             screen (pygame.Surface): The surface to blit the images on.
             icon_filenames (tuple): A tuple of filenames of the icon images to display.
         """
-        self.icons = []
-        self.load_icons([f[0] for f in icon_filenames])
+        filenames = [f[0] for f in icon_filenames]
+        if filenames != self.icon_filenames:
+            self.icons = []
+            self.load_icons(filenames)
+            self.icon_filenames = filenames
 
         # Calculate the size and position of the table cells
         cell_width = self.icon_size + self.icon_spacing
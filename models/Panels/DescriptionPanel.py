@@ -1,5 +1,6 @@
 import pygame
 from models.Panels.Panel import Panel
+from models.TextCache import TextCache
 
 
 class DescriptionPanel(Panel):
@@ -25,8 +26,8 @@ class DescriptionPanel(Panel):
             time (str): The time to display.
             text_position (tuple): The position of the text (x, y).
         """
-        font = pygame.font.Font(None, 21)
-        text_surface = font.render(time, True, (0, 0, 0))
+        font = TextCache.get_font(21)
+        text_surface = TextCache.render(font, time, True, (0, 0, 0))
         screen.blit(text_surface, text_position)
 
     def handle_game_speed_click(self, event, timer, game_speed_multiplier):
@@ -78,8 +79,8 @@ class DescriptionPanel(Panel):
         pygame.draw.rect(screen, (128, 128, 128), (label_x, label_y,
                          button_width * 3 + button_spacing * 2, button_height))
 
-        font = pygame.font.Font(None, 21)
-        label_text = font.render("Game Speed:", True, (0, 0, 0))
+        font = TextCache.get_font(21)
+        label_text = TextCache.render(font, "Game Speed:", True, (0, 0, 0))
         screen.blit(label_text, (label_x + 10, label_y + 14))
 
         # Red, Yellow, Green for buttons
@@ -92,7 +93,7 @@ class DescriptionPanel(Panel):
             button_rect = pygame.Rect(
                 button_x, button_y, button_width, button_height)
             pygame.draw.rect(screen, button_colors[i], button_rect)
-            button_text = font.render(button_labels[i], True, (0, 0, 0))
+            button_text = TextCache.render(font, button_labels[i], True, (0, 0, 0))
             button_text_rect = button_text.get_rect(center=button_rect.center)
             screen.blit(button_text, button_text_rect)
             button_x += button_width + button_spacing
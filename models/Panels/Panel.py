@@ -1,4 +1,5 @@
 import pygame
+from models.TextCache import TextCache
 
 
 class Panel:
@@ -10,6 +11,7 @@ class Panel:
         y (int): The y-coordinate of the panel's position.
         width (int): The width of the panel.
         height (int): The height of the panel.
+        last_state: The state the panel content was last reported with, used to detect changes.
     """
 
     def __init__(self, x, y, width, height):
@@ -26,6 +28,7 @@ class Panel:
         self.y = y
         self.width = width
         self.height = height
+        self.last_state = None
 
     def display(self, screen, font_size, text_position, color, text, text_color):
         """
@@ -41,10 +44,34 @@ class Panel:
         """
         pygame.draw.rect(
             screen, color, (self.x, self.y, self.width, self.height))
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(text, True, text_color)
+        font = TextCache.get_font(font_size)
+        text_surface = TextCache.render(font, text, True, text_color)
         screen.blit(text_surface, text_position)
 
+    def get_rect(self):
+        """
+        Get the area of the screen covered by the panel.
+
+        Returns:
+            pygame.Rect: The rectangle of the panel.
+        """
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def get_dirty_rects(self, state) -> list:
+        """
+        Reports the area of the panel as dirty if its content changed since the last call.
+
+        Args:
+            state: Any comparable value describing what the panel shows (eg: its texts).
+
+        Returns:
+            list: A list containing the panel's rect if the state changed, otherwise an empty list.
+        """
+        if state == self.last_state:
+            return []
+        self.last_state = state
+        return [self.get_rect()]
+
     def get_width(self):
         """
         Get the width of the panel.
@@ -0,0 +1,211 @@
+from collections import deque
+
+# Offsets of the tiles a road connects to: left, right, up, down
+NEIGHBOUR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class RoadNetwork:
+    """
+    A graph of the roads of the map, indexed by the tile each road is placed on.
+
+    Two roads are connected when they are placed on tiles next to each other (left, right, up or down).
+    The connected road networks (components) are kept up to date as roads are added and removed:
+    adding a road merges the components around it, removing one only searches the component it belonged to
+    to find out if it got split. So finding the roads connected to a road does not need any search.
+
+    Attributes:
+        roads (dict): A dictionary of (tile_x, tile_y) to the road (TiledObject) placed on that tile.
+        component_ids (dict): A dictionary of road to the id of the component it belongs to.
+        components (dict): A dictionary of component id to the set of roads in that component.
+        next_component_id (int): The id given to the next new component.
+
+    Methods:
+        add_road(road): Adds a road to the network.
+        remove_road(road): Removes a road from the network.
+        get_road_at(tile): Returns the road placed on the given tile.
+        get_neighbouring_roads(road): Returns the roads placed next to the given road.
+        get_connected_roads(road): Returns all the roads connected to the given road.
+        get_component_id(road): Returns the id of the component the given road belongs to.
+        get_component_ids_at(tiles): Returns the ids of the components with a road on the given tiles.
+    """
+
+    def __init__(self, roads=()):
+        """
+        Initializes a RoadNetwork object.
+
+        Args:
+            roads (list): Optional list of roads (TiledObject) to start the network with.
+        """
+        self.roads = {}
+        self.component_ids = {}
+        self.components = {}
+        self.next_component_id = 1
+        for road in roads:
+            self.add_road(road)
+
+    def add_road(self, road):
+        """
+        Adds a road to the network, the first road added on a tile is kept.
+        The components next to the road are merged into the largest one.
+
+        Args:
+            road (TiledObject): The road to add.
+        """
+        tile = get_road_tile(road)
+        if tile in self.roads:
+            return
+        self.roads[tile] = road
+        neighbour_ids = {self.component_ids[neighbour] for neighbour in self.get_neighbouring_roads(road)}
+        if not neighbour_ids:
+            component_id = self.__new_component()
+        else:
+            component_id = max(neighbour_ids, key=lambda i: (len(self.components[i]), -i))
+            neighbour_ids.remove(component_id)
+            for merged_id in neighbour_ids:
+                merged = self.components.pop(merged_id)
+                for merged_road in merged:
+                    self.component_ids[merged_road] = component_id
+                self.components[component_id].update(merged)
+        self.component_ids[road] = component_id
+        self.components[component_id].add(road)
+
+    def remove_road(self, road):
+        """
+        Removes a road from the network.
+        If the road connected several roads, its component is searched again and split into the parts left.
+
+        Args:
+            road (TiledObject): The road to remove.
+        """
+        tile = get_road_tile(road)
+        if self.roads.get(tile) is not road:
+            return
+        del self.roads[tile]
+        component_id = self.component_ids.pop(road)
+        component = self.components[component_id]
+        component.discard(road)
+        if not component:
+            del self.components[component_id]
+            return
+
+        neighbours = self.get_neighbouring_roads(road)
+        if len(neighbours) <= 1:
+            return
+        # The first part keeps the id of the component, the others get new ids
+        del self.components[component_id]
+        searched = set()
+        for neighbour in neighbours:
+            if neighbour in searched:
+                continue
+            part = self.__search(neighbour)
+            searched.update(part)
+            if component_id is None:
+                component_id = self.__new_component()
+            self.components[component_id] = part
+            for part_road in part:
+                self.component_ids[part_road] = component_id
+            component_id = None
+
+    def get_road_at(self, tile):
+        """
+        Returns the road placed on the given tile.
+
+        Args:
+            tile (tuple): (x, y) tile coordinates.
+
+        Returns:
+            The road (TiledObject), or None if there is no road on the tile.
+        """
+        return self.roads.get(tile)
+
+    def get_neighbouring_roads(self, road) -> list:
+        """
+        Returns the roads placed next to the given road (left, right, up or down).
+
+        Args:
+            road (TiledObject): The road.
+
+        Returns:
+            list: The neighbouring roads.
+        """
+        x, y = get_road_tile(road)
+        neighbours = []
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            neighbour = self.roads.get((x + dx, y + dy))
+            if neighbour is not None:
+                neighbours.append(neighbour)
+        return neighbours
+
+    def get_connected_roads(self, road) -> set:
+        """
+        Returns all the roads connected to the given road, the road itself included.
+
+        Args:
+            road (TiledObject): The starting road.
+
+        Returns:
+            set: The roads of the connected road network, only the road itself if it is not in the network.
+        """
+        component_id = self.component_ids.get(road)
+        if component_id is None:
+            return {road}
+        return set(self.components[component_id])
+
+    def get_component_id(self, road):
+        """
+        Returns the id of the component (connected road network) the given road belongs to.
+
+        Args:
+            road (TiledObject): The road.
+
+        Returns:
+            int: The component id, or None if the road is not in the network.
+        """
+        return self.component_ids.get(road)
+
+    def get_component_ids_at(self, tiles) -> set:
+        """
+        Returns the ids of the components which have a road on any of the given tiles,
+        eg: the tiles around a zone give the road networks the zone is connected to.
+
+        Args:
+            tiles (list): A list of (x, y) tile coordinates.
+
+        Returns:
+            set: The component ids.
+        """
+        component_ids = set()
+        for tile in tiles:
+            road = self.roads.get(tile)
+            if road is not None:
+                component_ids.add(self.component_ids[road])
+        return component_ids
+
+    def __new_component(self) -> int:
+        """
+        Creates an empty component and returns its id
+        """
+        component_id = self.next_component_id
+        self.next_component_id += 1
+        self.components[component_id] = set()
+        return component_id
+
+    def __search(self, road) -> set:
+        """
+        Returns the roads connected to the given road with a breadth-first search over the road tiles
+        """
+        visited = {road}
+        queue = deque([road])
+        while queue:
+            for neighbour in self.get_neighbouring_roads(queue.popleft()):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    queue.append(neighbour)
+        return visited
+
+
+def get_road_tile(road) -> tuple:
+    """
+    Returns the (x, y) coordinates of the tile the given road is placed on.
+    """
+    return (int(road.x // road.parent.tilewidth), int(road.y // road.parent.tileheight))
@@ -0,0 +1,200 @@
+import datetime
+import random
+from models.Map import Map
+from models.Player import Player
+from models.Timer import Timer
+from models.Citizen import Citizen
+from models.EventScheduler import QUARTER
+from models.JobMatcher import JobMatcher
+from models.Utils import *
+
+# Revenue a WorkZone makes per day for each of its workers
+MONEY_PER_DAY = 20
+
+
+class SimulationEngine:
+    """
+    Runs the simulation of the city (citizens, expenses, revenue, forests and disasters)
+    independently of the display and the event loop.
+
+    The time only moves in fixed steps of a day: the game calls update every frame with the amount of days
+    which elapsed since the previous frame (Timer.accumulate, 0 while paused), while a headless engine
+    (eg: balancing runs, tests) advances the time itself with step_day, step_month and run_until.
+    The work which is not driven by the calendar (the initial citizens moving in and the disaster checks)
+    runs on every update, so it still happens every frame, even while the game is paused.
+
+    Attributes:
+        map (Map): The map holding the objects of the city.
+        player (Player): The player paying the expenses and receiving the taxes.
+        timer (Timer): The timer of the game.
+        allocated_tax (float): The tax rate applied to the revenue of the WorkZones.
+        initial_citizens (list): The citizens waiting for the first ResidentialZone to move into.
+        day (int): The day of the month the daily logic last ran on.
+        month (int): The month the monthly logic last ran on.
+        game_start_time (str): The date the game started on, formatted as 'YYYY-MM-DD'.
+        randomizer_for_disaster (bool): Whether a random disaster is due, decided on the yearly pass of the forests.
+        rng (random.Random): The random number generator of the simulation (arrivals, satisfactions, forests,
+            disasters and job matching), the random module is left untouched.
+        job_matcher (JobMatcher): Gives a job to the unemployed citizens every month, drawing from rng.
+
+    Methods:
+        new_game(): Creates the initial citizens and forests, then starts the simulation.
+        start(initial_citizens=None): Starts the simulation from the current time of the timer.
+        update(days=0): Runs the per-frame logic, advancing the time by the given amount of days.
+        step_day(): Advances the time by one day and runs the simulation.
+        step_month(): Advances the time day by day until the month changes.
+        run_until(date): Advances the time day by day until the given date.
+    """
+
+    def __init__(self, map=None, player=None, timer=None, allocated_tax=0.05, seed=None):
+        """
+        Initializes a SimulationEngine object, any missing part is created for a headless simulation.
+
+        Args:
+            map (Map): Optional map of the city. Default: a new headless Map
+            player (Player): Optional player. Default: a new Player with 100000 funds
+            timer (Timer): Optional timer. Default: a new Timer
+            allocated_tax (float): Optional tax rate. Default: 0.05
+            seed: Optional seed of the random number generator of the simulation, for reproducible runs.
+                Default: None (not reproducible)
+        """
+        self.map = map if map is not None else Map(None, 0, 0, headless=True)
+        self.player = player if player is not None else Player("HUMAN", 100000)
+        self.timer = timer if timer is not None else Timer(1, 200)
+        self.allocated_tax = allocated_tax
+        self.initial_citizens = []
+        self.rng = random.Random(seed)
+        self.job_matcher = JobMatcher(self.rng)
+        self.start()
+
+    def new_game(self):
+        """
+        Creates the initial citizens and the random initial forests, then starts the simulation.
+        The map, player, timer and Citizen are expected to be reinitialized already.
+        """
+        self.initial_citizens = [Citizen(self.rng) for i in range(1, 11)]
+        randomize_initial_forests(self.map, self.player, self.timer, self.rng)
+        self.start()
+
+    def start(self, initial_citizens=None):
+        """
+        Starts the simulation from the current time of the timer, eg: after a game was loaded.
+
+        Args:
+            initial_citizens (list): Optional list of citizens waiting for a home. Default: None (kept as they are)
+        """
+        if initial_citizens is not None:
+            self.initial_citizens = initial_citizens
+        self.day = self.timer.get_current_time().day
+        self.month = self.timer.get_current_time().month
+        self.game_start_time = self.timer.get_current_date_str()
+        self.randomizer_for_disaster = False
+
+    def update(self, days=0):
+        """
+        Runs the simulation logic of one frame: moves the initial citizens in, advances the time
+        by the given amount of days (fixed steps of the timer) running the monthly logic when the month changed
+        and the daily logic when the day changed, then handles the disasters.
+
+        Args:
+            days (int): Optional amount of days to advance the time by, eg: the result of Timer.accumulate. Default: 0
+        """
+        self.__handle_initial_citizens()
+        for i in range(days):
+            self.timer.step()
+            if (self.timer.get_current_time().month != self.month):
+                self.__handle_month()
+                self.month = self.timer.get_current_time().month
+            if (self.timer.get_current_time().day != self.day):
+                self.__handle_day()
+                self.day = self.timer.get_current_time().day
+        handle_disaster_logic(self.map, self.timer)
+        handle_disaster_random_logic(self.map, self.timer.get_current_date_str(), self.randomizer_for_disaster, self.rng)
+
+    def step_day(self):
+        """
+        Advances the time by one day (a fixed step of the timer) and runs the simulation.
+        """
+        self.update(1)
+
+    def step_month(self):
+        """
+        Advances the time day by day until the month changes.
+        """
+        month = self.timer.get_current_time().month
+        while self.timer.get_current_time().month == month:
+            self.step_day()
+
+    def run_until(self, date):
+        """
+        Advances the time day by day until the given date is reached.
+
+        Args:
+            date: The date to stop at, a datetime.date or a string formatted as 'YYYY-MM-DD'.
+        """
+        if isinstance(date, str):
+            date = self.timer.get_timer_from_str(date)
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        while self.timer.get_current_time().date() < date:
+            self.step_day()
+
+    def __handle_initial_citizens(self):
+        """
+        Moves the initial citizens into the first ResidentialZone once it exists
+        """
+        if (len(self.initial_citizens) != 0):  # Initial edge case
+            if len(self.map.get_residential_zones()) != 0:
+                first_R_Zone = self.map.get_residential_zones()[0]
+                for c in self.initial_citizens:
+                    assign_to_residential_zone(c, first_R_Zone, self.map)
+                    handle_citizen_addition_satisfaction(c, self.map)
+                    self.initial_citizens.remove(c)
+
+    def __handle_month(self):
+        """
+        Monthly logic: new citizens arrive, the unemployed citizens get jobs, and bankruptcy lowers the satisfaction
+        """
+        add_citizens_to_game(self.map, self.rng)
+        self.job_matcher.match(self.map)
+        if (self.player.money <= 0):
+            Citizen.reduce_satisfaction(0.35)
+
+    def __handle_day(self):
+        """
+        Daily logic: revenue of the WorkZones, then the expenses, taxes and forest growth of the objects
+        which have an anniversary today (only those are taken from the scheduler of the map)
+        """
+        for zone in self.map.get_work_zones():
+            # IncreaseRevenue of each WorkZone per day
+            total_citizens = len(zone.properties['Citizens'])
+            if (total_citizens != 0):
+                zone.properties['Revenue'] += (MONEY_PER_DAY * total_citizens)
+
+        for obj, period in self.map.get_scheduler().get_due(self.timer.get_current_day()):
+            # Deduct MaintenanceFees for any Zone from Player
+            if period == QUARTER:
+                self.player.money -= obj.properties['MaintenanceFee']
+
+            # Handle ServiceBuildings,Roads Expense
+            elif obj.type == "Road" or obj.type == "PoliceDepartment" or obj.type == "Stadium":
+                self.player.money -= obj.properties['MaintenanceFee']
+
+            # Handle Forest Expense and Grow
+            elif obj.type == "Forest":
+                self.randomizer_for_disaster = has_random_years_passed_from_start(
+                    self.game_start_time, self.timer, self.rng)
+                if obj.properties['Mature']:
+                    self.player.money -= obj.properties['MaintenanceFee']
+                else:
+                    obj.properties['Year'] += 1
+                    obj.properties['Satisfaction'] += 0.03
+                    handle_tree_growth(self.map, obj)
+                    if obj.properties['Year'] == 10:
+                        obj.properties['Mature'] = True
+
+            # Get revenue (TAX) from WorkZone to Player
+            elif (len(obj.properties['Citizens']) == 0):
+                revenue = obj.properties['Revenue'] * self.allocated_tax
+                self.player.money += revenue
+                obj.properties['Revenue'] = 0
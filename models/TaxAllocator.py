@@ -1,5 +1,7 @@
 import pygame
 import sys
+from models.AssetCache import AssetCache
+from models.TextCache import TextCache
 
 
 class TaskAllocator:
@@ -48,10 +50,10 @@ class TaskAllocator:
                                        self.container_rect.top + 150,
                                        100, 30)
         self.clock = pygame.time.Clock()
-        self.map_image = pygame.image.load("./Map/Assets/simCity.jpg")
+        self.map_image = AssetCache.get_image("./Map/Assets/simCity.jpg")
 
-        self.font = pygame.font.Font(None, 32)
-        self.button_font = pygame.font.Font(None, 24)
+        self.font = TextCache.get_font(32)
+        self.button_font = TextCache.get_font(24)
         self.input_text = ''
         self.is_input_active = False
         self.button_text = 'Allocate tax'
@@ -108,8 +110,8 @@ class TaskAllocator:
                          self.container_rect, border_radius=5)
 
         # Render the title text
-        title_font = pygame.font.Font(None, 48)
-        title_text = title_font.render(
+        title_font = TextCache.get_font(48)
+        title_text = TextCache.render(title_font,
             "Tax Allocation in %", True, (255, 255, 255))  # Title text color
         title_text_rect = title_text.get_rect(
             centerx=self.container_rect.centerx, top=self.container_rect.top + 40)  # Adjust vertical position
@@ -121,7 +123,7 @@ class TaskAllocator:
         # Input field color (white)
         pygame.draw.rect(self.screen, (255, 255, 255),
                          self.input_rect, border_radius=5)
-        text_surface = self.font.render(
+        text_surface = TextCache.render(self.font,
             self.input_text, True, (70, 130, 180))  # Input text color (blue)
         text_rect = text_surface.get_rect(center=self.input_rect.center)
         self.screen.blit(text_surface, text_rect)
@@ -131,7 +133,7 @@ class TaskAllocator:
                          self.button_rect, border_radius=5)
         pygame.draw.rect(self.screen, (255, 255, 255), self.button_rect,
                          width=2, border_radius=5)  # Button border
-        button_text_surface = self.button_font.render(
+        button_text_surface = TextCache.render(self.button_font,
             self.button_text, True, (255, 255, 255))  # Button text color
         button_text_rect = button_text_surface.get_rect(
             center=self.button_rect.center)
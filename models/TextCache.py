@@ -0,0 +1,98 @@
+import pygame
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    A process-wide registry of fonts and cache of rendered texts.
+
+    Fonts are created once per (face, size, bold) and rendered texts are kept in a
+    least recently used cache, so static labels are rendered only once and changing
+    texts (eg: funds, date) are only rendered again when their value changes.
+
+    Attributes:
+        fonts (dict): A dictionary of (face, size, bold) to the pygame.font.Font.
+        texts (OrderedDict): The rendered texts keyed by (text, font, color, antialias), least recently used first.
+        max_texts (int): The maximum amount of rendered texts kept in the cache.
+        hits (int): The amount of renders served from the cache.
+        misses (int): The amount of texts which had to be rendered.
+    """
+    fonts = {}
+    texts = OrderedDict()
+    max_texts = 256
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get_font(cls, size, face=None, bold=False):
+        """
+        Returns the font of the given face and size, creates it if it does not exist yet.
+
+        Args:
+            size (int): The size of the font.
+            face (str): Optional system font name (eg: "Calibri"). Default: None (pygame's default font)
+            bold (bool): Optional boolean to use the bold variant of a system font. Default: False
+
+        Returns:
+            pygame.font.Font: The font object.
+        """
+        key = (face, size, bold)
+        font = cls.fonts.get(key)
+        if font is None:
+            if face is None:
+                font = pygame.font.Font(None, size)
+            else:
+                font = pygame.font.SysFont(face, size, bold=bold)
+            cls.fonts[key] = font
+        return font
+
+    @classmethod
+    def render(cls, font, text, antialias, color):
+        """
+        Returns the text rendered with the given font, same arguments as pygame.font.Font.render.
+
+        Args:
+            font (pygame.font.Font): The font to render with, preferably taken from get_font.
+            text (str): The text to render.
+            antialias (bool): Whether the text is antialiased.
+            color (tuple): The color of the text (R, G, B).
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (text, font, tuple(color), antialias)
+        surface = cls.texts.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls.texts.move_to_end(key)
+            return surface
+        cls.misses += 1
+        surface = font.render(text, antialias, color)
+        cls.texts[key] = surface
+        if len(cls.texts) > cls.max_texts:
+            cls.texts.popitem(last=False)
+        return surface
+
+    @classmethod
+    def clear(cls):
+        """
+        Removes all the fonts and rendered texts and resets the counters.
+        """
+        cls.fonts.clear()
+        cls.texts.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: The amount of hits, misses, fonts and rendered texts.
+        """
+        return {"hits": cls.hits, "misses": cls.misses, "fonts": len(cls.fonts), "size": len(cls.texts)}
+
+
+# Fonts can not be used anymore after pygame.quit(), so the cache is emptied with it
+pygame.register_quit(TextCache.clear)
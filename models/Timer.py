@@ -1,6 +1,15 @@
 import datetime
 import pygame
 
+# The frame rate the time factor is defined for
+FRAMES_PER_SECOND = 60
+# Game time simulated by one fixed step of the simulation
+STEP = datetime.timedelta(days=1)
+# The maximum amount of steps run for one frame, the rest of the elapsed time is dropped
+MAX_STEPS_PER_UPDATE = 30
+# Day ordinals of the date strings parsed so far, keyed by the 'YYYY-MM-DD' string
+DAY_ORDINALS = {}
+
 
 class Timer:
     """A class for keeping track of time in a game.
@@ -8,12 +17,18 @@ class Timer:
     Attributes:
         time (pygame.time.Clock): A clock object from the Pygame library used to track the passage of time.
         time_factor (float): The conversion factor between game time (in seconds) and real-world time (also in seconds).
+        accumulator (float): The elapsed game time (in seconds) which was not simulated yet.
+        max_steps_per_update (int): The maximum amount of steps returned by accumulate (catch-up cap).
+        fast_forward (bool): Whether the game runs as many steps as allowed without waiting for or rendering frames.
 
     Methods:
         get_current_time(): Returns the current date and time as a datetime object.
         get_current_date_str(): Returns the current date as a string in the format 'YYYY-MM-DD'.
         tick(n: int): Advances the timer by n game frames.
-        update_time(paused: bool): Updates the current time of the timer based on the game's time factor and pause state.
+        accumulate(elapsed_ms: int, paused: bool) -> int: Adds the elapsed real time and returns the amount of steps due.
+        step(): Advances the current time by one fixed step (a day).
+        get_current_day() -> int: Returns the day ordinal of the current date.
+        get_day_from_str(date_str: str) -> int: Returns the day ordinal of a date string.
         subtract_with_time_str(date_str: str) -> int: Calculates the difference in days between the current time and a given date string.
         get_timer_from_str(str_date): Converts a string date to a datetime object.
     """
@@ -30,6 +45,9 @@ class Timer:
         self.game_speed = game_speed
         self.time_factor = (60 / self.game_speed) * self.game_speed_multiplier
         self.current_time = datetime.datetime.now()
+        self.accumulator = 0.0
+        self.max_steps_per_update = MAX_STEPS_PER_UPDATE
+        self.fast_forward = False
         
     def reinitialize(self, game_speed: int, game_speed_multiplier: int):
         """Reinitialize the Timer object.
@@ -43,6 +61,9 @@ class Timer:
         self.game_speed = game_speed
         self.time_factor = (60 / self.game_speed) * self.game_speed_multiplier
         self.current_time = datetime.datetime.now()
+        self.accumulator = 0.0
+        self.max_steps_per_update = MAX_STEPS_PER_UPDATE
+        self.fast_forward = False
 
     def get_time_factor(self):
         """Returns the time factor of the game."""
@@ -56,34 +77,66 @@ class Timer:
         """Returns the current date as a string in the format 'YYYY-MM-DD'."""
         return self.get_current_time().strftime('%Y-%m-%d')
 
-    def tick(self, n: int):
+    def tick(self, n: int) -> int:
         """Advances the timer by n game frames.
 
         Args:
             n (int): The number of game frames to advance the timer by.
+
+        Returns:
+            int: The real time (in milliseconds) elapsed since the previous tick.
         """
-        self.clock.tick(n)
+        return self.clock.tick(n)
 
-    def update_time(self, paused: bool) -> None:
+    def accumulate(self, elapsed_ms: int, paused: bool) -> int:
         """
-        Update the current time of the timer based on the game's time factor and pause state.
+        Adds the elapsed real time to the game time waiting to be simulated, and returns
+        the amount of fixed steps (days) due, so the simulation runs once for every elapsed day
+        independently of the frame rate. At most max_steps_per_update steps are returned,
+        the game time beyond that is dropped so a slow frame does not pile up more work.
+        In fast forward mode max_steps_per_update steps are always due.
 
         Args:
+            elapsed_ms (int): The real time (in milliseconds) elapsed since the previous call, eg: the result of tick.
             paused (bool): Indicates whether the game is currently paused or not.
 
         Returns:
-            None
+            int: The amount of steps to run, each of them followed by a call to step.
         """
-        if not paused:
-            self.current_time += datetime.timedelta(
-                seconds=self.get_time_factor())
+        if paused:
+            return 0
+        if self.fast_forward:
+            self.accumulator = 0.0
+            return self.max_steps_per_update
+        self.accumulator += elapsed_ms / 1000 * FRAMES_PER_SECOND * self.get_time_factor()
+        step_seconds = STEP.total_seconds()
+        steps = int(self.accumulator // step_seconds)
+        if steps > self.max_steps_per_update:
+            self.accumulator = 0.0
+            return self.max_steps_per_update
+        self.accumulator -= steps * step_seconds
+        return steps
+
+    def step(self) -> None:
+        """Advances the current time by one fixed step (a day)."""
+        self.current_time += STEP
+
+    def get_current_day(self) -> int:
+        """Returns the day ordinal (datetime.date.toordinal) of the current date."""
+        return self.current_time.toordinal()
+
+    @staticmethod
+    def get_day_from_str(date_str: str) -> int:
+        """Returns the day ordinal of the given string formatted as 'YYYY-MM-DD', each string is only parsed once."""
+        day = DAY_ORDINALS.get(date_str)
+        if day is None:
+            day = datetime.datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+            DAY_ORDINALS[date_str] = day
+        return day
 
     def subtract_with_time_str(self, date_str: str) -> int:
         """Calculates the difference in days between the current time object and the given string formatted as 'YYYY-MM-DD'."""
-        x = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-        delta = self.get_current_time() - x
-        diff_in_days = delta.days
-        return diff_in_days
+        return self.get_current_day() - self.get_day_from_str(date_str)
 
     def get_timer_from_str(self, str_date):
         """Converts a string date formatted as 'YYYY-MM-DD' to a datetime object."""
@@ -11,6 +11,8 @@ from models.Timer import Timer
 from models.BuildingAdder import form_tiled_obj
 from models.Citizen import *
 from models.Disaster import Disaster
+from models.TextCache import TextCache
+from models.RoadNetwork import RoadNetwork
 
 """
 Getters
@@ -209,15 +211,12 @@ def get_zone_satisfaction(zone: TiledObject) -> float:
         >>> get_zone_satisfaction(zone_obj)
         75.0
     """
-    sat = 0.0
-    for c in zone.properties['Citizens']:
-        sat += c.satisfaction
-    return sat / float(len(zone.properties['Citizens']))
+    return Citizen.get_zone_satisfaction(zone) / float(len(zone.properties['Citizens']))
 
 
 def get_all_connected_roads(road, road_list):
     """
-    Returns a set of all roads connected to the given road using depth-first search (DFS).
+    Returns a set of all roads connected to the given road using a breadth-first search over the road tiles.
 
     Args:
         road: The starting road.
@@ -234,106 +233,7 @@ def get_all_connected_roads(road, road_list):
         >>> get_all_connected_roads(road1, roads)
         {road1, road2, road3}
     """
-    visited = set()
-    dfs(road, visited, road_list)
-    return visited
-
-
-def get_connected_roads(current_road, road_list, dimension_tuple=None):
-    """
-    Returns a list of all roads connected to the given current road.
-
-    Args:
-        current_road: The current road coordinates as a tuple (x, y).
-        road_list: The list of all roads.
-        dimension_tuple: Tuple consisting of tilewidth and tileheight
-
-    Returns:
-        list: A list of all connected roads.
-
-    Raises:
-        None.
-
-    Examples:
-        >>> roads = [road1, road2, road3, road4]
-        >>> current_road = (32, 64)
-        >>> get_connected_roads(current_road, roads)
-        [road1, road2, road3]
-    """
-    tilewidth , tileheight = 32 , 32
-    if dimension_tuple:
-        tilewidth = dimension_tuple[0]
-        tileheight = dimension_tuple[1]
-        
-    connected_roads = []
-    x = int(current_road[0] // tilewidth) - 1
-    y = int(current_road[1] // tileheight)
-    road = get_connected_road_tiles(x, y, 'L', road_list)
-    while (road != None):
-        x = x - 1
-        connected_roads.append(road)
-        road = get_connected_road_tiles(x, y, 'L', road_list)
-    x = int(current_road[0] // tilewidth) + 1
-    y = int(current_road[1] // tileheight)
-    road = get_connected_road_tiles(x, y, 'R', road_list)
-    while (road != None):
-        x = x + 1
-        connected_roads.append(road)
-        road = get_connected_road_tiles(x, y, 'R', road_list)
-    x = int(current_road[0] // tilewidth)
-    y = int(current_road[1] // tileheight) - 1
-    road = get_connected_road_tiles(x, y, 'U', road_list)
-    while (road != None):
-        y = y - 1
-        connected_roads.append(road)
-        road = get_connected_road_tiles(x, y, 'U', road_list)
-    x = int(current_road[0] // tilewidth)
-    y = int(current_road[1] // tileheight) + 1
-    road = get_connected_road_tiles(x, y, 'D', road_list)
-    while (road != None):
-        y = y + 1
-        connected_roads.append(road)
-        road = get_connected_road_tiles(x, y, 'D', road_list)
-    return connected_roads
-
-
-def get_connected_road_tiles(x, y, direction, roads):
-    """
-    Returns the connected road tile based on the given coordinates and direction.
-
-    Args:
-        x (int): The x-coordinate of the current tile.
-        y (int): The y-coordinate of the current tile.
-        direction (str): The direction to search for the connected road ('U', 'D', 'L', 'R').
-        roads (list): The list of all roads.
-
-    Returns:
-        road: The connected road tile, or None if no road is found.
-
-    Raises:
-        None.
-
-    Examples:
-        >>> roads = [road1, road2, road3, road4]
-        >>> get_connected_road_tiles(2, 3, 'U', roads)
-        road2
-    """
-    obj_coord_x = x
-    obj_coord_y = y
-    for road in roads:
-        if direction == 'U':
-            if int(road.x // (road.parent.tilewidth)) == x and int(road.y // (road.parent.tileheight)) == obj_coord_y:
-                return road
-        elif direction == 'D':
-            if int(road.x // (road.parent.tilewidth)) == x and int(road.y // (road.parent.tileheight)) == obj_coord_y:
-                return road
-        elif direction == 'L':
-            if int(road.x // (road.parent.tilewidth)) == obj_coord_x and int(road.y // (road.parent.tileheight)) == y:
-                return road
-        elif direction == 'R':
-            if int(road.x // (road.parent.tilewidth)) == obj_coord_x and int(road.y // (road.parent.tileheight)) == y:
-                return road
-    return None
+    return RoadNetwork(road_list).get_connected_roads(road)
 
 
 def get_outer_circumference(obj: TiledObject):
@@ -387,16 +287,16 @@ def get_connected_by_road_objects(zone, map):
         >>> get_connected_by_road_objects(zone_obj, map_obj)
         [obj1, obj2, ...]
     """
-    roads = map.get_roads()
+    road_network = map.get_road_network()
     c = get_outer_circumference(zone)
     roads_connected_to_zone = []
     for tup in c:  # get all surrounding roads to the zone
-        for road in roads:
-            if int(tup[0]) == int(road.x // ((map.get_tile_width()))) and int(tup[1]) == int(road.y // ((map.get_tile_height()))):
-                roads_connected_to_zone.append(road)
+        road = road_network.get_road_at((int(tup[0]), int(tup[1])))
+        if road:
+            roads_connected_to_zone.append(road)
     connected_roads = []
     for road in roads_connected_to_zone:
-        connected_roads.extend(get_all_connected_roads(road, roads))
+        connected_roads.extend(road_network.get_connected_roads(road))
     return get_neighboring_objects(connected_roads, map)
 
 
@@ -409,7 +309,7 @@ def get_neighboring_objects(roads, map):
         map: The map object containing the objects.
 
     Returns:
-        list: A list of neighboring objects connected to the roads.
+        list: A list of neighboring objects connected to the roads, each object only once in the order it was found.
 
     Raises:
         None.
@@ -420,12 +320,12 @@ def get_neighboring_objects(roads, map):
         >>> get_neighboring_objects(road_objs, map_obj)
         [obj1, obj2, ...]
     """
-    neighboring_objects = []
+    neighboring_objects = {}
     for road in roads:
         obj = get_neighboring_object(road, map)
         if obj:
-            neighboring_objects.append(obj)
-    return neighboring_objects
+            neighboring_objects[obj] = None
+    return list(neighboring_objects)
 
 
 def get_all_neighboring_objects(roads, map):
@@ -437,7 +337,7 @@ def get_all_neighboring_objects(roads, map):
         map: The map object containing the objects.
 
     Returns:
-        list: A list of all neighboring objects connected to the roads.
+        list: A list of all neighboring objects connected to the roads, each object only once in the order it was found.
 
     Raises:
         None.
@@ -448,12 +348,12 @@ def get_all_neighboring_objects(roads, map):
         >>> get_all_neighboring_objects(road_objs, map_obj)
         [obj1, obj2, ...]
     """
-    neighboring_objects = []
+    neighboring_objects = {}
     for road in roads:
         object = get_all_neighboring_object(road, map)
         if object:
-            neighboring_objects.append(object)
-    return neighboring_objects
+            neighboring_objects[object] = None
+    return list(neighboring_objects)
 
 
 def get_neighboring_object(road, map):
@@ -478,13 +378,9 @@ def get_neighboring_object(road, map):
     """
     x = int(road.x // (map.get_tile_width()))
     y = int(road.y // (map.get_tile_height()))
-    objects = map.get_all_objects()
-    for obj in objects:
+    for obj in map.get_objects_bordering_tile((x, y)):
         if obj.type == "IndustrialZone" or obj.type == "ServiceZone":
-            c = get_outer_circumference(obj)
-            for tup in c:
-                if int(tup[0]) == x and int(tup[1]) == y:
-                    return obj
+            return obj
     return None
 
 
@@ -510,12 +406,9 @@ def get_all_neighboring_object(road, map):
     """
     x = int(road.x // (map.get_tile_width()))
     y = int(road.y // (map.get_tile_height()))
-    objects = map.get_all_objects()
-    for object in objects:
-        c = get_outer_circumference(object)
-        for tup in c:
-            if int(tup[0]) == x and int(tup[1]) == y:
-                return object
+    objects = map.get_objects_bordering_tile((x, y))
+    if objects:
+        return objects[0]
     return None
 
 
@@ -537,11 +430,7 @@ def get_num_of_unemployed_in_zone(zone):
         >>> get_num_of_unemployed_in_zone(zone_obj)
         5
     """
-    cnt = 0
-    for citizen in zone.properties['Citizens']:
-        if citizen.work is None:
-            cnt += 1
-    return cnt
+    return Citizen.get_zone_unemployed(zone)
 
 
 def get_capacity_and_citizens_of_zones(zones):
@@ -579,7 +468,7 @@ def get_citizen_by_id(id: int):
 
 def get_current_satisfaction() -> int:
     """Returns current overall satisfaction for all citizens"""
-    return sum(citizen.satisfaction for citizen in Citizen.citizens.values())
+    return Citizen.get_total_satisfaction()
 
 
 def get_max_possible_satisfaction() -> int:
@@ -597,7 +486,7 @@ Adders , Assigners, and Deleters
 """
 
 
-def add_citizen(tiledObj: TiledObject, citizen):
+def add_citizen(tiledObj: TiledObject, citizen, mapInstance):
     """
     Adds a citizen into the tiledObj, modifies the tiledObj to link accordingly with ObjectsTop layer
     in order to display the capacity of citizens on the Zone
@@ -605,21 +494,25 @@ def add_citizen(tiledObj: TiledObject, citizen):
     Args:
         tiledObj: tiledObj representing a Zone
         citizen: Citizen object
+        mapInstance: Map the Zone is placed on, its CapacityIndex is updated
     Returns:
         a boolean value if its citizen insertion is successful.
     """
     if tiledObj.properties['Capacity'] != len(tiledObj.properties['Citizens']):
         tiledObj.properties['Citizens'].append(citizen)
+        mapInstance.get_capacity_index().update(tiledObj)
         return True
     return False
 
 
-def add_citizens_to_game(map):
+def add_citizens_to_game(map, rng=random):
     """
     Adds citizens to the game based on various factors.
 
     Args:
         map (Map): The game map.
+        rng (random.Random): Optional random number generator drawing the satisfaction of the new citizens.
+            Default: the random module
 
     Returns:
         None
@@ -643,18 +536,17 @@ def add_citizens_to_game(map):
     else:
         average_satisfaction = total_satisfaction / total_citizens
     zones_with_arrival_chances = []
+    # The available work zones with free spaces, nobody gets a job before all the chances are calculated
+    capacity_index = map.get_capacity_index()
+    free_workzones = capacity_index.get_zones("IndustrialZone", "ServiceZone")
     for zone in map.get_residential_zones():
-        if len(zone.properties['Citizens']) < zone.properties['Capacity']:
+        if capacity_index.has_free_seats(zone):
             # part1
             arrival_chance = average_satisfaction
 
             # Iterate over the available work zones with free spaces within the given radius
-            nearby_workzones = []
-            for w_zone in map.get_work_zones():
-                if len(w_zone.properties['Citizens']) < w_zone.properties['Capacity']:
-                    distance = distance_between_two(zone, w_zone)
-                    if (distance < distance_threshold):
-                        nearby_workzones.append(w_zone)
+            nearby_workzones = [w_zone for w_zone, distance in zip(free_workzones, distances_to_many(zone, free_workzones, map))
+                                if distance < distance_threshold]
 
             # part2
             available_cap = sum(
@@ -681,107 +573,12 @@ def add_citizens_to_game(map):
     for zone, arrival_chance in zones_with_arrival_chances:
         n = int((arrival_chance * possible_citizens) // 100)
         for _ in range(n):
-            c = Citizen()
+            c = Citizen(rng)
             success_in_assign = assign_to_residential_zone(c, zone, map)
             if (success_in_assign):
                 handle_citizen_addition_satisfaction(c, map)
 
 
-def assign_zone_citizens_to_work(zone, map):
-    """
-    Assigns citizens of a zone to work zones based on the available work places.
-
-    Args:
-        zone (TiledObject): The zone whose citizens need to be assigned to work zones.
-        map (Map): The map containing the zone and work places.
-
-    Returns:
-        None
-
-    Raises:
-        None
-
-    Examples:
-        zone = ResidentialZone()
-        map = Map()
-        assign_zone_citizens_to_work(zone, map)
-    """
-    available_work_places = [obj for obj in get_connected_by_road_objects(
-        zone, map) if len(obj.properties['Citizens']) < obj.properties['Capacity']]
-    for citizen in zone.properties['Citizens']:
-        if citizen.work == None:
-            assign_to_work_zones(citizen, available_work_places, map)
-
-
-def assign_to_work_zones(citizen, available_work_places, map):
-    """
-    Assigns a citizen to a work zone based on the available work places.
-
-    Args:
-        citizen (Citizen): The citizen to be assigned to a work zone.
-        available_work_places (list): A list of available work places (zones) to choose from.
-        map (Map): The map containing the work places (zones).
-
-    Returns:
-        None
-
-    Raises:
-        None
-
-    Examples:
-        citizen = Citizen()
-        available_work_places = [zone1, zone2, zone3]
-        map = Map()
-        assign_to_work_zones(citizen, available_work_places, map)
-    """
-    I_zones = [
-        zone for zone in available_work_places if zone.type == "IndustrialZone"]
-    S_zones = [
-        zone for zone in available_work_places if zone.type == "ServiceZone"]
-    total_capacity_of_I_zones, total_number_of_citizens_in_I_zones = get_capacity_and_citizens_of_zones(
-        I_zones)
-    total_capacity_of_S_zones, total_number_of_citizens_in_S_zones = get_capacity_and_citizens_of_zones(
-        S_zones)
-
-    if total_capacity_of_I_zones == 0 and total_capacity_of_S_zones == 0:
-        return
-
-    needed_citizens_for_I_zones = total_capacity_of_I_zones - \
-        total_number_of_citizens_in_I_zones
-    needed_citizens_for_S_zones = total_capacity_of_S_zones - \
-        total_number_of_citizens_in_S_zones
-    if needed_citizens_for_I_zones > needed_citizens_for_S_zones:
-        assign_citizen_to_random_zone(citizen, I_zones, map)
-    else:
-        assign_citizen_to_random_zone(citizen, S_zones, map)
-
-
-def assign_citizen_to_random_zone(c, zones, map):
-    """
-    Assigns a citizen to a randomly selected zone from the given list of zones.
-
-    Args:
-        c (Citizen): The citizen to be assigned to a zone.
-        zones (list): A list of zones to choose from.
-        map (Map): The map containing the zones.
-
-    Returns:
-        None
-
-    Raises:
-        None
-
-    Examples:
-        c = Citizen()
-        zones = [zone1, zone2, zone3]
-        map = Map()
-        assign_citizen_to_random_zone(c, zones, map)
-    """
-    if zones:
-        random_zone = random.choice(zones)
-        assign_to_work_zone(c, random_zone, map)
-
-
 def assign_to_residential_zone(citizen, RZone, mapInstance) -> bool:
     """
     Gives the citizen a home, deletes the Citizen if there's a failure assigning a home.
@@ -794,20 +591,20 @@ def assign_to_residential_zone(citizen, RZone, mapInstance) -> bool:
     Returns:
         Nothing 
     """
-    if (add_citizen(RZone, citizen)):
+    if (add_citizen(RZone, citizen, mapInstance)):
         citizen.home = RZone
         simulate_building_addition(RZone, mapInstance)
         return True
     else:
         if (citizen.work):
             citizen.work.remove_citizen(citizen)
-        del Citizen.citizens[citizen.id]
+        Citizen.remove(citizen)
         return False
 
 
 def assign_to_work_zone(citizen, WorkZone, mapInstance) -> bool:
     """Assigns the citizen to either a ServiceZone or IndustrialZone, returns a bool value if a failure assigning work happens"""
-    if (add_citizen(WorkZone, citizen)):
+    if (add_citizen(WorkZone, citizen, mapInstance)):
         citizen.work = WorkZone
         simulate_building_addition(WorkZone, mapInstance)
         return True
@@ -825,30 +622,58 @@ def delete_citizen(c: Citizen) -> bool:
     c.home = None
     c.work = None
     try:
-        del Citizen.citizens[c.id]
+        Citizen.remove(c)
         return True
     except Exception as e:
         print(
-            f"Fatal failure deleting citizen {c} with data: {c.__dict__}. Error: {e}")
+            f"Fatal failure deleting citizen {c} with data: {c.get_data()}. Error: {e}")
         return False
 
 
-def remove_citizen_from_zone(tiledObj: TiledObject, citizen: Citizen) -> bool:
+def remove_citizen_from_zone(tiledObj: TiledObject, citizen: Citizen, mapInstance) -> bool:
     """
-    Removes a citizen from the tiledObj
+    Removes a citizen from the tiledObj, the CapacityIndex of the mapInstance is updated
 
     Returns:
     boolean value indicating the success of removing the given citizen
     """
     try:
         tiledObj.properties['Citizens'].remove(citizen)
+        mapInstance.get_capacity_index().update(tiledObj)
         return True
     except Exception as e:
         print(
-            f"Fatal failure removing citizen {citizen} with data {citizen.__dict__} from {tiledObj}. Error: {e}")
+            f"Fatal failure removing citizen {citizen} with data {citizen.get_data()} from {tiledObj}. Error: {e}")
         return False
 
 
+def restore_citizen(loaded_citizen, mapInstance) -> Citizen:
+    """
+    Recreates a citizen of a loaded game, it moves back into its home and work zone through add_citizen
+    and the home/work of the Citizen, so the counters of the zones follow
+
+    Args:
+    loaded_citizen: the saved [id, home id, work id, satisfaction] of the citizen (-1 if it had no home/work)
+    mapInstance: Map class the zones were restored on
+
+    Returns:
+    the new Citizen
+    """
+    c = Citizen()
+    c.satisfaction = loaded_citizen[3]
+    # Handle RZone
+    if loaded_citizen[1] != -1:
+        home_zone = mapInstance.get_zone_by_id(loaded_citizen[1])
+        if home_zone and add_citizen(home_zone, c, mapInstance):
+            c.home = home_zone
+    # Handle WZone
+    if loaded_citizen[2] != -1:
+        work_zone = mapInstance.get_zone_by_id(loaded_citizen[2])
+        if work_zone and add_citizen(work_zone, c, mapInstance):
+            c.work = work_zone
+    return c
+
+
 """
 Checkers
 """
@@ -863,69 +688,77 @@ def is_satisfaction_zone(SZone: TiledObject):
     return False
 
 
-def is_in_visited(road_tuple, visited):
+def is_there_a_blocker_between(Frst: TiledObject, RZone: TiledObject, lst):
     """
-    Checks if a road with the given coordinates is in the visited set.
+    Get the points which represent the view of the RZone and the Forest,
+    Checks if there is a blocker between the Forest and the RZone
 
     Args:
-        road_tuple (tuple): A tuple containing the x and y coordinates of the road.
-        visited (set): A set of visited roads.
-
-    Returns:
-        bool: True if the road is in the visited set, False otherwise.
-
-    Raises:
-        None
-
-    Examples:
-        road_tuple = (2, 3)
-        visited = {(1, 2), (3, 4), (2, 3)}
-        is_in_visited(road_tuple, visited)
+    Frst: Forest TiledObject
+    RZone: ResidentialZone TiledObject
+    lst: list consisting of all dynamic objects
     """
-    for road in visited:
-        if road_tuple[0] == road.x and road_tuple[1] == road.y:
-            return True
+    corridor = get_view_corridor(Frst, RZone)
+    for obj in lst:
+        if ((obj != Frst or obj != RZone) and obj.type != 'Road'):
+            if not corridor.isdisjoint(get_area(obj)):
+                return True
     return False
 
 
-def is_there_a_blocker_between(Frst: TiledObject, RZone: TiledObject, lst):
+def get_view_corridor(Frst: TiledObject, RZone: TiledObject) -> set:
     """
-    Get the points which represent the view of the RZone and the Forest,
-    Checks if there is a blocker between the Forest and the RZone
+    Returns the set of (x,y) tile coordinates the view between the Forest and the RZone passes through,
+    an object (except roads) on any of these tiles blocks the view
 
     Args:
     Frst: Forest TiledObject
     RZone: ResidentialZone TiledObject
-    lst: list consisting of all dynamic objects
     """
     wall = get_points_looking_at_each_other(Frst, RZone)
     mid = len(wall) // 2
     l1 = wall[:mid]
     l2 = wall[mid:]
-    res = [get_path_between_points(p1, p2) for p1, p2 in zip(l1, l2)]
-    flattened_res = [item for sublist in res for item in sublist]
-    for obj in lst:
-        if ((obj != Frst or obj != RZone) and obj.type != 'Road'):
-            s1 = set(get_area(obj))
-            s2 = set(flattened_res)
-            if s1.intersection(s2):
-                return True
-    return False
+    corridor = set()
+    for p1, p2 in zip(l1, l2):
+        corridor.update(get_path_between_points(p1, p2))
+    return corridor
 
 
 def can_move_into(zone: TiledObject) -> bool:
     """
     Checks if a Citizen can move into the Zone
     """
-    if len(zone.properties['Citizens']) < zone.properties['Capacity']:
+    if get_free_capacity(zone) > 0:
         return True
     return False
 
 
+def get_free_capacity(zone: TiledObject) -> int:
+    """
+    Returns the amount of citizens which can still move into (or work in) the Zone
+    """
+    return zone.properties['Capacity'] - len(zone.properties['Citizens'])
+
+
+def get_creation_day(obj: TiledObject) -> int:
+    """
+    Returns the day ordinal of the creation date of the object.
+    It is stored on the object together with the date it was parsed from,
+    so it is only parsed again when the CreationDate changes (eg: a loaded game restoring it).
+    """
+    date_str = obj.properties["CreationDate"]
+    creation_day = getattr(obj, "creation_day", None)
+    if creation_day is None or creation_day[0] != date_str:
+        creation_day = (date_str, Timer.get_day_from_str(date_str))
+        obj.creation_day = creation_day
+    return creation_day[1]
+
+
 def has_year_passed_from_creation(obj: TiledObject, givenDate: Timer) -> bool:
     """Checks the creation date of the zone/Building and the givenDate whether a year has passed or not """
     if obj:
-        x = givenDate.subtract_with_time_str(obj.properties["CreationDate"])
+        x = givenDate.get_current_day() - get_creation_day(obj)
         return x != 0 and x % 365 == 0
     return False
 
@@ -933,7 +766,7 @@ def has_year_passed_from_creation(obj: TiledObject, givenDate: Timer) -> bool:
 def has_month_passed_from_creation(obj: TiledObject, givenDate: Timer) -> bool:
     """Checks the creation date of the zone/Building and the givenDate whether a month has passed or not """
     if obj:
-        x = givenDate.subtract_with_time_str(obj.properties["CreationDate"])
+        x = givenDate.get_current_day() - get_creation_day(obj)
         return x != 0 and x % 30 == 0
     return False
 
@@ -941,18 +774,18 @@ def has_month_passed_from_creation(obj: TiledObject, givenDate: Timer) -> bool:
 def has_quarter_passed_from_creation(obj: TiledObject, givenDate: Timer) -> bool:
     """Checks if a quarter (90 days) passed since creation"""
     if obj:
-        x = givenDate.subtract_with_time_str(obj.properties["CreationDate"])
+        x = givenDate.get_current_day() - get_creation_day(obj)
         return x != 0 and x % 90 == 0
     return False
 
 
-def has_random_years_passed_from_start(gameStart, givenDate: Timer) -> bool:
-    """Checks the creation date of the zone/Building and the givenDate whether a year has passed or not """
+def has_random_years_passed_from_start(gameStart, givenDate: Timer, rng=random) -> bool:
+    """Checks the creation date of the zone/Building and the givenDate whether a year has passed or not, drawing from rng """
     years_passed = givenDate.subtract_with_time_str(gameStart) // 365
-    random_array = [random.randint(
+    random_array = [rng.randint(
         years_passed+1, years_passed+99) for _ in range(99)]
     random_array.append(years_passed)
-    choice = random.choice(random_array)
+    choice = rng.choice(random_array)
     if choice - years_passed == 0:
         return True
     else:
@@ -981,14 +814,90 @@ def industrial_buildings_nearby(zone, map):
     distance_threshold = 5  # Minimum distance between residential and industrial zones
     industrial_buildings_nearby = []
     I_zones = map.get_industrial_zones()
-    for I_zone in I_zones:
-        distance = distance_between_two(zone, I_zone)
+    for distance in distances_to_many(zone, I_zones, map):
         if distance < distance_threshold:
             industrial_buildings_nearby.append(distance)
     return industrial_buildings_nearby
 
 
+def get_tile_bounds(obj: TiledObject) -> tuple:
+    """
+    Returns the (x_start, y_start, x_end, y_end) tile coordinates of the object's area, ends included
+    """
+    tilex = obj.x // obj.parent.tilewidth
+    tiley = obj.y // obj.parent.tileheight
+    rows = int(obj.width // obj.parent.tilewidth)
+    cols = int(obj.height // obj.parent.tileheight)
+    return (tilex, tiley, tilex + rows - 1, tiley + cols - 1)
+
+
 def distance_between_two(obj1: TiledObject, obj2: TiledObject):
+    """
+    Returns the minimal distance between the two tiled objects, in constant time from their tile bounds
+
+    With gap_x and gap_y the gaps between the two areas along both axes (0 if they share columns/rows),
+    the distance d is calc_d of the gaps: gap_x + gap_y - 1. If the areas are apart along both axes
+    (diagonal), (d // 2) + 1 is returned instead, otherwise d itself. If the areas overlap (both gaps
+    are 0) or one of them is empty, the distance falls back to distance_between_circumferences.
+    """
+    return distance_between_bounds(get_tile_bounds(obj1), get_tile_bounds(obj2), obj1, obj2)
+
+
+def get_distance(obj1: TiledObject, obj2: TiledObject, map):
+    """
+    Returns the distance_between_two of the two objects placed on the map, served from the DistanceCache of the map
+    """
+    cache = map.get_distance_cache()
+    distance = cache.get(obj1, obj2)
+    if distance is None:
+        distance = distance_between_two(obj1, obj2)
+        cache.put(obj1, obj2, distance)
+    return distance
+
+
+def distances_to_many(obj: TiledObject, objs, map) -> list:
+    """
+    Returns the distance_between_two of the given object (placed on the map) and each of the given objects,
+    served from the DistanceCache of the map. The bounds of the given object are only calculated once.
+
+    Args:
+        obj: TiledObject to measure from
+        objs: list of TiledObjects
+        map: Map the objects are placed on
+
+    Returns:
+        list of distances in the order of objs
+    """
+    cache = map.get_distance_cache()
+    bounds = None
+    distances = []
+    for other in objs:
+        distance = cache.get(obj, other)
+        if distance is None:
+            if bounds is None:
+                bounds = get_tile_bounds(obj)
+            distance = distance_between_bounds(bounds, get_tile_bounds(other), obj, other)
+            cache.put(obj, other, distance)
+        distances.append(distance)
+    return distances
+
+
+def distance_between_bounds(b1, b2, obj1: TiledObject, obj2: TiledObject):
+    """
+    Helper of distance_between_two working on the tile bounds (get_tile_bounds) of both objects
+    """
+    gap_x = max(b2[0] - b1[2], b1[0] - b2[2], 0)
+    gap_y = max(b2[1] - b1[3], b1[1] - b2[3], 0)
+    if (gap_x == 0 and gap_y == 0) or b1[2] < b1[0] or b1[3] < b1[1] or b2[2] < b2[0] or b2[3] < b2[1]:
+        # The areas overlap (or one of them is empty), compare the circumferences point by point
+        return distance_between_circumferences(obj1, obj2)
+    distance = gap_x + gap_y - 1
+    if gap_x != 0 and gap_y != 0:
+        return (distance // 2) + 1
+    return distance
+
+
+def distance_between_circumferences(obj1: TiledObject, obj2: TiledObject):
     """
     Returns the minimal distance between the two tiled objects
 
@@ -1073,41 +982,6 @@ PathFinding , Handlers, Simulators
 """
 
 
-def dfs(current_road, visited, road_list):
-    """
-    Performs a Depth-First Search (DFS) traversal on a road network.
-
-    Args:
-        current_road (Road): The current road to start the DFS traversal from.
-        visited (set): A set to store visited roads.
-        road_list (list): A list of all roads in the road network.
-
-    Returns:
-        None
-
-    Raises:
-        None
-
-    Examples:
-        visited = set()
-        road_list = [road1, road2, road3]
-        dfs(road1, visited, road_list)
-    """
-    # Extract relevant attributes into a tuple
-    road_tuple = (current_road.x, current_road.y)
-    dimension_tuple = (current_road.parent.tilewidth,current_road.parent.tileheight)
-    visited.add(current_road)
-
-    # Explore adjacent roads (branches)
-    connected_roads = get_connected_roads(road_tuple, road_list,dimension_tuple)
-
-    for road in connected_roads:
-        # Extract relevant attributes into a tuple
-        road_tuple = (road.x, road.y)
-        if not is_in_visited(road_tuple, visited):
-            dfs(road, visited, road_list)
-
-
 def simulate_building_addition(obj: TiledObject, map):
     """
     Added the building (Second object layer) ontop of the current object (Zone)
@@ -1136,8 +1010,7 @@ def simulate_building_addition(obj: TiledObject, map):
             create = False
     if (create):
         building = form_tiled_obj(obj, map)
-        objLayer = obj.parent.get_layer_by_name("ObjectsTop")
-        objLayer.append(building)
+        map.add_building(building)
         obj.properties['Buildings'].append(building.__dict__)
 
 
@@ -1147,15 +1020,14 @@ def upgrade_zone(zone: TiledObject, mapInstance):
     """
     zone.properties['Level'] += 1
     zone.properties['Capacity'] = math.ceil(zone.properties['Capacity'] * 1.5)
+    mapInstance.get_capacity_index().update(zone)
     zone.properties['MaintenanceFee'] *= 0.25
     lst = get_linked_ids_for_obj(zone)
-    obj_layer = mapInstance.return_map().get_layer_by_name("ObjectsTop")
     for obj in lst:
-        obj_layer.remove(obj)
-        del (obj)
+        mapInstance.remove_disaster_or_building(obj)
     zone.properties['Buildings'] = []
     building = form_tiled_obj(zone, mapInstance)
-    obj_layer.append(building)
+    mapInstance.add_building(building)
     zone.properties['Buildings'].append(building.__dict__)
 
 
@@ -1178,7 +1050,7 @@ def delete_zone_data(zone: TiledObject, mapInstance) -> list:
     for c in zone.properties['Citizens']:
         citizens.append(c)
     for c in citizens:
-        remove_citizen_from_zone(zone, c)
+        remove_citizen_from_zone(zone, c, mapInstance)
         if (zone.type == 'ResidentialZone'):
             c.home = None
         elif (zone.type == 'IndustrialZone' or zone.type == 'ServiceZone'):
@@ -1190,29 +1062,26 @@ def delete_zone_data(zone: TiledObject, mapInstance) -> list:
     return citizens
 
 
-def demolish_zone(zone: TiledObject, mapInstance, player):
+def demolish_zone(zone: TiledObject, mapInstance, player, rng=random):
     """
-    Demolishes the clicked Zone (RZone/CZone/IZone)
+    Demolishes the clicked Zone (RZone/CZone/IZone), the displaced residents get a new home picked by rng
+    (the random module by default)
     """
     if (zone.type == 'ResidentialZone'):
         citizens = delete_zone_data(zone, mapInstance)
         homeless = len(citizens)
         for c in citizens:
             if (c.work):
-                remove_citizen_from_zone(c.work, c)
+                remove_citizen_from_zone(c.work, c, mapInstance)
                 c.work = None
-        # Give home
+        # Give home, in a random ResidentialZone with free seats
         for c in citizens:
-            RZones = mapInstance.get_yet_to_occupy_homes()
-            if (len(RZones) == 0):
+            RZone = mapInstance.get_capacity_index().choice("ResidentialZone", rng)
+            if RZone is None:
                 break
-            random.shuffle(RZones)
-            for RZone in RZones:
-                if can_move_into(RZone):
-                    if (assign_to_residential_zone(c, RZone, mapInstance)):
-                        player.money -= 100
-                        homeless -= 1
-                    break
+            if (assign_to_residential_zone(c, RZone, mapInstance)):
+                player.money -= 100
+                homeless -= 1
         if (homeless != 0):
             to_leave = citizens[-homeless:]
             for c in to_leave:
@@ -1228,23 +1097,22 @@ def handle_citizen_addition_satisfaction(c: Citizen, map):
     """
     After assigning a citizen to an RZone, checks nearby SatisfactionIncreasers and adds accordingly
     """
-    for SZone in map.get_satisfaction_increasers():
-        if (distance_between_two(c.home, SZone) <= SZone.properties['Radius']):
-            if (SZone.type == "Forest"):
-                if (is_there_a_blocker_between(c.home, SZone, map.get_all_objects())):
-                    continue
-                else:
-                    tmp = c.satisfaction + \
-                        (SZone.properties['Satisfaction']*c.satisfaction)
-                    if tmp <= 100:
-                        c.satisfaction += (
-                            SZone.properties['Satisfaction']*c.satisfaction)
+    for SZone in map.get_sources_influencing(c.home):
+        if (SZone.type == "Forest"):
+            if (map.is_view_blocked(SZone, c.home)):
+                continue
             else:
                 tmp = c.satisfaction + \
                     (SZone.properties['Satisfaction']*c.satisfaction)
                 if tmp <= 100:
                     c.satisfaction += (
                         SZone.properties['Satisfaction']*c.satisfaction)
+        else:
+            tmp = c.satisfaction + \
+                (SZone.properties['Satisfaction']*c.satisfaction)
+            if tmp <= 100:
+                c.satisfaction += (
+                    SZone.properties['Satisfaction']*c.satisfaction)
 
 
 def handle_disaster_logic(map, givenDate: Timer):
@@ -1263,13 +1131,12 @@ def handle_disaster_logic(map, givenDate: Timer):
                     for c in obj.properties['Citizens']:
                         rmf.append(c)
                         if (c.work):
-                            remove_citizen_from_zone(c.work, c)
+                            remove_citizen_from_zone(c.work, c, map)
                             c.work = None
                     for c in rmf:
-                        remove_citizen_from_zone(obj, c)
+                        remove_citizen_from_zone(obj, c, map)
                         c.home = None
                         delete_citizen(c)
-                    obj.properties['Citizens'] = []
                     for b in lnked:
                         map.remove_disaster_or_building(b)
                     map.reclassify_zone(obj)
@@ -1280,8 +1147,7 @@ def handle_disaster_logic(map, givenDate: Timer):
                         rmf.append(c)
                         c.work = None
                     for c in rmf:
-                        remove_citizen_from_zone(obj, c)
-                    obj.properties['Citizens'] = []
+                        remove_citizen_from_zone(obj, c, map)
                     for b in lnked:
                         map.remove_disaster_or_building(b)
                     map.reclassify_zone(obj)
@@ -1297,17 +1163,13 @@ def handle_satisfaction_zone_removal(SZone: TiledObject, RZones):
 
     (Reclassify Forest because of Disaster uses this function)
     """
-    for RZone in RZones:
-        if (distance_between_two(RZone, SZone) <= SZone.properties['Radius']):
-            for c in RZone.properties['Citizens']:
-                tmp = c.satisfaction + \
-                    (SZone.properties['Satisfaction']*c.satisfaction)
-                if tmp >= 0:
-                    c.satisfaction -= (
-                        SZone.properties['Satisfaction']*c.satisfaction)
+    # The SZone is already removed from the map, so its distances are not cached again
+    RZones = [RZone for RZone in RZones
+              if distance_between_two(RZone, SZone) <= SZone.properties['Radius']]
+    Citizen.decrease_satisfaction(SZone.properties['Satisfaction'], Citizen.get_rows(RZones))
 
 
-def handle_disaster_random_logic(mapInstance, givenDate, randomizer: bool):
+def handle_disaster_random_logic(mapInstance, givenDate, randomizer: bool, rng=random):
     """
     Creates a random Disaster on the map on a yearly basis given that forests exist
 
@@ -1315,12 +1177,13 @@ def handle_disaster_random_logic(mapInstance, givenDate, randomizer: bool):
     mapInstance: the Map itself
     givenDate: the current time the disaster would be called
     randomizer: boolean value given by has_random_years_passed_from_start used in forest yearly pass checking
+    rng: random number generator picking the destroyed object, the random module by default
     """
     if randomizer:
         zones = [o for o in mapInstance.get_all_objects() if o.type != "Road"]
         if (len(zones) != 0):
             disasters = mapInstance.get_all_disasters()
-            to_destroy = random.choice(zones)
+            to_destroy = rng.choice(zones)
             for d in disasters:
                 if to_destroy in d.properties['linked_objs']:
                     return
@@ -1414,10 +1277,9 @@ def handle_prompt(map, clckd_crds, clckd_zn, upgrd, rclssfy, dmlsh, dmlsh_cnfrm)
                     map, clckd_crds, clckd_zn, upgrd, rclssfy, dmlsh)
         else:
             # Reterive the Zone if not clicked in the first place
-            zones = [obj for obj in map.get_all_objects() if (
-                obj.type != "Forest" and obj.type != "Road")]
-            clckd_zn = tile_in_which_zone(
-                map.get_clicked_tile(clckd_crds), zones)
+            clckd_zn = map.get_object_at_tile(map.get_clicked_tile(clckd_crds))
+            if (clckd_zn and (clckd_zn.type == "Forest" or clckd_zn.type == "Road")):
+                clckd_zn = None
             if (clckd_zn):
                 if (not map.does_obj_exist(clckd_zn)):
                     clckd_crds = clckd_zn = upgrd = rclssfy = dmlsh = dmlsh_cnfrm = None
@@ -1438,51 +1300,27 @@ def handle_tree_growth(map, SZone: TiledObject):
     """
     After the tree grows, it must affect the nearby citizens
     """
-    for RZone in map.get_residential_zones():
-        if (distance_between_two(RZone, SZone) <= SZone.properties['Radius']):
-            if (is_there_a_blocker_between(SZone, RZone, map.get_all_objects())):
-                continue
-            else:
-                for c in RZone.properties['Citizens']:
-                    tmp = c.satisfaction + \
-                        (SZone.properties['Satisfaction']*c.satisfaction)
-                    if tmp <= 100:
-                        c.satisfaction += (
-                            SZone.properties['Satisfaction']*c.satisfaction)
+    RZones = [RZone for RZone in map.get_zones_influenced_by(SZone)
+              if not map.is_view_blocked(SZone, RZone)]
+    Citizen.increase_satisfaction(SZone.properties['Satisfaction'], Citizen.get_rows(RZones))
 
 
 def handle_satisfaction_zone_addition(map, SZone: TiledObject):
     """
     After the player creates a Stadium, PoliceDepartment, or Forest, it checks nearby Citizens and adds satisfaction
     """
-    for RZone in map.get_residential_zones():
-        if (distance_between_two(RZone, SZone) <= SZone.properties['Radius']):
-            if (SZone.type == "Forest"):
-                if (is_there_a_blocker_between(SZone, RZone, map.get_all_objects())):
-                    continue
-                else:
-                    for c in RZone.properties['Citizens']:
-                        tmp = c.satisfaction + \
-                            (SZone.properties['Satisfaction']*c.satisfaction)
-                        if tmp <= 100:
-                            c.satisfaction += (
-                                SZone.properties['Satisfaction']*c.satisfaction)
-            else:
-                for c in RZone.properties['Citizens']:
-                    tmp = c.satisfaction + \
-                        (SZone.properties['Satisfaction']*c.satisfaction)
-                    if tmp <= 100:
-                        c.satisfaction += (
-                            SZone.properties['Satisfaction']*c.satisfaction)
+    RZones = [RZone for RZone in map.get_zones_influenced_by(SZone)
+              if SZone.type != "Forest" or not map.is_view_blocked(SZone, RZone)]
+    Citizen.increase_satisfaction(SZone.properties['Satisfaction'], Citizen.get_rows(RZones))
 
 
-def randomize_initial_forests(map, player, timer):
+def randomize_initial_forests(map, player, timer, rng=random):
     """
-    Creates random forests at the start of the game
+    Creates random forests at the start of the game, drawn from rng (the random module by default)
     """
     coords = [(11, 5), (28, 33), (6, 16), (32, 23)]
-    num_choices = random.randint(1, len(coords))
-    to_insert = random.sample(coords, num_choices)
+    num_choices = rng.randint(1, len(coords))
+    to_insert = rng.sample(coords, num_choices)
     for p in to_insert:
         frst = Forest(p[0], p[1], timer.get_current_date_str(), map)
         map.add_object(frst.instance, player, True)
@@ -1670,12 +1508,12 @@ def show_menu(screen, map, running, game_loop, run_call_back, allocated_tax, lis
     ]
 
     # Add the menu options to the menu surface
-    font = pygame.font.SysFont("Calibri", 48, bold=True)
+    font = TextCache.get_font(48, "Calibri", True)
     selected_option = 0
     menu_loop = True
     while menu_loop:
         for i, (text, action) in enumerate(menu_options):
-            text_surface = font.render(text, True, (0, 0, 0))
+            text_surface = TextCache.render(font, text, True, (0, 0, 0))
             text_rect = text_surface.get_rect(
                 center=(menu_width / 2, 75 + i * 75))
             if i == selected_option:
@@ -1696,7 +1534,7 @@ def show_menu(screen, map, running, game_loop, run_call_back, allocated_tax, lis
             # Mouse click
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 for i, option in enumerate(menu_options):
-                    option_text = font.render(option[0], True, (255, 255, 255))
+                    option_text = TextCache.render(font, option[0], True, (255, 255, 255))
                     option_rect = option_text.get_rect(center=(menu_x + menu_width // 2, menu_y + 75 + i * 75))
                     if option_rect.collidepoint(event.pos):
                         selected = option[0]
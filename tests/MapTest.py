@@ -80,7 +80,7 @@ class MapTestCase(unittest.TestCase):
         self.map._Map__map.nextobjectid = 1
         obj_layer_mock = unittest.mock.Mock()
         self.map._Map__map.get_layer_by_name = unittest.mock.Mock(return_value=obj_layer_mock)
-        obj = Road(33,33, "2023-05-20" , self.map)
+        obj = Road(33,33, "2023-05-20" , self.map).instance
         player = Player("Abood", 10000)
         obj.properties = {'Price': '100'}
         obj.type =  'Road'
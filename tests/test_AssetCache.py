@@ -0,0 +1,32 @@
+import os
+import unittest
+import pygame
+from models.AssetCache import AssetCache
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+class AssetCacheTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1024, 768))
+        AssetCache.clear()
+        self.path = "./Map/Assets/Builder_assets/icon2_Road.png"
+
+    def test_image_is_loaded_once(self):
+        first = AssetCache.get_image(self.path)
+        second = AssetCache.get_image(self.path)
+        self.assertIs(first, second)
+        self.assertEqual(AssetCache.get_stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_scaled_image_is_cached_by_size(self):
+        small = AssetCache.get_image(self.path, (32, 32))
+        big = AssetCache.get_image(self.path, (128, 128))
+        self.assertEqual(small.get_size(), (32, 32))
+        self.assertEqual(big.get_size(), (128, 128))
+        self.assertIs(small, AssetCache.get_image(self.path, (32, 32)))
+        self.assertEqual(AssetCache.hits, 1)
+        self.assertEqual(AssetCache.misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
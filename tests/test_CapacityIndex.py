@@ -0,0 +1,72 @@
+import os
+import random
+import unittest
+import pygame
+from models.Map import Map
+from models.Player import Player
+from models.Citizen import Citizen
+from models.Road import Road
+from models.zones.ResidentialZone import ResidentialZone
+from models.Utils import add_citizen, remove_citizen_from_zone, upgrade_zone
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+class CapacityIndexTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.map = Map(self.screen, 200, 100)
+        self.player = Player("HUMAN", 100000)
+        Citizen.reinitialize()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_zones_with_free_seats(self):
+        self.map.add_object(Road(3, 3, "2023-05-20", self.map).instance, self.player)
+        zone = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, self.player)
+        index = self.map.get_capacity_index()
+        self.assertEqual(index.get_zones("ResidentialZone"), [zone])
+        self.assertEqual(self.map.get_yet_to_occupy_homes(), [zone])
+
+        citizens = [Citizen() for i in range(zone.properties['Capacity'])]
+        for c in citizens:
+            add_citizen(zone, c, self.map)
+        self.assertFalse(index.has_free_seats(zone))
+        self.assertIsNone(index.choice("ResidentialZone"))
+
+        remove_citizen_from_zone(zone, citizens[0], self.map)
+        self.assertIs(index.choice("ResidentialZone"), zone)
+        add_citizen(zone, citizens[0], self.map)
+        upgrade_zone(zone, self.map)
+        self.assertTrue(index.has_free_seats(zone))
+
+        zone.properties['Citizens'] = []
+        self.map.reclassify_zone(zone)
+        self.assertEqual(index.get_zones("ResidentialZone"), [])
+        index.update(zone)
+        self.assertEqual(index.get_stats(), {"ResidentialZone": 0})
+
+    def test_each_map_has_its_own_index(self):
+        zone = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, self.player)
+        other = Map(None, 0, 0, headless=True)
+        self.assertEqual(other.get_capacity_index().get_zones("ResidentialZone"), [])
+        self.assertEqual(self.map.get_capacity_index().get_zones("ResidentialZone"), [zone])
+
+        self.map.reinitialize(self.screen, 200, 100)
+        self.assertEqual(self.map.get_capacity_index().get_zones("ResidentialZone"), [])
+
+    def test_choice_draws_from_the_given_generator(self):
+        for x in (3, 7, 11):
+            self.map.add_object(ResidentialZone(x, 20, "2023-05-20", self.map).instance, self.player)
+        index = self.map.get_capacity_index()
+        state = random.getstate()
+        runs = []
+        for i in range(2):
+            rng = random.Random(4)
+            runs.append([index.choice("ResidentialZone", rng).id for j in range(10)])
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(random.getstate(), state)
+
+if __name__ == '__main__':
+    unittest.main()
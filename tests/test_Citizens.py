@@ -78,6 +78,104 @@ class TestCitizen(unittest.TestCase):
             delete_citizen(citizens[i])
         assert 10 == c.get_citizens_len()
 
+    def test_totals_follow_the_citizens(self):
+        Citizen.reinitialize()
+        citizens = [Citizen() for i in range(5)]
+        citizens[0].work = "work"
+        citizens[3].work = "work"
+        for i, c in enumerate(citizens):
+            c.satisfaction = 10 * (i + 1)
+        assert 2 == Citizen.get_employed_len()
+        assert 150 == Citizen.get_total_satisfaction()
+
+        # removing a row moves the last one into its place
+        assert True == delete_citizen(citizens[1])
+        assert 4 == Citizen.get_citizens_len()
+        assert 130 == Citizen.get_total_satisfaction()
+        assert 50 == citizens[4].satisfaction
+        assert "work" == citizens[3].work
+        assert 20 == citizens[1].satisfaction
+        assert False == delete_citizen(citizens[1])
+
+        Citizen.reduce_satisfaction(0.5)
+        assert 65 == Citizen.get_total_satisfaction()
+        assert 5 == citizens[0].satisfaction
+        assert 2 == Citizen.get_employed_len()
+        Citizen.reinitialize()
+
+    def test_batched_satisfaction_matches_scalar_updates(self):
+        Citizen.reinitialize()
+        citizens = [Citizen() for i in range(50)]
+        citizens[0].satisfaction = 99.5
+        expected = [c.satisfaction for c in citizens]
+        rows = [c.row for c in citizens[::2]]
+
+        Citizen.increase_satisfaction(0.03, rows)
+        for i in range(0, 50, 2):
+            tmp = expected[i] + (0.03 * expected[i])
+            if tmp <= 100:
+                expected[i] += 0.03 * expected[i]
+        assert expected == [c.satisfaction for c in citizens]
+        assert 99.5 == citizens[0].satisfaction
+
+        Citizen.decrease_satisfaction(0.03, rows)
+        for i in range(0, 50, 2):
+            expected[i] -= 0.03 * expected[i]
+        Citizen.reduce_satisfaction(0.35)
+        expected = [s - (s * 0.35) for s in expected]
+        assert expected == [c.satisfaction for c in citizens]
+        self.assertAlmostEqual(sum(expected), Citizen.get_total_satisfaction())
+        Citizen.reinitialize()
+
+    def test_zone_counters_follow_the_citizens(self):
+        Citizen.reinitialize()
+        citizens = [Citizen() for i in range(6)]
+        for i, c in enumerate(citizens):
+            c.satisfaction = 10 * (i + 1)
+            c.home = "home A" if i < 4 else "home B"
+        citizens[0].work = "factory"
+        citizens[4].work = "factory"
+        assert 3 == Citizen.get_zone_unemployed("home A")
+        assert 1 == Citizen.get_zone_unemployed("home B")
+        assert 100 == Citizen.get_zone_satisfaction("home A")
+        assert 60 == Citizen.get_zone_satisfaction("factory")
+
+        citizens[4].satisfaction = 40
+        citizens[0].work = None
+        Citizen.increase_satisfaction(0.5, [citizens[4].row])
+        assert 4 == Citizen.get_zone_unemployed("home A")
+        assert 60 == Citizen.get_zone_satisfaction("factory")
+        assert 120 == Citizen.get_zone_satisfaction("home B")
+
+        delete_citizen(citizens[4])
+        assert 0 == Citizen.get_zone_satisfaction("factory")
+        assert 1 == Citizen.get_zone_unemployed("home B")
+        Citizen.reduce_satisfaction(0.5)
+        assert 50 == Citizen.get_zone_satisfaction("home A")
+        assert 30 == Citizen.get_zone_satisfaction("home B")
+        Citizen.reinitialize()
+
+
+    def test_batched_satisfaction_keeps_the_zone_sums(self):
+        Citizen.reinitialize()
+        citizens = [Citizen() for i in range(8)]
+        for i, c in enumerate(citizens):
+            c.satisfaction = 10 * (i + 1)
+            c.home = "home A" if i < 5 else "home B"
+            c.work = "factory" if i % 2 == 0 else None
+        citizens[4].satisfaction = 99
+        Citizen.increase_satisfaction(0.5, [c.row for c in citizens[3:7]])
+        assert 10 + 20 + 30 + 60 + 99 == Citizen.get_zone_satisfaction("home A")
+        assert 90 + 70 + 80 == Citizen.get_zone_satisfaction("home B")
+        assert 10 + 30 + 99 + 70 == Citizen.get_zone_satisfaction("factory")
+
+        Citizen.reduce_satisfaction(0.5)
+        citizens[0].satisfaction = 25
+        citizens[1].home = None
+        assert 25 + 15 + 30 + 49.5 == Citizen.get_zone_satisfaction("home A")
+        assert 25 + 15 + 49.5 + 35 == Citizen.get_zone_satisfaction("factory")
+        self.assertAlmostEqual(sum(c.satisfaction for c in citizens), Citizen.get_total_satisfaction())
+        Citizen.reinitialize()
 
 if __name__ == '__main__':
     unittest.main()
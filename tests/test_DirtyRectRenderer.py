@@ -0,0 +1,71 @@
+import os
+import unittest
+import pygame
+from models.DirtyRectRenderer import DirtyRectRenderer, merge_rects
+from models.Panels.PricePanel import PricePanel
+from models.Panels.BuilderPanel import BuilderPanel
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+class DirtyRectRendererTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((1024, 768))
+        self.renderer = DirtyRectRenderer(self.screen)
+
+    def test_merge_rects(self):
+        rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10), pygame.Rect(100, 100, 5, 5)]
+        merged = merge_rects(rects)
+        self.assertEqual(len(merged), 2)
+        self.assertIn(pygame.Rect(0, 0, 15, 15), merged)
+        self.assertIn(pygame.Rect(100, 100, 5, 5), merged)
+
+    def test_mark_dirty_clips_to_screen(self):
+        self.renderer.mark_dirty(pygame.Rect(-10, -10, 20, 20))
+        self.renderer.mark_dirty(pygame.Rect(2000, 2000, 20, 20))
+        self.renderer.mark_dirty(None)
+        self.assertEqual(self.renderer.dirty_rects, [pygame.Rect(0, 0, 10, 10)])
+
+    def test_frame_only_touches_dirty_region(self):
+        self.screen.fill((255, 255, 255))
+        self.renderer.mark_dirty(pygame.Rect(10, 10, 20, 20))
+        clip = self.renderer.begin_frame()
+        self.assertEqual(clip, pygame.Rect(10, 10, 20, 20))
+        self.screen.fill((255, 0, 0))
+        self.renderer.end_frame()
+        self.assertEqual(self.screen.get_at((15, 15)), pygame.Color(255, 0, 0))
+        self.assertEqual(self.screen.get_at((50, 50)), pygame.Color(255, 255, 255))
+
+        self.renderer.present()
+        self.assertFalse(self.renderer.has_dirty_rects())
+        self.assertIsNone(self.renderer.begin_frame())
+
+    def test_panel_reports_dirty_rect_on_change(self):
+        panel = PricePanel(96, 736, 928, 32)
+        self.assertEqual(panel.get_dirty_rects("$0 for Nothing"), [pygame.Rect(96, 736, 928, 32)])
+        self.assertEqual(panel.get_dirty_rects("$0 for Nothing"), [])
+        self.assertEqual(panel.get_dirty_rects("$75 for Road"), [pygame.Rect(96, 736, 928, 32)])
+
+    def test_only_dirty_rects_are_cleared(self):
+        self.screen.fill((255, 255, 255))
+        self.renderer.mark_dirty(pygame.Rect(10, 10, 20, 20))
+        self.renderer.mark_dirty(pygame.Rect(100, 100, 20, 20))
+        clip = self.renderer.begin_frame()
+        self.renderer.end_frame()
+        self.assertEqual(clip, pygame.Rect(10, 10, 110, 110))
+        self.assertEqual(self.screen.get_at((15, 15)), pygame.Color(0, 0, 0))
+        self.assertEqual(self.screen.get_at((50, 50)), pygame.Color(255, 255, 255))
+        self.assertTrue(self.renderer.is_dirty(pygame.Rect(0, 0, 15, 15)))
+        self.assertFalse(self.renderer.is_dirty(pygame.Rect(40, 40, 20, 20)))
+
+    def test_builder_panel_loads_icons_once(self):
+        panel = BuilderPanel(0, 32, 96, 736)
+        icons = [("./Map/Assets/Builder_assets/icon2_Road.png", "Road")]
+        panel.display_assets(self.screen, icons)
+        loaded = panel.icons
+        panel.display_assets(self.screen, icons)
+        self.assertIs(panel.icons, loaded)
+        self.assertEqual(len(loaded), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import datetime
+import unittest
+import pygame
+from models.Map import Map
+from models.Player import Player
+from models.Road import Road
+from models.zones.IndustrialZone import IndustrialZone
+from models.EventScheduler import EventScheduler, YEAR, QUARTER
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+class EventSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.map = Map(self.screen, 200, 100)
+        self.player = Player("HUMAN", 100000)
+        self.day = datetime.date(2023, 5, 20).toordinal()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_due_on_anniversaries_only(self):
+        scheduler = EventScheduler()
+        first, second = object(), object()
+        scheduler.add(first, self.day, (YEAR,))
+        scheduler.add(second, self.day + 1, (QUARTER, YEAR))
+
+        self.assertEqual(scheduler.get_due(self.day), [])
+        self.assertEqual(scheduler.get_due(self.day + YEAR), [(first, YEAR)])
+        self.assertEqual(scheduler.get_due(self.day + 1 + QUARTER), [(second, QUARTER)])
+        self.assertEqual(scheduler.get_due(self.day + 2 * YEAR), [(first, YEAR)])
+        self.assertEqual(scheduler.get_due(self.day + 1 + YEAR), [(second, YEAR)])
+
+        scheduler.remove(first)
+        self.assertEqual(scheduler.get_due(self.day + YEAR), [])
+        self.assertEqual(scheduler.buckets, {key: scheduler.buckets[key] for key in scheduler.entries[second]})
+
+    def test_map_schedules_added_objects(self):
+        road = self.map.add_object(Road(3, 3, "2023-05-20", self.map).instance, self.player)
+        zone = self.map.add_object(IndustrialZone(10, 20, "2023-05-21", self.map).instance, self.player)
+        scheduler = self.map.get_scheduler()
+
+        self.assertEqual(scheduler.get_due(self.day + YEAR), [(road, YEAR)])
+        self.assertEqual(scheduler.get_due(self.day + 1 + QUARTER), [(zone, QUARTER)])
+
+        self.map.reclassify_zone(road)
+        self.assertEqual(scheduler.get_due(self.day + YEAR), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import random
+import unittest
+import pygame
+from models.Map import Map
+from models.Player import Player
+from models.Citizen import Citizen
+from models.Road import Road
+from models.zones.ResidentialZone import ResidentialZone
+from models.zones.IndustrialZone import IndustrialZone
+from models.zones.ServiceZone import ServiceZone
+from models.JobMatcher import JobMatcher
+from models.Utils import assign_to_residential_zone, get_connected_by_road_objects
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+class JobMatcherTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        Citizen.reinitialize()
+
+    def tearDown(self):
+        Citizen.reinitialize()
+        pygame.quit()
+
+    def build_city(self):
+        map = Map(self.screen, 200, 100)
+        player = Player("HUMAN", 100000)
+        for x in range(3, 16):
+            map.add_object(Road(x, 24, "2023-05-20", map).instance, player)
+        home = map.add_object(ResidentialZone(3, 20, "2023-05-20", map).instance, player)
+        factory = map.add_object(IndustrialZone(8, 20, "2023-05-20", map).instance, player)
+        shop = map.add_object(ServiceZone(12, 20, "2023-05-20", map).instance, player)
+        unreachable = map.add_object(IndustrialZone(3, 30, "2023-05-20", map).instance, player)
+        for i in range(12):
+            assign_to_residential_zone(Citizen(), home, map)
+        return map, factory, shop, unreachable
+
+    def test_jobs_are_balanced_between_reachable_zones(self):
+        map, factory, shop, unreachable = self.build_city()
+        self.assertEqual(JobMatcher(random.Random(1)).match(map), 12)
+        # the ServiceZone (15 seats) takes workers until it needs as many as the IndustrialZone (10 seats)
+        self.assertEqual(len(factory.properties['Citizens']), 3)
+        self.assertEqual(len(shop.properties['Citizens']), 9)
+        self.assertEqual(unreachable.properties['Citizens'], [])
+        self.assertEqual(JobMatcher(random.Random(1)).match(map), 0)
+
+    def test_same_seed_same_jobs(self):
+        jobs = []
+        for i in range(2):
+            Citizen.reinitialize()
+            map, factory, shop, unreachable = self.build_city()
+            JobMatcher(random.Random(7)).match(map)
+            jobs.append([c.work.type for c in factory.properties['Citizens'] + shop.properties['Citizens']])
+        self.assertEqual(jobs[0], jobs[1])
+
+    def test_road_only_leads_to_first_bordering_zone(self):
+        map = Map(self.screen, 200, 100)
+        player = Player("HUMAN", 100000)
+        for x in range(3, 12):
+            map.add_object(Road(x, 24, "2023-05-20", map).instance, player)
+        home = map.add_object(ResidentialZone(3, 20, "2023-05-20", map).instance, player)
+        # both zones border the same road tiles, above and below them
+        factory = map.add_object(IndustrialZone(8, 20, "2023-05-20", map).instance, player)
+        shop = map.add_object(ServiceZone(8, 25, "2023-05-20", map).instance, player)
+        for i in range(12):
+            assign_to_residential_zone(Citizen(), home, map)
+
+        self.assertEqual(get_connected_by_road_objects(home, map), [factory])
+        self.assertEqual(JobMatcher(random.Random(1)).match(map), factory.properties['Capacity'])
+        self.assertEqual(shop.properties['Citizens'], [])
+
+if __name__ == '__main__':
+    unittest.main()
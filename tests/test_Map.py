@@ -8,6 +8,10 @@ from models.Player import Player
 from models.Road import Road
 from models.Stadium import Stadium
 from models.Tile import Tile
+from models.zones.ResidentialZone import ResidentialZone
+from models.zones.IndustrialZone import IndustrialZone
+from models.Forest import Forest
+from models.Utils import get_area, get_neighboring_objects, get_all_neighboring_objects, get_distance, distance_between_two
 
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
@@ -80,7 +84,7 @@ class MapTestCase(unittest.TestCase):
         self.map._Map__map.nextobjectid = 1
         obj_layer_mock = unittest.mock.Mock()
         self.map._Map__map.get_layer_by_name = unittest.mock.Mock(return_value=obj_layer_mock)
-        obj = Road(33,33, "2023-05-20" , self.map)
+        obj = Road(33,33, "2023-05-20" , self.map).instance
         player = Player("Abood", 10000)
         obj.properties = {'Price': '100'}
         obj.type =  'Road'
@@ -104,3 +108,175 @@ class MapTestCase(unittest.TestCase):
 
             # Verify that the returned object is the same as the input object
             self.assertIs(result, obj)
+
+    def test_terrain_surface_is_prerendered(self):
+        terrain = self.map._Map__terrain_surface
+        tmx = self.map.return_map()
+        self.assertEqual(terrain.get_size(), (tmx.width * tmx.tilewidth, tmx.height * tmx.tileheight))
+
+        # display must reuse the cached terrain instead of rebuilding it
+        self.map.display()
+        self.assertIs(self.map._Map__terrain_surface, terrain)
+
+        self.map.reinitialize(self.screen, 200, 100)
+        self.assertIsNot(self.map._Map__terrain_surface, terrain)
+
+    def test_get_objects_in_area(self):
+        player = Player("Abood", 10000)
+        near = self.map.add_object(Road(2, 2, "2023-05-20", self.map).instance, player)
+        far = self.map.add_object(Road(30, 30, "2023-05-20", self.map).instance, player)
+
+        visible = self.map.get_objects_in_area(pygame.Rect(0, 0, 320, 320))
+        self.assertEqual(visible, [near])
+        self.assertEqual(self.map.get_objects_in_area(pygame.Rect(0, 0, 1280, 1280)), [near, far])
+
+        self.map.reclassify_zone(near)
+        self.assertEqual(self.map.get_objects_in_area(pygame.Rect(0, 0, 320, 320)), [])
+
+    def test_collide_with_water_matches_water_tiles(self):
+        tmx = self.map.return_map()
+        water = set()
+        for layer in tmx.visible_layers:
+            if layer.name == "Water" or layer.name == "WaterEdges":
+                water.update((x, y) for x, y, gid in layer if gid != 0)
+        self.assertTrue(water)
+
+        w, h = tmx.tilewidth, tmx.tileheight
+        for x in range(tmx.width - 1):
+            for y in range(tmx.height - 1):
+                footprint = {(x, y), (x + 1, y), (x, y + 1), (x + 1, y + 1)}
+                self.assertEqual(self.map.collide_with_water(x * w, y * h, 2 * w, 2 * h),
+                                 not footprint.isdisjoint(water))
+
+    def test_registries_follow_added_and_removed_objects(self):
+        player = Player("Abood", 100000)
+        road = self.map.add_object(Road(2, 2, "2023-05-20", self.map).instance, player)
+        stadium = self.map.add_object(Stadium(10, 10, "2023-05-20", self.map).instance, player)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+
+        self.assertEqual(self.map.get_all_objects(), [road, stadium, home])
+        self.assertEqual(self.map.get_roads(), [road])
+        self.assertEqual(self.map.get_residential_zones(), [home])
+        self.assertEqual(self.map.get_satisfaction_increasers(), [stadium])
+        self.assertEqual(self.map.get_work_zones(), [])
+
+        self.map.reclassify_zone(road)
+        self.assertEqual(self.map.get_all_objects(), [stadium, home])
+        self.assertEqual(self.map.get_all_roads(), [])
+
+    def test_lookup_by_id_and_existence(self):
+        player = Player("Abood", 100000)
+        road = self.map.add_object(Road(2, 2, "2023-05-20", self.map).instance, player)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+
+        self.assertIs(self.map.get_zone_by_id(home.id), home)
+        self.assertTrue(self.map.does_obj_exist(road))
+
+        self.map.reclassify_zone(home)
+        self.assertIsNone(self.map.get_zone_by_id(home.id))
+        self.assertFalse(self.map.does_obj_exist(home))
+        self.assertIs(self.map.get_zone_by_id(road.id), road)
+
+    def test_neighboring_objects_of_roads(self):
+        player = Player("Abood", 100000)
+        factory = self.map.add_object(IndustrialZone(3, 20, "2023-05-20", self.map).instance, player)
+        # two roads along the top side of the zone and one far away
+        roads = [self.map.add_object(Road(x, 19, "2023-05-20", self.map).instance, player) for x in (3, 4)]
+        far = self.map.add_object(Road(30, 30, "2023-05-20", self.map).instance, player)
+
+        self.assertEqual(self.map.get_objects_bordering_tile((4, 19)), [factory])
+        self.assertEqual(get_neighboring_objects(roads + [far], self.map), [factory])
+        self.assertEqual(get_all_neighboring_objects([far], self.map), [])
+
+        self.map.reclassify_zone(factory)
+        self.assertEqual(get_neighboring_objects(roads, self.map), [])
+
+    def test_influence_of_satisfaction_increasers(self):
+        player = Player("Abood", 100000)
+        near = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+        stadium = self.map.add_object(Stadium(8, 20, "2023-05-20", self.map).instance, player)
+        far = self.map.add_object(ResidentialZone(30, 30, "2023-05-20", self.map).instance, player)
+
+        self.assertEqual(self.map.get_zones_influenced_by(stadium), [near])
+        self.assertEqual(self.map.get_sources_influencing(near), [stadium])
+        self.assertEqual(self.map.get_sources_influencing(far), [])
+
+        self.map.reclassify_zone(stadium)
+        self.assertEqual(self.map.get_sources_influencing(near), [])
+
+    def test_view_blocked_follows_objects_in_between(self):
+        player = Player("Abood", 100000)
+        forest = self.map.add_object(Forest(3, 20, "2023-05-20", self.map).instance, player)
+        home = self.map.add_object(ResidentialZone(9, 20, "2023-05-20", self.map).instance, player)
+        self.assertFalse(self.map.is_view_blocked(forest, home))
+
+        road = self.map.add_object(Road(6, 20, "2023-05-20", self.map).instance, player)
+        self.assertFalse(self.map.is_view_blocked(forest, home))
+        self.map.reclassify_zone(road)
+
+        blocker = self.map.add_object(Forest(6, 20, "2023-05-20", self.map).instance, player)
+        self.assertTrue(self.map.is_view_blocked(forest, home))
+        self.map.reclassify_zone(blocker)
+        self.assertFalse(self.map.is_view_blocked(forest, home))
+
+    def test_add_object_rejects_overlapping_objects(self):
+        player = Player("Abood", 100000)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+        money = player.money
+
+        overlapping = self.map.add_object(IndustrialZone(4, 21, "2023-05-20", self.map).instance, player)
+        self.assertFalse(self.map.does_obj_exist(overlapping))
+        self.assertEqual(player.money, money)
+        self.assertTrue(self.map.is_area_occupied(overlapping))
+        self.assertIs(self.map.get_object_at_tile((4, 21)), home)
+
+    def test_get_object_at_tile_returns_occupying_zone(self):
+        player = Player("Abood", 100000)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+        road = self.map.add_object(Road(2, 20, "2023-05-20", self.map).instance, player)
+
+        for tile in get_area(home):
+            self.assertIs(self.map.get_object_at_tile(tile), home)
+        self.assertIs(self.map.get_object_at_tile((2, 20)), road)
+        self.assertIsNone(self.map.get_object_at_tile((30, 30)))
+
+    def test_occupancy_cleared_after_removal(self):
+        player = Player("Abood", 100000)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+        road = self.map.add_object(Road(2, 20, "2023-05-20", self.map).instance, player)
+
+        self.map.reclassify_zone(home)
+        for tile in get_area(home):
+            self.assertIsNone(self.map.get_object_at_tile(tile))
+        self.map.remove_road(2, 20, "Road", self.map)
+        self.assertIsNone(self.map.get_object_at_tile((2, 20)))
+
+        factory = self.map.add_object(IndustrialZone(3, 20, "2023-05-20", self.map).instance, player)
+        self.assertTrue(self.map.does_obj_exist(factory))
+        self.assertIs(self.map.get_object_at_tile((3, 20)), factory)
+
+    def test_occupancy_rebuilt_by_reinitialize(self):
+        player = Player("Abood", 100000)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+
+        self.map.reinitialize(self.screen, 200, 100)
+        self.assertIsNone(self.map.get_object_at_tile((3, 20)))
+        self.assertFalse(self.map.is_area_occupied(home))
+
+        # a loaded game adds its objects back onto the new map
+        loaded = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player, loaded_game=True)
+        for tile in get_area(loaded):
+            self.assertIs(self.map.get_object_at_tile(tile), loaded)
+
+    def test_each_map_has_its_own_distance_cache(self):
+        player = Player("Abood", 100000)
+        other = Map(self.screen, 200, 100)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-05-20", self.map).instance, player)
+        stadium = self.map.add_object(Stadium(8, 20, "2023-05-20", self.map).instance, player)
+        # the objects of the other map get the same ids
+        far = other.add_object(ResidentialZone(3, 20, "2023-05-20", other).instance, player)
+        far_stadium = other.add_object(Stadium(30, 30, "2023-05-20", other).instance, player)
+
+        self.assertIsNot(self.map.get_distance_cache(), other.get_distance_cache())
+        self.assertEqual(get_distance(home, stadium, self.map), distance_between_two(home, stadium))
+        self.assertEqual(get_distance(far, far_stadium, other), distance_between_two(far, far_stadium))
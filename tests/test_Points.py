@@ -1,5 +1,7 @@
 import unittest
-from models.Utils import calc_d
+from types import SimpleNamespace
+from models.Utils import calc_d, distance_between_two, distance_between_circumferences, distances_to_many, get_distance
+from models.DistanceCache import DistanceCache
 
 class TestPoints(unittest.TestCase):
 
@@ -19,6 +21,43 @@ class TestPoints(unittest.TestCase):
         self.assertEqual(35.36000000000001, calc_d(p1, p2))
         p1, p2 = (43.43, 22.22), (11.11, 12.12)
         self.assertEqual(41.42, calc_d(p1, p2))
+    def test_distance_between_two(self):
+        parent = SimpleNamespace(tilewidth=32, tileheight=32)
+        ids = iter(range(1, 1000))
+        cache = DistanceCache()
+        map = SimpleNamespace(get_distance_cache=lambda: cache)
+
+        def obj(x, y, size):
+            return SimpleNamespace(id=next(ids), x=x * 32.0, y=y * 32.0, width=size * 32, height=size * 32, parent=parent)
+
+        zone = obj(10, 10, 4)
+        others = [obj(x, y, size) for x in range(0, 20, 3) for y in range(0, 20, 3) for size in (1, 4)]
+        for other in others:
+            self.assertEqual(distance_between_circumferences(zone, other), distance_between_two(zone, other))
+            self.assertEqual(distance_between_two(other, zone), distance_between_two(zone, other))
+        self.assertEqual(distances_to_many(zone, others, map), [distance_between_two(zone, other) for other in others])
+
+        self.assertEqual(0, distance_between_two(zone, obj(14, 11, 1)))  # next to each other
+        self.assertEqual(4, distance_between_two(zone, obj(10, 18, 4)))  # same columns: 5 - 1
+        self.assertEqual(3, distance_between_two(zone, obj(16, 16, 4)))  # diagonal: (3 + 3 - 1) // 2 + 1
+
+    def test_distance_cache(self):
+        parent = SimpleNamespace(tilewidth=32, tileheight=32)
+        home = SimpleNamespace(id=1, x=0.0, y=0.0, width=128, height=128, parent=parent)
+        works = [SimpleNamespace(id=i, x=32.0 * 4 * i, y=0.0, width=128, height=128, parent=parent) for i in (2, 3)]
+        cache = DistanceCache()
+        map = SimpleNamespace(get_distance_cache=lambda: cache)
+
+        self.assertEqual(distances_to_many(home, works, map), [distance_between_two(home, w) for w in works])
+        self.assertEqual(cache.get_stats()["misses"], 2)
+        self.assertEqual(get_distance(works[1], home, map), distance_between_two(home, works[1]))
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+        cache.evict(works[0])
+        self.assertIsNone(cache.get(home, works[0]))
+        self.assertEqual(cache.get_stats()["size"], 1)
+        cache.clear()
+        self.assertEqual(cache.get_stats()["size"], 0)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,73 @@
+import os
+import unittest
+import pygame
+from models.Map import Map
+from models.Player import Player
+from models.Road import Road
+from models.RoadNetwork import RoadNetwork
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+class RoadNetworkTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.map = Map(self.screen, 200, 100)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def create_road(self, x, y):
+        return Road(x, y, "2023-05-20", self.map).instance
+
+    def test_connected_roads(self):
+        # an L shaped road and a separate road
+        l_shape = [self.create_road(x, 5) for x in range(2, 7)] + [self.create_road(6, y) for y in range(6, 9)]
+        lonely = self.create_road(10, 10)
+        network = RoadNetwork(l_shape + [lonely])
+
+        self.assertIs(network.get_road_at((6, 8)), l_shape[-1])
+        self.assertIsNone(network.get_road_at((7, 8)))
+        self.assertEqual(network.get_connected_roads(l_shape[0]), set(l_shape))
+        self.assertEqual(network.get_connected_roads(lonely), {lonely})
+
+        network.remove_road(l_shape[4])  # the corner
+        self.assertEqual(network.get_connected_roads(l_shape[0]), set(l_shape[:4]))
+        self.assertEqual(len(network.get_neighbouring_roads(l_shape[5])), 1)
+
+    def test_components_merge_and_split(self):
+        left = [self.create_road(x, 5) for x in range(2, 5)]
+        right = [self.create_road(x, 5) for x in range(6, 9)]
+        network = RoadNetwork(left + right)
+        self.assertNotEqual(network.get_component_id(left[0]), network.get_component_id(right[0]))
+
+        bridge = self.create_road(5, 5)
+        network.add_road(bridge)
+        self.assertEqual(len(network.components), 1)
+        self.assertEqual(network.get_component_ids_at([(2, 5), (8, 5)]), {network.get_component_id(bridge)})
+
+        network.remove_road(bridge)
+        self.assertEqual(len(network.components), 2)
+        self.assertEqual(network.get_connected_roads(left[0]), set(left))
+        self.assertEqual(network.get_connected_roads(right[-1]), set(right))
+        self.assertEqual(len(network.get_component_ids_at([(2, 5), (8, 5)])), 2)
+
+    def test_network_larger_than_recursion_limit(self):
+        roads = [self.create_road(x, y) for y in range(40) for x in range(40)]
+        network = RoadNetwork(roads)
+        self.assertEqual(len(network.get_connected_roads(roads[0])), 1600)
+
+    def test_map_keeps_network_of_placed_roads(self):
+        player = Player("Abood", 10000)
+        first = self.map.add_object(self.create_road(2, 2), player)
+        second = self.map.add_object(self.create_road(3, 2), player)
+        network = self.map.get_road_network()
+        self.assertEqual(network.get_connected_roads(first), {first, second})
+
+        self.map.reclassify_zone(second)
+        self.assertEqual(network.get_connected_roads(first), {first})
+        self.assertIsNone(network.get_road_at((3, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
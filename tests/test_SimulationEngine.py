@@ -0,0 +1,143 @@
+import datetime
+import random
+import unittest
+from models.SimulationEngine import SimulationEngine
+from models.Citizen import Citizen
+from models.Road import Road
+from models.zones.ResidentialZone import ResidentialZone
+from models.zones.IndustrialZone import IndustrialZone
+from models.Disaster import Disaster
+from models.Utils import get_total_citizens, demolish_zone, restore_citizen
+
+
+class SimulationEngineTest(unittest.TestCase):
+    def setUp(self):
+        Citizen.reinitialize()
+        self.engine = SimulationEngine()
+        self.engine.timer.current_time = datetime.datetime(2023, 1, 15, 12, 0, 0)
+        self.engine.start()
+        self.map = self.engine.map
+        self.player = self.engine.player
+
+    def tearDown(self):
+        Citizen.reinitialize()
+
+    def test_runs_without_display(self):
+        self.assertIsNone(self.map._Map__terrain_surface)
+        self.engine.step_day()
+        self.assertEqual(self.engine.timer.get_current_date_str(), "2023-01-16")
+        self.engine.step_month()
+        self.assertEqual(self.engine.timer.get_current_date_str(), "2023-02-01")
+        self.engine.run_until("2023-03-10")
+        self.assertEqual(self.engine.timer.get_current_date_str(), "2023-03-10")
+
+    def test_initial_citizens_move_into_first_zone(self):
+        self.engine.start([Citizen() for i in range(4)])
+        self.engine.update()
+        self.assertEqual(len(self.engine.initial_citizens), 4)  # no ResidentialZone yet
+
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-01-15", self.map).instance, self.player)
+        while self.engine.initial_citizens:
+            self.engine.update()  # no day elapsed, eg: the game is paused
+        self.assertEqual(len(home.properties['Citizens']), 4)
+        self.assertEqual(self.engine.timer.get_current_date_str(), "2023-01-15")
+
+    def test_workers_make_revenue_and_zones_cost_maintenance(self):
+        for x in range(3, 12):
+            self.map.add_object(Road(x, 24, "2023-01-15", self.map).instance, self.player)
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-01-15", self.map).instance, self.player)
+        factory = self.map.add_object(IndustrialZone(8, 20, "2023-01-15", self.map).instance, self.player)
+        self.engine.start([Citizen() for i in range(4)])
+
+        self.engine.run_until("2023-02-02")
+        self.assertEqual(get_total_citizens(), len(home.properties['Citizens']))
+        workers = len(factory.properties['Citizens'])
+        self.assertGreater(workers, 0)
+
+        money = self.player.money
+        self.engine.run_until("2023-04-15")  # 90 days after creation
+        self.assertGreater(factory.properties['Revenue'], 0)
+        self.assertEqual(self.player.money, money - home.properties['MaintenanceFee'] - factory.properties['MaintenanceFee'])
+
+
+    def test_engines_do_not_share_their_maps_state(self):
+        home = self.map.add_object(ResidentialZone(3, 20, "2023-01-15", self.map).instance, self.player)
+        SimulationEngine()
+        self.engine.start([Citizen() for i in range(4)])
+        self.engine.run_until("2023-03-02")
+        # the zone still has free seats for the monthly arrivals of the first engine
+        self.assertTrue(self.map.get_capacity_index().has_free_seats(home))
+        self.assertEqual(self.map.get_yet_to_occupy_homes(), [home])
+
+    def build_city(self, map, player):
+        for x in range(3, 16):
+            map.add_object(Road(x, 24, "2023-01-15", map).instance, player)
+        homes = [map.add_object(ResidentialZone(x, 20, "2023-01-15", map).instance, player) for x in (3, 7)]
+        factories = [map.add_object(IndustrialZone(x, 20, "2023-01-15", map).instance, player) for x in (11, 15)]
+        return homes, factories
+
+    def assert_zone_counters_match_the_citizens(self, map):
+        zones = map.get_residential_zones() + map.get_work_zones()
+        for zone in zones:
+            citizens = zone.properties['Citizens']
+            self.assertEqual(Citizen.zone_stats.get(zone, [0])[0], len(citizens))
+            self.assertAlmostEqual(Citizen.get_zone_satisfaction(zone), sum(c.satisfaction for c in citizens))
+            if zone.type == "ResidentialZone":
+                self.assertEqual(Citizen.get_zone_unemployed(zone), len([c for c in citizens if c.work is None]))
+        self.assertEqual(len(Citizen.zone_stats), len([zone for zone in zones if zone.properties['Citizens']]))
+
+    def test_zone_counters_follow_disaster_demolish_and_load(self):
+        homes, factories = self.build_city(self.map, self.player)
+        self.engine.start([Citizen() for i in range(10)])
+        self.engine.run_until("2023-03-02")
+        self.assertGreater(len(factories[0].properties['Citizens']), 0)
+        self.assert_zone_counters_match_the_citizens(self.map)
+
+        disaster = Disaster(3, 20, "2023-03-02", self.map).instance
+        disaster.properties['linked_objs'] = [homes[0]]
+        self.map.add_disaster_to_map(disaster)
+        self.engine.run_until("2023-04-02")  # the disaster strikes a month after its creation
+        self.assertEqual(self.map.get_all_disasters(), [])
+        self.assert_zone_counters_match_the_citizens(self.map)
+
+        demolish_zone(factories[0], self.map, self.player, self.engine.rng)
+        self.assert_zone_counters_match_the_citizens(self.map)
+
+        # saved like save_game does, then restored on a new map with the same zones
+        saved = [[c.id, c.home.id if c.home else -1, c.work.id if c.work else -1, c.satisfaction]
+                 for c in Citizen.get_all_citizens().values()]
+        self.assertGreater(len(saved), 0)
+        Citizen.reinitialize()
+        loaded = SimulationEngine()
+        self.build_city(loaded.map, loaded.player)
+        for loaded_citizen in saved:
+            restore_citizen(loaded_citizen, loaded.map)
+        self.assertEqual(get_total_citizens(), len(saved))
+        self.assert_zone_counters_match_the_citizens(loaded.map)
+
+    def test_same_seed_same_run(self):
+        runs = []
+        for i in range(2):
+            Citizen.reinitialize()
+            # the engine draws from its own generator, the random module is neither seeded nor used by the run
+            random.seed(i)
+            state = random.getstate()
+            engine = SimulationEngine(seed=5)
+            self.assertEqual(random.getstate(), state)
+            engine.timer.current_time = datetime.datetime(2023, 1, 15, 12, 0, 0)
+            map = engine.map
+            for x in range(3, 16):
+                map.add_object(Road(x, 24, "2023-01-15", map).instance, engine.player)
+            for x in (3, 7):
+                map.add_object(ResidentialZone(x, 20, "2023-01-15", map).instance, engine.player)
+            for x in (11, 15):
+                map.add_object(IndustrialZone(x, 20, "2023-01-15", map).instance, engine.player)
+            engine.new_game()
+            engine.run_until("2023-06-01")
+            runs.append(sorted((c.id, c.home.id, c.work.id if c.work else None, c.satisfaction)
+                               for c in Citizen.get_all_citizens().values()))
+        self.assertGreater(len(runs[0]), 10)
+        self.assertEqual(runs[0], runs[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import pygame
+from models.TextCache import TextCache
+
+class TextCacheTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        TextCache.clear()
+
+    def test_font_is_created_once(self):
+        font = TextCache.get_font(24)
+        self.assertIs(font, TextCache.get_font(24))
+        self.assertIsNot(font, TextCache.get_font(21))
+        self.assertEqual(TextCache.get_stats()["fonts"], 2)
+
+    def test_text_is_rendered_once(self):
+        font = TextCache.get_font(21)
+        slow = TextCache.render(font, "Slow", True, (0, 0, 0))
+        self.assertIs(slow, TextCache.render(font, "Slow", True, (0, 0, 0)))
+        self.assertIsNot(slow, TextCache.render(font, "Slow", True, (255, 255, 255)))
+        self.assertEqual(TextCache.hits, 1)
+        self.assertEqual(TextCache.misses, 2)
+
+    def test_least_recently_used_text_is_evicted(self):
+        font = TextCache.get_font(21)
+        TextCache.max_texts = 2
+        try:
+            first = TextCache.render(font, "2023-01-01", True, (0, 0, 0))
+            TextCache.render(font, "2023-01-02", True, (0, 0, 0))
+            TextCache.render(font, "2023-01-01", True, (0, 0, 0))
+            TextCache.render(font, "2023-01-03", True, (0, 0, 0))
+            self.assertEqual(len(TextCache.texts), 2)
+            self.assertIs(first, TextCache.render(font, "2023-01-01", True, (0, 0, 0)))
+            self.assertNotIn(("2023-01-02", font, (0, 0, 0), True), TextCache.texts)
+        finally:
+            TextCache.max_texts = 256
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,7 +20,7 @@ class TestTime(unittest.TestCase):
         map = Map(SCREEN, builder_panel.get_width(), description_panel.get_height())
         game_speed = 1
         timer = Timer(game_speed, 700)
-        timer.update_time(False)
+        timer.step()
         timer.tick(60)
         x, y = 1, 1
         TiledObj = (ResidentialZone(x, y, timer.get_current_date_str(), map)).instance
@@ -30,7 +30,7 @@ class TestTime(unittest.TestCase):
     def test_has_month_passed_from_creation(self):
         game_speed = 1
         timer = Timer(game_speed, 700)
-        timer.update_time(False)
+        timer.step()
         timer.tick(60)
         x, y = 1, 1
 
@@ -47,7 +47,7 @@ class TestTime(unittest.TestCase):
     def test_has_quarter_passed_from_creation(self):
         game_speed = 1
         timer = Timer(game_speed, 700)
-        timer.update_time(False)
+        timer.step()
         timer.tick(60)
         x, y = 1, 1
 
@@ -63,7 +63,7 @@ class TestTime(unittest.TestCase):
     def test_has_random_years_passed_from_start(self):
         game_speed = 1
         timer = Timer(game_speed, 700)
-        timer.update_time(False)
+        timer.step()
         timer.tick(60)
         game_start_time = timer.get_current_date_str()
 
@@ -16,13 +16,6 @@ class TimerTest(unittest.TestCase):
         current_date_str = self.timer.get_current_date_str()
         self.assertRegex(current_date_str, r"\d{4}-\d{2}-\d{2}", "Returned value does not have the correct format")
 
-    def test_update_time(self):
-        paused = False
-        initial_time = self.timer.get_current_time()
-        self.timer.update_time(paused)
-        new_time = self.timer.get_current_time()
-        self.assertGreater(new_time, initial_time, "Current time was not updated correctly")
-
     def test_subtract_with_time_str(self):
         date_str = "2022-05-01"
         diff_in_days = self.timer.subtract_with_time_str(date_str)
@@ -35,5 +28,31 @@ class TimerTest(unittest.TestCase):
         expected_date = datetime.datetime.strptime(str_date, "%Y-%m-%d")
         self.assertEqual(timer_date, expected_date, "Returned value is not the expected datetime object")
 
+    def test_accumulate_returns_whole_days_and_keeps_the_rest(self):
+        day_ms = 86400 / (60 * self.timer.get_time_factor()) * 1000
+        self.assertEqual(self.timer.accumulate(day_ms * 2.5, False), 2)
+        self.assertEqual(self.timer.accumulate(day_ms * 0.5, False), 1)
+        self.assertEqual(self.timer.accumulate(day_ms * 0.5, True), 0)
+        self.assertAlmostEqual(self.timer.accumulator, 0.0, places=3)
+
+    def test_accumulate_caps_the_steps(self):
+        day_ms = 86400 / (60 * self.timer.get_time_factor()) * 1000
+        self.assertEqual(self.timer.accumulate(day_ms * 1000, False), self.timer.max_steps_per_update)
+        self.assertEqual(self.timer.accumulator, 0.0)
+        self.timer.fast_forward = True
+        self.assertEqual(self.timer.accumulate(0, False), self.timer.max_steps_per_update)
+
+    def test_step(self):
+        initial_time = self.timer.get_current_time()
+        self.timer.step()
+        self.assertEqual(self.timer.get_current_time() - initial_time, datetime.timedelta(days=1))
+
+    def test_day_ordinals(self):
+        self.timer.current_time = datetime.datetime(2023, 3, 1, 12, 30)
+        self.assertEqual(self.timer.get_current_day(), datetime.date(2023, 3, 1).toordinal())
+        self.assertEqual(self.timer.get_day_from_str("2022-03-01"), datetime.date(2022, 3, 1).toordinal())
+        self.assertEqual(self.timer.subtract_with_time_str("2022-03-01"), 365)
+        self.assertEqual(self.timer.subtract_with_time_str("2023-03-02"), -1)
+
 if __name__ == '__main__':
     unittest.main()